@@ -1,12 +1,100 @@
 #!/usr/bin/env python3
 """Example script demonstrating how to update credentials remotely via HTTP."""
 
+import functools
+import gzip
 import json
+import logging
+import logging.handlers
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional: orjson parses the key file faster than the stdlib json module.
+    import orjson
+except ImportError:  # pragma: no cover - falls back to json
+    orjson = None
+
+logger = logging.getLogger("update_credentials")
+
+# One pooled session for every call: repeated POSTs to the same server reuse the
+# kept-alive connection instead of paying a TCP + TLS handshake each time.
+# The pool is sized to the worker count used by update_credentials_many so
+# concurrent threads each get a connection instead of queueing on one.
+_MAX_WORKERS = 16
+# Transient gateway errors are retried with backoff inside the kept-alive
+# session. Replacing the credential set is idempotent, so retrying the POST is
+# safe; after the last attempt the final response is returned, not raised.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["POST"]),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=10, pool_maxsize=_MAX_WORKERS, max_retries=_RETRY)
+)
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=10, pool_maxsize=_MAX_WORKERS, max_retries=_RETRY)
+)
+
+
+# Fields google-auth needs to build service account credentials. Checking them
+# locally rejects a malformed key without a network round trip.
+_REQUIRED_FIELDS = ("type", "project_id", "private_key", "client_email", "token_uri")
+
+
+def _credentials_error(credentials: object) -> str | None:
+    """Return why ``credentials`` is not a service account key, or None if it looks valid."""
+    if not isinstance(credentials, dict):
+        return "credentials must be a JSON object"
+    missing = [field for field in _REQUIRED_FIELDS if not credentials.get(field)]
+    if missing:
+        return f"missing required field(s): {', '.join(missing)}"
+    if credentials["type"] != "service_account":
+        return f"expected type 'service_account', got {credentials['type']!r}"
+    return None
+
+
+# Files at least this large (e.g. bundled multi-account key files) are parsed
+# straight from a memory map when orjson is available, skipping the copy into a
+# Python bytes object.
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _load_credentials(path: str) -> dict:
+    """Load a service account JSON file, reusing the parse while the file is unchanged.
+
+    The cache is keyed on the file's mtime, so a rotated key is picked up on the
+    next call. The returned dict is shared between calls; treat it as read-only.
+    """
+    return _parse_credentials_file(path, Path(path).stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_credentials_file(path: str, mtime_ns: int) -> dict:  # noqa: ARG001 - cache key
+    """Parse a key file with a single binary read (or a memory map for large files)."""
+    with Path(path).open("rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _encode_body(payload: dict) -> bytes:
+    """Serialize a request body straight to bytes (no intermediate str with orjson)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
 
 
 def _auth_headers(token: str | None = None) -> dict[str, str]:
@@ -24,7 +112,10 @@ def _auth_headers(token: str | None = None) -> dict[str, str]:
 
 
 def update_credentials_from_file(
-    server_url: str, credentials_path: str, token: str | None = None
+    server_url: str,
+    credentials_path: str,
+    token: str | None = None,
+    session: requests.Session | None = None,
 ) -> None:
     """Update server credentials from a local service account JSON file.
 
@@ -36,15 +127,44 @@ def update_credentials_from_file(
         server_url: Base URL of the MCP server (e.g., http://localhost:8000)
         credentials_path: Path to the service account JSON file
         token: Optional admin token (falls back to PLAY_STORE_MCP_ADMIN_TOKEN)
+        session: Optional requests session (defaults to the shared pooled session)
     """
-    with Path(credentials_path).open() as f:
-        credentials = json.load(f)
+    credentials = _load_credentials(credentials_path)
+    update_credentials_from_json(server_url, credentials, token=token, session=session)
+
 
-    update_credentials_from_json(server_url, credentials, token=token)
+def update_credentials_from_file_stream(
+    server_url: str,
+    credentials_path: str,
+    token: str | None = None,
+    session: requests.Session | None = None,
+) -> bool:
+    """Send a key file's raw bytes as the credentials, without parsing it locally.
+
+    The file bytes are spliced into the ``{"credentials": ...}`` envelope as-is,
+    skipping the parse + re-serialize round trip. The server still validates the
+    JSON and the credentials, but nothing is checked locally first.
+
+    Args:
+        server_url: Base URL of the MCP server (e.g., http://localhost:8000)
+        credentials_path: Path to the service account JSON file
+        token: Optional admin token (falls back to PLAY_STORE_MCP_ADMIN_TOKEN)
+        session: Optional requests session (defaults to the shared pooled session)
+
+    Returns:
+        True if the server accepted the credentials.
+    """
+    raw = Path(credentials_path).read_bytes()
+    body = b"".join((b'{"credentials":', raw, b"}"))
+    return _send(server_url, body, _auth_headers(token), session)
 
 
 def update_credentials_from_json(
-    server_url: str, credentials_json: dict, token: str | None = None
+    server_url: str,
+    credentials_json: dict,
+    token: str | None = None,
+    session: requests.Session | None = None,
+    compress: bool = False,
 ) -> None:
     """Update server credentials using a credentials JSON object.
 
@@ -52,23 +172,134 @@ def update_credentials_from_json(
         server_url: Base URL of the MCP server (e.g., http://localhost:8000)
         credentials_json: Service account credentials as a dictionary
         token: Optional admin token (falls back to PLAY_STORE_MCP_ADMIN_TOKEN)
+        session: Optional requests session (defaults to the shared pooled session)
+        compress: Send the body gzip-compressed (Content-Encoding: gzip)
     """
-    response = requests.post(
-        f"{server_url}/credentials",
-        json={"credentials": credentials_json},
-        headers=_auth_headers(token),
-        timeout=10,
-    )
-    
-    if response.status_code == 200:
-        print("✓ Credentials updated successfully")
-        print(f"  Response: {response.json()}")
-    else:
-        print(f"✗ Failed to update credentials: {response.status_code}")
-        print(f"  Error: {response.json()}")
+    if not _post_credentials(
+        server_url, credentials_json, token=token, session=session, compress=compress
+    ):
         sys.exit(1)
 
 
+def update_credentials_batch(
+    updates: list[tuple[str, dict]],
+    token: str | None = None,
+    session: requests.Session | None = None,
+    compress: bool = False,
+) -> list[bool]:
+    """Push several (server_url, credentials) updates over one pooled session.
+
+    The server holds a single credential set per process, so there is no
+    multi-item endpoint; instead every POST shares the same session, and
+    updates to the same host reuse its kept-alive connection.
+
+    Args:
+        updates: (server_url, credentials_json) pairs to apply in order
+        token: Optional admin token (falls back to PLAY_STORE_MCP_ADMIN_TOKEN)
+        session: Optional requests session (defaults to the shared pooled session)
+        compress: Send each body gzip-compressed (Content-Encoding: gzip)
+
+    Returns:
+        Success flag for each update, in input order; an unreachable server
+        is reported as False rather than raising.
+    """
+    session = session or _SESSION
+    return [
+        _post_credentials(server_url, credentials, token=token, session=session, compress=compress)
+        for server_url, credentials in updates
+    ]
+
+
+def update_credentials_many(
+    server_urls: list[str],
+    credentials_json: dict,
+    token: str | None = None,
+    session: requests.Session | None = None,
+    compress: bool = False,
+) -> list[bool]:
+    """Rotate the same credentials onto several servers concurrently.
+
+    Each server is updated from a thread pool sharing one pooled session, so
+    total wall time tracks the slowest server rather than the sum of all.
+
+    Args:
+        server_urls: Base URLs of the MCP servers to update
+        credentials_json: Service account credentials as a dictionary
+        token: Optional admin token (falls back to PLAY_STORE_MCP_ADMIN_TOKEN)
+        session: Optional requests session (defaults to the shared pooled session)
+        compress: Send each body gzip-compressed (Content-Encoding: gzip)
+
+    Returns:
+        Success flag for each server, in input order.
+    """
+    session = session or _SESSION
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(server_urls) or 1)) as ex:
+        return list(
+            ex.map(
+                lambda url: _post_credentials(
+                    url, credentials_json, token=token, session=session, compress=compress
+                ),
+                server_urls,
+            )
+        )
+
+
+def _post_credentials(
+    server_url: str,
+    credentials_json: dict,
+    token: str | None = None,
+    session: requests.Session | None = None,
+    compress: bool = False,
+) -> bool:
+    """POST credentials to one server and report the outcome; True on success."""
+    if error := _credentials_error(credentials_json):
+        logger.error("✗ Invalid credentials, not sent: %s", error)
+        return False
+
+    body = _encode_body({"credentials": credentials_json})
+    headers = _auth_headers(token)
+    if compress:
+        # Level 1 gets most of the ratio on key JSON for a fraction of the CPU.
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+
+    return _send(server_url, body, headers, session)
+
+
+def _send(
+    server_url: str,
+    body: bytes,
+    headers: dict[str, str],
+    session: requests.Session | None = None,
+) -> bool:
+    """POST an encoded /credentials body and log the outcome; True on success."""
+    # stream=True defers the body download, so an error page (e.g. HTML from a
+    # proxy) is never read when only the status line is needed.
+    try:
+        response = (session or _SESSION).post(
+            f"{server_url}/credentials",
+            data=body,
+            headers=headers,
+            timeout=10,
+            stream=True,
+        )
+    except requests.RequestException as e:
+        # One unreachable server must not abort a batch or fan-out update.
+        logger.warning("✗ Failed to reach %s: %s", server_url, e)
+        return False
+    try:
+        if response.status_code == 200:
+            logger.info("✓ Credentials updated successfully")
+            logger.info("  Response: %s", response.json())
+            return True
+        logger.error("✗ Failed to update credentials: %s", response.status_code)
+        if response.headers.get("content-type", "").startswith("application/json"):
+            logger.error("  Error: %s", response.json())
+        return False
+    finally:
+        response.close()
+
+
 def main():
     """Main function."""
     if len(sys.argv) < 3:
@@ -82,17 +313,28 @@ def main():
     server_url = sys.argv[1]
     credentials_file = sys.argv[2]
     
-    print(f"Updating credentials on server: {server_url}")
-    print(f"Using credentials file: {credentials_file}")
-    print()
+    # Buffer progress lines and write them out in a few batches rather than one
+    # stdout write per line; errors flush the buffer immediately.
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[
+            logging.handlers.MemoryHandler(
+                capacity=64,
+                flushLevel=logging.ERROR,
+                target=logging.StreamHandler(sys.stdout),
+            )
+        ],
+    )
+
+    logger.info("Updating credentials on server: %s", server_url)
+    logger.info("Using credentials file: %s", credentials_file)
+    logger.info("")
     
     # Option 1: Load the file locally and send its contents
     # update_credentials_from_file(server_url, credentials_file)
     
     # Option 2: Send credentials JSON directly (more secure for remote servers)
-    with Path(credentials_file).open() as f:
-        credentials = json.load(f)
-    
+    credentials = _load_credentials(credentials_file)
     update_credentials_from_json(server_url, credentials)
 
 
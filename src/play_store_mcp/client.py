@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import hashlib
+import importlib
+import inspect
+import itertools
 import json
 import os
 import random
@@ -13,14 +17,17 @@ import threading
 import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar, cast
 
 import structlog
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
 
+try:  # Optional: orjson decodes API responses faster than the stdlib.
+    import orjson
+except ImportError:  # pragma: no cover - falls back to json
+    orjson = None  # type: ignore[assignment]
+
+from play_store_mcp.jsonutil import json_loads
 from play_store_mcp.models import (
     AccessResult,
     Apk,
@@ -29,6 +36,7 @@ from play_store_mcp.models import (
     AppRecovery,
     AppRecoveryResult,
     BatchDeploymentResult,
+    BatchGetResult,
     Bundle,
     DataSafetyResult,
     DeobfuscationFile,
@@ -51,6 +59,7 @@ from play_store_mcp.models import (
     Order,
     OrderLineItem,
     OrderRefundResult,
+    ProductCatalog,
     ProductPurchase,
     ProductPurchaseActionResult,
     ProductPurchaseV2,
@@ -71,17 +80,194 @@ from play_store_mcp.models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from google_auth_httplib2 import AuthorizedHttp
     from googleapiclient._apis.androidpublisher.v3 import AndroidPublisherResource
 
 logger = structlog.get_logger(__name__)
 
+# The discovery, auth and media modules cost a few hundred milliseconds to
+# import, so they are loaded on first use rather than with this module; callers
+# that only run the validators never pay for them. They remain reachable as
+# module attributes (``client.build``, ``client.MediaFileUpload``, ...) through
+# ``__getattr__`` below, and code in this module fetches them with ``_lazy()``.
+_LAZY_IMPORTS: dict[str, tuple[str, str | None]] = {
+    "service_account": ("google.oauth2.service_account", None),
+    "AuthorizedHttp": ("google_auth_httplib2", "AuthorizedHttp"),
+    "build": ("googleapiclient.discovery", "build"),
+    "build_http": ("googleapiclient.http", "build_http"),
+    "MediaFileUpload": ("googleapiclient.http", "MediaFileUpload"),
+    "MediaIoBaseDownload": ("googleapiclient.http", "MediaIoBaseDownload"),
+    "MediaUpload": ("googleapiclient.http", "MediaUpload"),
+    "set_user_agent": ("googleapiclient.http", "set_user_agent"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a deferred Google client attribute and cache it as a module global."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return a deferred attribute, honouring any value already set on this module."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
 # API scopes required for Play Developer API
-SCOPES = ["https://www.googleapis.com/auth/androidpublisher"]
+SCOPES: tuple[str, ...] = ("https://www.googleapis.com/auth/androidpublisher",)
+
+
+@functools.cache
+def _response_model() -> Any:
+    """Return a googleapiclient JsonModel that decodes responses with ``json_loads``.
+
+    googleapiclient decodes every response body with the stdlib ``json``;
+    review and track lists run to megabytes, where orjson is several times
+    faster. Behaviour otherwise matches ``JsonModel.deserialize``.
+    """
+    json_model = importlib.import_module("googleapiclient.model").JsonModel
+
+    class _JsonModel(json_model):  # type: ignore[misc, valid-type]
+        def deserialize(self, content: bytes | str) -> Any:
+            try:
+                body = json_loads(content)
+            except json.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+
+    return _JsonModel()
+
+
+# Inline credentials JSON starts with "{" after optional whitespace. Matching
+# the prefix avoids copying the whole (multi-KB) string just to strip it.
+_JSON_OBJECT_START_RE = re.compile(r"\s*\{")
+
+# Linux PATH_MAX. Longer strings cannot name a file, and stat() on them fails
+# with ENAMETOOLONG instead of returning False.
+_MAX_PATH_LENGTH = 4096
+
+
+def _could_be_path(value: str) -> bool:
+    """Cheaply rule out strings that cannot be a filesystem path before stat()ing them."""
+    return len(value) < _MAX_PATH_LENGTH and "\n" not in value and "\0" not in value
+
+
+# Android application ID: dot-separated segments, each starting with a letter.
+_PACKAGE_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)+$")
+
+# Release tracks accepted by validate_track (ordered for the error message).
+_TRACK_NAMES = ("internal", "alpha", "beta", "production")
+_VALID_TRACKS = frozenset(_TRACK_NAMES)
+
+# Validation messages, built once rather than on every failed check.
+_PKG_EMPTY_MSG = "Package name cannot be empty"
+_PKG_NO_DOT_MSG = "Package name must contain at least one dot (e.g., com.example.app)"
+_PKG_INVALID_MSG = (
+    "Package name must start with lowercase letter and contain only lowercase "
+    "letters, numbers, underscores, and dots"
+)
+_TRACK_ERR_MSG = f"Track must be one of: {', '.join(_TRACK_NAMES)}"
+
+# (field, error message, max length) for each store listing text checked by
+# validate_listing_text, in parameter order.
+_LISTING_TEXT_LIMITS = tuple(
+    (field, f"{label} must be {limit} characters or less", limit)
+    for field, label, limit in (
+        ("title", "Title", 50),
+        ("short_description", "Short description", 80),
+        ("full_description", "Full description", 4000),
+    )
+)
 
 # Retry configuration
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
 MAX_BACKOFF = 32.0  # seconds
+MAX_RETRY_WINDOW = 60.0  # seconds; total time a call may spend retrying
+
+# Process-wide retry budget: a token bucket shared by every client, so a burst
+# of concurrent failing calls can't each spend a full MAX_RETRIES against an
+# already-degraded API. Each retry costs one token.
+RETRY_BUDGET_CAPACITY = 10.0
+RETRY_BUDGET_REFILL_PER_SEC = 1.0
+
+# Per-client request rate: each PlayStoreClient (one set of credentials, so
+# one API quota) paces its outgoing API requests through its own token bucket,
+# so a burst of tool calls is spread out instead of being rejected with 429s,
+# and one tenant's burst never delays another's. Every retry and every batch
+# sub-request counts as one request, since the API charges quota per
+# sub-request rather than per batch.
+REQUEST_RATE_PER_SEC = 20.0
+REQUEST_RATE_BURST = 20.0
+
+# Artifacts smaller than this are uploaded in a single request; larger ones use
+# a resumable upload session sent in _UPLOAD_CHUNK_SIZE chunks.
+_RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Artifact extension -> (upload content type, edits sub-resource).
+_UPLOAD_TARGETS: dict[str, tuple[str, str]] = {
+    ".aab": ("application/octet-stream", "bundles"),
+    ".apk": ("application/vnd.android.package-archive", "apks"),
+}
+
+# Response cache for read-only getters: how long a result may be served
+# without another API call. Store listings, products and testers change
+# rarely; orders change state (refunds, cancellations) and expire quickly.
+# A successful write through this client clears the written app's entries.
+_CACHE_TTL_CATALOG = 300.0
+_CACHE_TTL_ORDERS = 10.0
+_RESPONSE_CACHE_SIZE = 256
+# On a transient API error a getter may fall back to an expired entry up to
+# this many TTLs old (one hour for catalog data); older entries are not served.
+_CACHE_MAX_STALE_FACTOR = 12
+
+# Package name in a Play API request URI (".../applications/<package>/...");
+# writes to URIs without one (e.g. developer-level user grants) clear the
+# whole response cache.
+_APPLICATION_URI_RE = re.compile(r"/applications/([^/?:]+)")
+
+# How long one edit is shared by read-only calls when reuse_read_edits is set.
+_READ_EDIT_TTL = 30.0
+
+# Error reasons showing that an edit itself is gone (expired, deleted or
+# committed), as opposed to the resource read through it being missing.
+_INVALID_EDIT_REASONS = frozenset(
+    {"editExpired", "editNotFound", "editDeleted", "editAlreadyCommitted"}
+)
+
+# Maximum sub-requests sent in one multipart batch HTTP request.
+_BATCH_MAX_REQUESTS = 50
+
+# Partial-response masks (the standard ``fields`` parameter) for list calls
+# whose resources carry large parts the models never read: per-region prices
+# and subscription periods on in-app products; listings, tax settings and
+# restricted countries on subscriptions.
+_IN_APP_PRODUCT_LIST_FIELDS = (
+    "inappproduct(sku,purchaseType,status,defaultLanguage,listings,defaultPrice),tokenPagination"
+)
+_SUBSCRIPTION_LIST_FIELDS = "subscriptions(productId,basePlans),nextPageToken"
+
+# Resource kinds batch_get can fetch: kind -> (resource path, id parameter).
+_BATCH_GET_KINDS: dict[str, tuple[tuple[str, ...], str]] = {
+    "in_app_product": (("inappproducts",), "sku"),
+    "subscription": (("monetization", "subscriptions"), "productId"),
+    "one_time_product": (("monetization", "onetimeproducts"), "productId"),
+    "order": (("orders",), "orderId"),
+}
 
 # HTTP methods whose requests are safe to retry on an ambiguous server error
 # (500/503): repeating them cannot create a duplicate side effect. Non-idempotent
@@ -89,6 +275,9 @@ MAX_BACKOFF = 32.0  # seconds
 # commit, ...) are only retried on 429 (throttled, so never applied).
 _IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
+# Server-side statuses retried for idempotent requests (see _is_retryable_status).
+_RETRYABLE_SERVER_STATUSES = frozenset({500, 502, 503, 504})
+
 # Revocation contexts for subscription refunds (Purchases.subscriptionsv2.revoke)
 _REVOCATION_CONTEXTS: dict[str, dict[str, dict]] = {
     "full": {"fullRefund": {}},
@@ -130,13 +319,17 @@ def _parse_rfc3339(value: str | None) -> datetime | None:
 
 def _parse_review(review_data: dict[str, Any]) -> Review | None:
     """Parse a Reviews API resource into a Review, or None if it has no user comment."""
+    # The latest user and developer comments win; walk from the end and stop
+    # once both are found.
     user_comment = None
     dev_comment = None
-    for comment in review_data.get("comments", []):
-        if "userComment" in comment:
+    for comment in reversed(review_data.get("comments", ())):
+        if user_comment is None and "userComment" in comment:
             user_comment = comment["userComment"]
-        if "developerComment" in comment:
+        if dev_comment is None and "developerComment" in comment:
             dev_comment = comment["developerComment"]
+        if user_comment is not None and dev_comment is not None:
+            break
 
     if not user_comment:
         return None
@@ -159,45 +352,370 @@ def _parse_review(review_data: dict[str, Any]) -> Review | None:
     )
 
 
+def _parse_app_details(
+    package_name: str, details: dict[str, Any], listing: dict[str, Any]
+) -> AppDetails:
+    """Combine edits.details and edits.listings API resources into AppDetails."""
+    return AppDetails(
+        package_name=package_name,
+        title=listing.get("title"),
+        short_description=listing.get("shortDescription"),
+        full_description=listing.get("fullDescription"),
+        default_language=details.get("defaultLanguage"),
+        developer_name=None,  # edits.details API has no developer name field
+        developer_email=details.get("contactEmail"),
+        developer_website=details.get("contactWebsite"),
+    )
+
+
+def _parse_voided_purchase(package_name: str, purchase: dict[str, Any]) -> VoidedPurchase:
+    """Parse a purchases.voidedpurchases API resource into a VoidedPurchase model."""
+    voided_millis = purchase.get("voidedTimeMillis")
+    return VoidedPurchase(
+        package_name=package_name,
+        purchase_token=purchase.get("purchaseToken", ""),
+        order_id=purchase.get("orderId"),
+        voided_reason=purchase.get("voidedReason"),
+        voided_source=purchase.get("voidedSource"),
+        voided_time=datetime.fromtimestamp(int(voided_millis) / 1000, tz=UTC)
+        if voided_millis
+        else None,
+    )
+
+
+def _parse_track(package_name: str, track_data: dict[str, Any]) -> TrackInfo:
+    """Parse an edits.tracks API resource into a TrackInfo with its releases."""
+    # Plain keyword construction on purpose: pydantic models accept neither
+    # positional arguments nor __slots__, and model_construct() is slower than
+    # validation in pydantic v2 because it runs in Python rather than in
+    # pydantic-core.
+    track_name = track_data.get("track", "unknown")
+    return TrackInfo(
+        track=track_name,
+        releases=[
+            Release(
+                package_name=package_name,
+                track=track_name,
+                status=release_data.get("status", "unknown"),
+                version_codes=list(map(int, release_data.get("versionCodes", ()))),
+                version_name=release_data.get("name"),
+                rollout_percentage=(release_data.get("userFraction", 1.0) * 100),
+                release_notes={
+                    note.get("language", "en-US"): note.get("text", "")
+                    for note in release_data.get("releaseNotes", ())
+                },
+            )
+            for release_data in track_data.get("releases", ())
+        ],
+    )
+
+
+# The validators are pure functions of their input and the same package and
+# track names are checked on every tool call, so results are memoized. They are
+# returned as tuples of frozen ValidationResult models so that cached entries
+# cannot be mutated by callers.
+@functools.lru_cache(maxsize=256)
+def _validate_package_name(package_name: str) -> tuple[ValidationResult, ...]:
+    """Return the validation errors for a package name."""
+    if not package_name:
+        return (ValidationResult(field="package_name", message=_PKG_EMPTY_MSG, value=package_name),)
+
+    # Valid names (the common case) are settled by the single regex match;
+    # only a failed match is inspected further to pick the messages.
+    if _PACKAGE_NAME_RE.match(package_name):
+        return ()
+
+    invalid = ValidationResult(field="package_name", message=_PKG_INVALID_MSG, value=package_name)
+    if "." not in package_name:
+        # The regex requires a dot too, so a dotless name gets both messages.
+        no_dot = ValidationResult(field="package_name", message=_PKG_NO_DOT_MSG, value=package_name)
+        return (no_dot, invalid)
+    return (invalid,)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_track(track: str) -> tuple[ValidationResult, ...]:
+    """Return the validation errors for a track name."""
+    if track in _VALID_TRACKS:
+        return ()
+    return (ValidationResult(field="track", message=_TRACK_ERR_MSG, value=track),)
+
+
+def _find_release(track_data: dict[str, Any], version_code: int) -> dict[str, Any] | None:
+    """Return the first release on a track that contains ``version_code``.
+
+    The release dict is returned as-is, so changes to it are reflected in
+    ``track_data`` when it is sent back in a tracks.update.
+    """
+    releases: list[dict[str, Any]] = track_data.get("releases", [])
+    for release in releases:
+        if any(int(vc) == version_code for vc in release.get("versionCodes", ())):
+            return release
+    return None
+
+
+def _file_size(file_path: str) -> int | None:
+    """Return the size of ``file_path`` in bytes, or None if it does not exist.
+
+    One stat answers both the existence check and the upload-mode choice.
+    """
+    try:
+        return Path(file_path).stat().st_size
+    except OSError:
+        return None
+
+
+def _apply_rollout(release: dict[str, Any], rollout_percentage: float) -> None:
+    """Set a release's status and user fraction for a rollout percentage.
+
+    Below 100% the release is a staged rollout; at 100% it is completed and
+    any previous user fraction is dropped.
+    """
+    if rollout_percentage < 100:
+        release["status"] = "inProgress"
+        release["userFraction"] = rollout_percentage / 100.0
+    else:
+        release["status"] = "completed"
+        release.pop("userFraction", None)
+
+
+def _release_body(
+    version_code: int,
+    rollout_percentage: float,
+    release_notes: str | dict[str, str] | None,
+    release_notes_language: str,
+) -> dict[str, Any]:
+    """Build the track release resource for a newly uploaded version code."""
+    release_body: dict[str, Any] = {"versionCodes": [str(version_code)]}
+    _apply_rollout(release_body, rollout_percentage)
+
+    # Handle release notes - support both string and dict formats
+    if release_notes:
+        if isinstance(release_notes, dict):
+            # Multi-language release notes
+            release_body["releaseNotes"] = [
+                {"language": lang, "text": text} for lang, text in release_notes.items()
+            ]
+        else:
+            # Single language release notes
+            release_body["releaseNotes"] = [
+                {"language": release_notes_language, "text": release_notes}
+            ]
+
+    return release_body
+
+
+class _EditTxn:
+    """An open edit yielded by ``PlayStoreClient._edit_txn``.
+
+    Set ``committed`` once the edit has been committed; otherwise the edit is
+    deleted when the ``with`` block exits.
+    """
+
+    __slots__ = ("committed", "edit_id")
+
+    def __init__(self, edit_id: str) -> None:
+        self.edit_id = edit_id
+        self.committed = False
+
+
+class _TokenBucket:
+    """Thread-safe token bucket, refilled continuously up to its capacity."""
+
+    def __init__(self, capacity: float, refill_per_sec: float) -> None:
+        self._capacity = capacity
+        self._refill_per_sec = refill_per_sec
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Refill the bucket to capacity."""
+        with self._lock:
+            self._tokens = self._capacity
+            self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_sec)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take one token if available; False means the budget is spent."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take ``tokens``, sleeping until the bucket has refilled enough to cover them.
+
+        Tokens are reserved immediately (the bucket may go negative), so
+        concurrent callers queue up behind each other's reservations.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self._refill_per_sec
+        if wait > 0:
+            logger.debug("Request rate limited", wait=wait)
+            time.sleep(wait)
+
+
+_RETRY_BUDGET = _TokenBucket(RETRY_BUDGET_CAPACITY, RETRY_BUDGET_REFILL_PER_SEC)
+
+# Service-account credentials shared by every client built from the same key,
+# so per-request clients reuse one access token (and its refreshes) instead of
+# each fetching their own. Keyed by a digest of the key material; the oldest
+# entry is evicted once _CREDENTIALS_CACHE_SIZE distinct keys are held.
+_CREDENTIALS_CACHE_SIZE = 32
+_CREDENTIALS_CACHE: dict[str, Any] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+def _shared_credentials(key: str, factory: Callable[[], Any]) -> Any:
+    """Return the cached credentials for ``key``, creating them with ``factory``."""
+    with _CREDENTIALS_LOCK:
+        credentials = _CREDENTIALS_CACHE.get(key)
+        if credentials is None:
+            credentials = factory()
+            if len(_CREDENTIALS_CACHE) >= _CREDENTIALS_CACHE_SIZE:
+                del _CREDENTIALS_CACHE[next(iter(_CREDENTIALS_CACHE))]
+            _CREDENTIALS_CACHE[key] = credentials
+        return credentials
+
+
+def _credentials_from_info(info: dict[str, Any]) -> Any:
+    """Return shared service-account credentials for a parsed key dict."""
+    digest = hashlib.sha256(
+        json.dumps(info, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+    return _shared_credentials(
+        f"info:{digest}",
+        lambda: _lazy("service_account").Credentials.from_service_account_info(info, scopes=SCOPES),
+    )
+
+
+def _credentials_from_file(path: str) -> Any:
+    """Return shared service-account credentials for a key file.
+
+    The key includes the file's mtime, so a rotated key file is picked up.
+    """
+    file_path = Path(path).resolve()
+    key = f"file:{file_path}:{file_path.stat().st_mtime_ns}"
+    return _shared_credentials(
+        key,
+        lambda: _lazy("service_account").Credentials.from_service_account_file(
+            str(file_path), scopes=SCOPES
+        ),
+    )
+
+
 def _is_retryable_status(status: int, *, retry_server_errors: bool) -> bool:
     """Whether an HTTP error status should be retried.
 
     429 (rate limited) is always retryable: the request was throttled, not
-    applied, so repeating it is safe for any HTTP method. 500/503 are retried
-    only when ``retry_server_errors`` is set (idempotent requests), because the
-    server may have already applied a non-idempotent request before erroring.
+    applied, so repeating it is safe for any HTTP method. 500/502/503/504 are
+    retried only when ``retry_server_errors`` is set (idempotent requests),
+    because the server may have already applied a non-idempotent request
+    before erroring.
     """
     if status == 429:
         return True
-    return retry_server_errors and status in (500, 503)
+    return retry_server_errors and status in _RETRYABLE_SERVER_STATUSES
+
+
+def _is_invalid_edit_error(error: HttpError) -> bool:
+    """Whether ``error`` says the edit used by the request is no longer valid.
+
+    Only a 400/404 whose error reason is one of ``_INVALID_EDIT_REASONS``
+    counts; a 404 for a missing listing or track read through a live edit
+    does not.
+    """
+    if error.resp.status not in (400, 404):
+        return False
+    details = getattr(error, "error_details", None)
+    if not isinstance(details, list):
+        return False
+    return any(
+        isinstance(detail, dict) and detail.get("reason") in _INVALID_EDIT_REASONS
+        for detail in details
+    )
+
+
+def _retry_after_seconds(resp: Any) -> float | None:
+    """Return the delta-seconds ``Retry-After`` value of an error response, if any.
+
+    httplib2 responses are dicts with lower-cased header names. The HTTP-date
+    form of the header is not used by Google APIs and is ignored.
+    """
+    if not isinstance(resp, dict):
+        return None
+    try:
+        return max(0.0, float(resp["retry-after"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _next_backoff(
+    retries: int, deadline: float, retry_after: float | None, **context: Any
+) -> float | None:
+    """Return how long to sleep before retry number ``retries``, or None to give up."""
+    if retries >= MAX_RETRIES:
+        return None
+    remaining = deadline - time.monotonic()
+    # Never sleep past the overall retry window, including when the server
+    # asks for a longer wait than is left.
+    if remaining <= 0 or (retry_after is not None and retry_after > remaining):
+        return None
+    if not _RETRY_BUDGET.try_acquire():
+        logger.warning("Retry budget exhausted, not retrying", **context)
+        return None
+    # Full jitter: sleep a random fraction of the capped exponential backoff,
+    # so clients throttled together don't retry in lockstep. A Retry-After
+    # from the server is a lower bound.
+    cap = min(INITIAL_BACKOFF * 2.0 ** (retries - 1), MAX_BACKOFF)
+    sleep_time = random.random() * cap  # noqa: S311 # nosec B311 — non-crypto jitter for retry backoff
+    if retry_after is not None:
+        sleep_time = max(sleep_time, retry_after)
+    sleep_time = min(sleep_time, remaining)
+    logger.warning("API error, retrying", retry=retries, sleep=sleep_time, **context)
+    return sleep_time
 
 
 def _run_with_backoff(call, *, retry_server_errors=True):  # type: ignore[no-untyped-def]
-    """Run ``call`` with exponential-backoff retries on transient errors."""
-    retries = 0
-    backoff = INITIAL_BACKOFF
+    """Run ``call`` with exponential-backoff retries on transient errors.
 
+    Retries rate limiting (429) and, when ``retry_server_errors`` is set,
+    5xx gateway/server errors and connection failures or timeouts.
+    """
+    retries = 0
+    deadline = time.monotonic() + MAX_RETRY_WINDOW
     while retries < MAX_RETRIES:
         try:
             return call()
         except HttpError as e:
-            if not _is_retryable_status(e.resp.status, retry_server_errors=retry_server_errors):
+            status = e.resp.status
+            if not _is_retryable_status(status, retry_server_errors=retry_server_errors):
                 raise
             retries += 1
-            if retries >= MAX_RETRIES:
-                raise
-
-            # Add jitter to prevent thundering herd
-            sleep_time = backoff * (0.5 + random.random())  # noqa: S311 # nosec B311 — non-crypto jitter for retry backoff
-            logger.warning(
-                "API error, retrying",
-                status=e.resp.status,
-                retry=retries,
-                sleep=sleep_time,
+            sleep_time = _next_backoff(
+                retries, deadline, _retry_after_seconds(e.resp), status=status
             )
-            time.sleep(sleep_time)
-            backoff = min(backoff * 2, MAX_BACKOFF)
-
+            if sleep_time is None:
+                raise
+        except (ConnectionError, TimeoutError) as e:
+            # The request may or may not have reached the server, so a
+            # transport failure is retried under the same rule as a 5xx.
+            if not retry_server_errors:
+                raise
+            retries += 1
+            sleep_time = _next_backoff(retries, deadline, None, error=type(e).__name__)
+            if sleep_time is None:
+                raise
+        time.sleep(sleep_time)
     # The loop above always returns or raises while MAX_RETRIES >= 1. This
     # guards against a misconfigured MAX_RETRIES so a call can never fall
     # through and implicitly return None.
@@ -206,8 +724,119 @@ def _run_with_backoff(call, *, retry_server_errors=True):  # type: ignore[no-unt
     )
 
 
+class _ResponseCache:
+    """Thread-safe TTL cache of getter results, keyed by package and call arguments."""
+
+    def __init__(self, max_entries: int = _RESPONSE_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...], ttl: float) -> tuple[bool, Any]:
+        """Return ``(hit, value)`` for an entry younger than ``ttl`` seconds."""
+        hit, value, _age = self.get_with_age(key, ttl)
+        return hit, value
+
+    def get_with_age(self, key: tuple[Any, ...], max_age: float) -> tuple[bool, Any, float]:
+        """Return ``(hit, value, age)`` for an entry younger than ``max_age`` seconds."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return False, None, 0.0
+        stored_at, value = entry
+        age = time.monotonic() - stored_at
+        if age >= max_age:
+            return False, None, age
+        return True, value, age
+
+    def put(self, key: tuple[Any, ...], value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, package_name: str | None = None) -> None:
+        """Drop cached results for one package, or for all packages."""
+        with self._lock:
+            if package_name is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == package_name]:
+                    del self._entries[key]
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _cached_response(
+    ttl: float,
+    max_stale: float | None = None,
+) -> Callable[[Callable[Concatenate[Any, str, _P], _R]], Callable[Concatenate[Any, str, _P], _R]]:
+    """Decorator caching a read-only ``(self, package_name, ...)`` getter for ``ttl`` seconds.
+
+    If the API call fails with a transient error (429/500/502/503/504), the last
+    cached result is returned (and logged as stale) instead of raising, as
+    long as it is younger than ``max_stale`` seconds (default
+    ``_CACHE_MAX_STALE_FACTOR`` TTLs).
+
+    The cache key is built from the bound arguments with defaults applied, so
+    ``get_listing(pkg)``, ``get_listing(pkg, "en-US")`` and
+    ``get_listing(pkg, language="en-US")`` share one entry.
+    """
+    stale_limit = ttl * _CACHE_MAX_STALE_FACTOR if max_stale is None else max_stale
+
+    def decorator(
+        func: Callable[Concatenate[Any, str, _P], _R],
+    ) -> Callable[Concatenate[Any, str, _P], _R]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: Any, package_name: str, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+            bound = signature.bind(self, package_name, *args, **kwargs)
+            bound.apply_defaults()
+            # Skip self and package_name; package_name leads the key for invalidate().
+            key = (package_name, func.__name__, tuple(bound.arguments.items())[2:])
+            cache = self._response_cache
+            hit, value = cache.get(key, ttl)
+            if not hit:
+                try:
+                    value = func(self, package_name, *args, **kwargs)
+                except PlayStoreClientError as e:
+                    cause = e.__cause__
+                    if not (
+                        isinstance(cause, HttpError)
+                        and _is_retryable_status(cause.resp.status, retry_server_errors=True)
+                    ):
+                        raise
+                    hit, value, age = cache.get_with_age(key, stale_limit)
+                    if not hit:
+                        raise
+                    self._logger.warning(
+                        "Serving stale cached response",
+                        method=func.__name__,
+                        package_name=package_name,
+                        age_seconds=round(age, 1),
+                        error=str(cause),
+                    )
+                    return cast("_R", _copy_if_list(value))
+                cache.put(key, value)
+            return cast("_R", _copy_if_list(value))
+
+        return wrapper
+
+    return decorator
+
+
+def _copy_if_list(value: Any) -> Any:
+    """Shallow-copy cached lists so callers cannot reorder or extend the cached one."""
+    return list(value) if isinstance(value, list) else value
+
+
 def retry_with_backoff(func):  # type: ignore[no-untyped-def]
-    """Decorator to retry a call on transient errors (429/500/503).
+    """Decorator to retry a call on transient errors (429/500/502/503/504).
 
     For idempotent operations only (e.g. building the API service). Individual
     Play API requests go through ``PlayStoreClient._execute``, which decides
@@ -230,6 +859,8 @@ class PlayStoreClient:
         credentials_json: str | dict[str, Any] | None = None,
         application_name: str = "Play Store MCP Server",
         download_dir: str | None = None,
+        *,
+        reuse_read_edits: bool = False,
     ) -> None:
         """Initialize the Play Store client.
 
@@ -244,6 +875,10 @@ class PlayStoreClient:
                              and to the current working directory when neither is
                              set. Downloads are always confined — a destination
                              that resolves outside this directory is rejected.
+            reuse_read_edits: Share one short-lived edit per package across
+                             read-only calls instead of opening and deleting an
+                             edit for each. For long-lived clients; call close()
+                             when done so the last edits are deleted.
         """
         self._credentials_path = credentials_path or os.environ.get(
             "GOOGLE_APPLICATION_CREDENTIALS"
@@ -255,13 +890,47 @@ class PlayStoreClient:
             if download_dir is not None
             else os.environ.get("PLAY_STORE_MCP_DOWNLOAD_DIR")
         )
+        # Parsed form of an inline credentials_json string, kept so a retried
+        # or repeated service initialization does not parse it again.
+        self._parsed_creds_info: dict[str, Any] | None = None
         self._service: AndroidPublisherResource | None = None
+        # Authorized transport behind self._service. httplib2 keeps connections
+        # alive per host, so every call through the service reuses its sockets.
+        self._http: AuthorizedHttp | None = None
         # Serializes API I/O on this client's single (non-thread-safe) httplib2
         # transport. The shared fallback client is used across concurrent tool
         # worker threads; per-request header clients each get their own lock.
+        # Plain requests avoid it by using a per-thread transport instead; see
+        # _thread_transport().
         self._http_lock = threading.Lock()
+        self._thread_http = threading.local()
+        self._response_cache = _ResponseCache()
+        # Paces this client's API requests; see REQUEST_RATE_PER_SEC.
+        self._request_rate = _TokenBucket(REQUEST_RATE_BURST, REQUEST_RATE_PER_SEC)
+        # API resources built from the current service; see _resource().
+        self._resource_cache: tuple[Any, dict[tuple[str, ...], Any]] | None = None
+        # package name -> (edit id, monotonic creation time); see _read_with_edit().
+        self._reuse_read_edits = reuse_read_edits
+        self._read_edits: dict[str, tuple[str, float]] = {}
+        self._read_edits_lock = threading.Lock()
         self._logger = logger.bind(component="PlayStoreClient")
 
+    def invalidate_cache(self, package_name: str | None = None) -> None:
+        """Drop cached getter results for one package, or for all packages.
+
+        Writes made through this client already do this; call it after
+        changing an app by other means (e.g. the Play Console).
+        """
+        self._response_cache.invalidate(package_name)
+
+    def close(self) -> None:
+        """Delete any edits kept open for reuse by read-only calls."""
+        with self._read_edits_lock:
+            entries = list(self._read_edits.items())
+            self._read_edits.clear()
+        for package_name, (edit_id, _created) in entries:
+            self._delete_edit(package_name, edit_id)
+
     # =========================================================================
     # Validation Helpers
     # =========================================================================
@@ -275,39 +944,7 @@ class PlayStoreClient:
         Returns:
             List of validation errors (empty if valid).
         """
-        errors: list[ValidationResult] = []
-
-        if not package_name:
-            errors.append(
-                ValidationResult(
-                    field="package_name",
-                    message="Package name cannot be empty",
-                    value=package_name,
-                )
-            )
-            return errors
-
-        # Check format: must contain at least one dot
-        if "." not in package_name:
-            errors.append(
-                ValidationResult(
-                    field="package_name",
-                    message="Package name must contain at least one dot (e.g., com.example.app)",
-                    value=package_name,
-                )
-            )
-
-        # Check for invalid characters
-        if not re.match(r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)+$", package_name):
-            errors.append(
-                ValidationResult(
-                    field="package_name",
-                    message="Package name must start with lowercase letter and contain only lowercase letters, numbers, underscores, and dots",
-                    value=package_name,
-                )
-            )
-
-        return errors
+        return list(_validate_package_name(package_name))
 
     def validate_track(self, track: str) -> list[ValidationResult]:
         """Validate track name.
@@ -318,19 +955,7 @@ class PlayStoreClient:
         Returns:
             List of validation errors (empty if valid).
         """
-        errors: list[ValidationResult] = []
-        valid_tracks = ["internal", "alpha", "beta", "production"]
-
-        if track not in valid_tracks:
-            errors.append(
-                ValidationResult(
-                    field="track",
-                    message=f"Track must be one of: {', '.join(valid_tracks)}",
-                    value=track,
-                )
-            )
-
-        return errors
+        return list(_validate_track(track))
 
     def validate_listing_text(
         self,
@@ -349,39 +974,30 @@ class PlayStoreClient:
             List of validation errors (empty if valid).
         """
         errors: list[ValidationResult] = []
-
-        if title and len(title) > 50:
-            errors.append(
-                ValidationResult(
-                    field="title",
-                    message="Title must be 50 characters or less",
-                    value=f"{len(title)} characters",
-                )
-            )
-
-        if short_description and len(short_description) > 80:
-            errors.append(
-                ValidationResult(
-                    field="short_description",
-                    message="Short description must be 80 characters or less",
-                    value=f"{len(short_description)} characters",
-                )
-            )
-
-        if full_description and len(full_description) > 4000:
-            errors.append(
-                ValidationResult(
-                    field="full_description",
-                    message="Full description must be 4000 characters or less",
-                    value=f"{len(full_description)} characters",
+        texts = (title, short_description, full_description)
+        for (field, message, limit), text in zip(_LISTING_TEXT_LIMITS, texts, strict=True):
+            if text and (length := len(text)) > limit:
+                errors.append(
+                    ValidationResult(
+                        field=field,
+                        message=message,
+                        value=f"{length} characters",
+                    )
                 )
-            )
 
         return errors
 
-    @retry_with_backoff
     def _get_service(self) -> AndroidPublisherResource:
         """Get or create the API service instance."""
+        # Every API method comes through here, so the cached case skips the
+        # retry wrapper; only the first call pays for it in _init_service.
+        if self._service is not None:
+            return self._service
+        return self._init_service()
+
+    @retry_with_backoff
+    def _init_service(self) -> AndroidPublisherResource:
+        """Load credentials and build the API service instance."""
         if self._service is not None:
             return self._service
 
@@ -395,15 +1011,15 @@ class PlayStoreClient:
                 if isinstance(self._credentials_json, str):
                     try:
                         # Check if it's actually JSON or a path to a file
-                        if self._credentials_json.strip().startswith("{"):
-                            creds_info = json.loads(self._credentials_json)
-                            credentials = service_account.Credentials.from_service_account_info(
-                                creds_info, scopes=SCOPES
-                            )
-                        elif Path(self._credentials_json).exists():
-                            credentials = service_account.Credentials.from_service_account_file(
-                                self._credentials_json, scopes=SCOPES
-                            )
+                        if _JSON_OBJECT_START_RE.match(self._credentials_json):
+                            if self._parsed_creds_info is None:
+                                self._parsed_creds_info = json_loads(self._credentials_json)
+                            credentials = _credentials_from_info(self._parsed_creds_info)
+                        elif (
+                            _could_be_path(self._credentials_json)
+                            and Path(self._credentials_json).exists()
+                        ):
+                            credentials = _credentials_from_file(self._credentials_json)
                     except json.JSONDecodeError:
                         # If it's not JSON, maybe it's a path that doesn't exist?
                         self._logger.warning(
@@ -411,17 +1027,13 @@ class PlayStoreClient:
                         )
 
                 elif isinstance(self._credentials_json, dict):
-                    credentials = service_account.Credentials.from_service_account_info(
-                        self._credentials_json, scopes=SCOPES
-                    )
+                    credentials = _credentials_from_info(self._credentials_json)
 
             # Fall back to credentials_path
             if not credentials and self._credentials_path:
                 creds_path = Path(self._credentials_path)
                 if creds_path.exists():
-                    credentials = service_account.Credentials.from_service_account_file(
-                        str(creds_path), scopes=SCOPES
-                    )
+                    credentials = _credentials_from_file(str(creds_path))
 
             if not credentials:
                 raise PlayStoreClientError(
@@ -429,11 +1041,19 @@ class PlayStoreClient:
                     "or GOOGLE_PLAY_STORE_CREDENTIALS (JSON or path)."
                 )
 
-            self._service = build(
+            # One long-lived authorized transport (build_http applies the client
+            # library's default timeout and redirect handling).
+            self._http = self._authorized_http(credentials)
+            # static_discovery: build from the androidpublisher v3 discovery
+            # document bundled with google-api-python-client instead of fetching
+            # it over the network on every cold start.
+            self._service = _lazy("build")(
                 "androidpublisher",
                 "v3",
-                credentials=credentials,
+                http=self._http,
+                model=_response_model() if orjson is not None else None,
                 cache_discovery=False,
+                static_discovery=True,
             )
             self._logger.info("API client initialized successfully")
             return self._service  # type: ignore[return-value]
@@ -456,14 +1076,197 @@ class PlayStoreClient:
         """
         method = (getattr(request, "method", "") or "").upper()
         retry_server_errors = method in _IDEMPOTENT_HTTP_METHODS
+        http = self._thread_transport()
 
-        def _locked_execute() -> Any:
+        def _send() -> Any:
+            self._request_rate.acquire()
+            if http is not None:
+                return request.execute(http=http)
             # Hold the lock only around the actual transport call, not the
             # backoff sleep between attempts, so retries don't serialize waits.
             with self._http_lock:
                 return request.execute()
 
-        return _run_with_backoff(_locked_execute, retry_server_errors=retry_server_errors)
+        result = _run_with_backoff(_send, retry_server_errors=retry_server_errors)
+        # Writes outside an edit take effect immediately; edit changes only
+        # take effect on commit (see _commit_edit).
+        uri = str(getattr(request, "uri", ""))
+        if method != "GET" and "/edits" not in uri:
+            match = _APPLICATION_URI_RE.search(uri)
+            self._response_cache.invalidate(match.group(1) if match else None)
+        return result
+
+    def _authorized_http(self, credentials: Any) -> AuthorizedHttp:
+        """Build an authorized transport that identifies this application.
+
+        The application name is prepended to the User-Agent of every request.
+        """
+        http = _lazy("AuthorizedHttp")(credentials, http=_lazy("build_http")())
+        return cast("AuthorizedHttp", _lazy("set_user_agent")(http, self._application_name))
+
+    def _thread_transport(self) -> AuthorizedHttp | None:
+        """Return the calling thread's own authorized transport.
+
+        httplib2 transports are not thread-safe, so instead of serializing
+        every call on the service's transport behind ``_http_lock``, each
+        worker thread gets a transport over the same credentials and keeps its
+        connection (and TLS session) alive across calls. Returns None when the
+        service was set up without a transport, in which case callers fall
+        back to the shared one under the lock.
+        """
+        shared = self._http
+        if shared is None:
+            return None
+        entry = getattr(self._thread_http, "entry", None)
+        if entry is not None and entry[0] is shared:
+            return cast("AuthorizedHttp", entry[1])
+        http = self._authorized_http(shared.credentials)
+        # Keyed on the shared transport so a rebuilt service gets fresh ones.
+        self._thread_http.entry = (shared, http)
+        return cast("AuthorizedHttp", http)
+
+    def _execute_batch(
+        self,
+        requests: dict[str, Any],
+        responses: dict[str, Any] | None = None,
+        errors: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Execute independent requests as multipart batch HTTP requests.
+
+        Up to ``_BATCH_MAX_REQUESTS`` sub-requests share one round trip. The
+        batch as a whole goes through the same retry/backoff as ``_execute``
+        (server errors are retried only when every sub-request is idempotent);
+        individual sub-request failures are not retried but reported back.
+
+        Args:
+            requests: Mapping of caller-chosen request id to API request.
+            responses: Optional dict to collect responses into as they
+                arrive, so a caller still sees earlier chunks' results when a
+                later chunk raises.
+            errors: Optional dict to collect sub-request errors into.
+
+        Returns:
+            ``(responses, errors)`` keyed by request id; each id appears in
+            exactly one of the two.
+        """
+        service = self._get_service()
+        http = self._thread_transport()
+        responses = {} if responses is None else responses
+        errors = {} if errors is None else errors
+
+        def _collect(request_id: str, response: Any, exception: Any) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        items = list(requests.items())
+        for start in range(0, len(items), _BATCH_MAX_REQUESTS):
+            chunk = items[start : start + _BATCH_MAX_REQUESTS]
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, request in chunk:
+                batch.add(request, request_id=request_id)
+            retry_server_errors = all(
+                (getattr(request, "method", "") or "").upper() in _IDEMPOTENT_HTTP_METHODS
+                for _, request in chunk
+            )
+
+            def _send(batch: Any = batch, size: int = len(chunk)) -> Any:
+                self._request_rate.acquire(size)
+                if http is not None:
+                    return batch.execute(http=http)
+                with self._http_lock:
+                    return batch.execute()
+
+            _run_with_backoff(_send, retry_server_errors=retry_server_errors)
+
+        return responses, errors
+
+    def _resource(self, service: Any, *path: str) -> Any:
+        """Return the nested resource ``service.<path[0]>().<path[1]>()...``, cached.
+
+        googleapiclient builds resource objects from the discovery document on
+        every call, costing a few hundred microseconds each, so chains like
+        ``service.monetization().subscriptions()`` are built once. The cache is
+        keyed on the service, so it is rebuilt if the service is replaced.
+        """
+        cache = self._resource_cache
+        if cache is None or cache[0] is not service:
+            cache = self._resource_cache = (service, {})
+        resources = cache[1]
+        resource = resources.get(path)
+        if resource is None:
+            parent = self._resource(service, *path[:-1]) if len(path) > 1 else service
+            resource = resources[path] = getattr(parent, path[-1])()
+        return resource
+
+    def _edits(self, service: Any, name: str | None = None) -> Any:
+        """Return ``service.edits()``, or one of its sub-resources; see ``_resource``."""
+        if name is None:
+            return self._resource(service, "edits")
+        return self._resource(service, "edits", name)
+
+    def _execute_upload(self, request: Any) -> Any:
+        """Execute a media upload request.
+
+        A simple (non-resumable) upload goes through ``_execute``. A resumable
+        upload is driven chunk by chunk with ``next_chunk()`` on the calling
+        thread's own transport, so a long upload does not hold up other calls
+        (without one, ``_http_lock`` is held per chunk, as
+        ``_download_to_file`` does). The client library retries a failed chunk
+        without restarting the upload.
+        """
+        if not isinstance(getattr(request, "resumable", None), _lazy("MediaUpload")):
+            return self._execute(request)
+
+        http = self._thread_transport()
+        response = None
+        while response is None:
+            self._request_rate.acquire()
+            if http is not None:
+                status, response = request.next_chunk(http=http, num_retries=MAX_RETRIES)
+            else:
+                with self._http_lock:
+                    status, response = request.next_chunk(num_retries=MAX_RETRIES)
+            if status is not None:
+                self._logger.debug("Upload progress", bytes_sent=status.resumable_progress)
+        return response
+
+    def _upload_artifact(
+        self, service: Any, package_name: str, edit_id: str, file_path: str, file_size: int
+    ) -> int:
+        """Upload an APK or AAB into an edit and return its version code.
+
+        ``file_size`` comes from the caller's existence check, so the file is
+        only statted once per deployment.
+        """
+        # Anything that is not an .aab goes up as an APK; callers validate the
+        # extension.
+        content_type, resource_name = _UPLOAD_TARGETS.get(
+            Path(file_path).suffix.lower(), _UPLOAD_TARGETS[".apk"]
+        )
+        self._logger.info("Uploading artifact", file_path=file_path, size_bytes=file_size)
+
+        # Small artifacts go up in one request, skipping the extra round trip
+        # that opens a resumable session; large ones are sent in chunks.
+        if file_size < _RESUMABLE_UPLOAD_THRESHOLD:
+            media = _lazy("MediaFileUpload")(file_path, mimetype=content_type, resumable=False)
+        else:
+            media = _lazy("MediaFileUpload")(
+                file_path,
+                mimetype=content_type,
+                chunksize=_UPLOAD_CHUNK_SIZE,
+                resumable=True,
+            )
+
+        resource = self._edits(service, resource_name)
+        upload_response = self._execute_upload(
+            resource.upload(packageName=package_name, editId=edit_id, media_body=media)
+        )
+
+        version_code = int(upload_response.get("versionCode", 0))
+        self._logger.info("Upload complete", version_code=version_code)
+        return version_code
 
     def _create_edit(self, package_name: str) -> str:
         """Create a new edit for the package.
@@ -476,7 +1279,7 @@ class PlayStoreClient:
         """
         service = self._get_service()
         try:
-            result = self._execute(service.edits().insert(packageName=package_name, body={}))
+            result = self._execute(self._edits(service).insert(packageName=package_name, body={}))
         except HttpError as e:
             self._logger.exception("Failed to create edit", error=str(e))
             raise PlayStoreClientError(f"Failed to create edit: {e.reason}") from e
@@ -487,14 +1290,162 @@ class PlayStoreClient:
     def _commit_edit(self, package_name: str, edit_id: str) -> None:
         """Commit an edit.
 
+        Always sent as its own request, after the edit's changes: the batch
+        endpoint does not guarantee sub-request ordering, so a commit batched
+        with the track update it depends on could land first.
+
         Args:
             package_name: App package name.
             edit_id: Edit ID to commit.
         """
         service = self._get_service()
-        self._execute(service.edits().commit(packageName=package_name, editId=edit_id))
+        try:
+            self._execute(self._edits(service).commit(packageName=package_name, editId=edit_id))
+        finally:
+            self._response_cache.invalidate(package_name)
+            # Reads should see the committed state, not a pre-commit snapshot.
+            with self._read_edits_lock:
+                stale = self._read_edits.pop(package_name, None)
+            if stale is not None:
+                self._delete_edit(package_name, stale[0])
         self._logger.debug("Committed edit", package_name=package_name, edit_id=edit_id)
 
+    def _acquire_read_edit(self, package_name: str) -> tuple[str, bool]:
+        """Return ``(edit_id, reused)`` for a read-only call on ``package_name``."""
+        now = time.monotonic()
+        with self._read_edits_lock:
+            entry = self._read_edits.get(package_name)
+            if entry is not None and now - entry[1] < _READ_EDIT_TTL:
+                return entry[0], True
+            expired = self._read_edits.pop(package_name, None)
+        if expired is not None:
+            self._delete_edit(package_name, expired[0])
+
+        edit_id = self._create_edit(package_name)
+        with self._read_edits_lock:
+            replaced = self._read_edits.get(package_name)
+            self._read_edits[package_name] = (edit_id, time.monotonic())
+        if replaced is not None:
+            # Another thread opened one concurrently; keep the newer edit.
+            self._delete_edit(package_name, replaced[0])
+        return edit_id, False
+
+    def _discard_read_edit(self, package_name: str, edit_id: str) -> None:
+        """Stop reusing ``edit_id`` for ``package_name`` and delete it."""
+        with self._read_edits_lock:
+            entry = self._read_edits.get(package_name)
+            if entry is not None and entry[0] == edit_id:
+                del self._read_edits[package_name]
+        self._delete_edit(package_name, edit_id)
+
+    def _read_with_edit(self, package_name: str, read: Callable[[str], _R]) -> _R:
+        """Run ``read(edit_id)`` for a read-only call that needs an edit.
+
+        Without ``reuse_read_edits`` this opens an edit and deletes it after
+        the read. With it, one edit per package is shared by read-only calls
+        for up to ``_READ_EDIT_TTL`` seconds, saving the insert and delete
+        round trips. A reused edit the API reports as expired or gone (a
+        commit elsewhere can invalidate it) is discarded and the read is
+        retried once on a fresh edit; any other error is raised and the edit
+        stays cached.
+        """
+        if not self._reuse_read_edits:
+            edit_id = self._create_edit(package_name)
+            try:
+                return read(edit_id)
+            finally:
+                self._delete_edit(package_name, edit_id)
+
+        edit_id, reused = self._acquire_read_edit(package_name)
+        try:
+            return read(edit_id)
+        except HttpError as e:
+            if not _is_invalid_edit_error(e):
+                raise
+            self._discard_read_edit(package_name, edit_id)
+            if not reused:
+                raise
+
+        edit_id, _reused = self._acquire_read_edit(package_name)
+        try:
+            return read(edit_id)
+        except HttpError as e:
+            if _is_invalid_edit_error(e):
+                self._discard_read_edit(package_name, edit_id)
+            raise
+
+    @contextlib.contextmanager
+    def _edit_txn(self, package_name: str) -> Iterator[_EditTxn]:
+        """Open an edit and delete it on exit unless it was marked committed.
+
+        Errors from creating the edit propagate; the edit is cleaned up on
+        every other exit path, including early returns.
+        """
+        txn = _EditTxn(self._create_edit(package_name))
+        try:
+            yield txn
+        finally:
+            if not txn.committed:
+                self._delete_edit(package_name, txn.edit_id)
+
+    @contextlib.contextmanager
+    def _batch_edits(
+        self, service: Any, package_names: list[str], action: str
+    ) -> Iterator[tuple[dict[str, str], dict[str, Any]]]:
+        """Open one edit per app in a batch and delete them all on exit.
+
+        Yields ``(edit_ids, failed)``: the edit id per app that got one, and
+        the insert error per app that did not. Edits are recorded as their
+        responses arrive, so ones created before a batch-level failure are
+        still deleted. Batch-level HttpErrors, from the inserts or the body,
+        are raised as PlayStoreClientError ("Failed to <action>: ...").
+        """
+        edits: dict[str, Any] = {}
+        failed: dict[str, Any] = {}
+        try:
+            self._execute_batch(
+                {
+                    package_name: self._edits(service).insert(packageName=package_name, body={})
+                    for package_name in package_names
+                },
+                responses=edits,
+                errors=failed,
+            )
+            yield {package_name: edit["id"] for package_name, edit in edits.items()}, failed
+        except HttpError as e:
+            self._logger.exception(f"Failed to {action}", error=str(e))
+            raise PlayStoreClientError(f"Failed to {action}: {e.reason}") from e
+        finally:
+            # Best-effort cleanup, like _delete_edit: an expired edit is harmless.
+            with contextlib.suppress(HttpError):
+                self._execute_batch(
+                    {
+                        package_name: self._edits(service).delete(
+                            packageName=package_name, editId=edit["id"]
+                        )
+                        for package_name, edit in edits.items()
+                    }
+                )
+
+    def _release_failure(
+        self,
+        action: str,
+        package_name: str,
+        track: str,
+        error: Exception,
+        version_code: int | None = None,
+    ) -> DeploymentResult:
+        """Build the DeploymentResult for a failed release operation."""
+        detail = error.reason if isinstance(error, HttpError) else error
+        return DeploymentResult(
+            success=False,
+            package_name=package_name,
+            track=track,
+            version_code=version_code,
+            message=f"{action} failed: {detail}",
+            error=str(error),
+        )
+
     def _delete_edit(self, package_name: str, edit_id: str) -> None:
         """Delete an edit without committing.
 
@@ -504,7 +1455,7 @@ class PlayStoreClient:
         """
         service = self._get_service()
         try:
-            self._execute(service.edits().delete(packageName=package_name, editId=edit_id))
+            self._execute(self._edits(service).delete(packageName=package_name, editId=edit_id))
             self._logger.debug("Deleted edit", package_name=package_name, edit_id=edit_id)
         except HttpError as e:
             # Edit may have already been committed or expired
@@ -525,47 +1476,67 @@ class PlayStoreClient:
         """
         self._logger.info("Fetching releases", package_name=package_name)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            result = self._execute(
-                service.edits().tracks().list(packageName=package_name, editId=edit_id)
+            result = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "tracks").list(packageName=package_name, editId=edit_id)
+                ),
             )
 
-            tracks: list[TrackInfo] = []
-            for track_data in result.get("tracks", []):
-                releases: list[Release] = []
-                for release_data in track_data.get("releases", []):
-                    # Extract release notes
-                    release_notes: dict[str, str] = {}
-                    for note in release_data.get("releaseNotes", []):
-                        release_notes[note.get("language", "en-US")] = note.get("text", "")
+            return [
+                _parse_track(package_name, track_data) for track_data in result.get("tracks", ())
+            ]
+        except HttpError as e:
+            self._logger.exception("Failed to fetch releases", error=str(e))
+            raise PlayStoreClientError(f"Failed to fetch releases: {e.reason}") from e
 
-                    releases.append(
-                        Release(
-                            package_name=package_name,
-                            track=track_data.get("track", "unknown"),
-                            status=release_data.get("status", "unknown"),
-                            version_codes=[int(vc) for vc in release_data.get("versionCodes", [])],
-                            version_name=release_data.get("name"),
-                            rollout_percentage=(release_data.get("userFraction", 1.0) * 100),
-                            release_notes=release_notes,
-                        )
-                    )
+    def get_releases_many(self, package_names: list[str]) -> dict[str, list[TrackInfo]]:
+        """Get release information for several apps in batched round trips.
+
+        Creates one edit per app, lists every app's tracks, and deletes the
+        edits, with each of the three steps sent as a batch HTTP request rather
+        than one request per app.
+
+        Args:
+            package_names: App package names.
 
-                tracks.append(
-                    TrackInfo(
-                        track=track_data.get("track", "unknown"),
-                        releases=releases,
+        Returns:
+            Mapping of package name to its track information.
+
+        Raises:
+            PlayStoreClientError: if any app's edit or track listing fails.
+        """
+        self._logger.info("Fetching releases", package_names=package_names)
+        service = self._get_service()
+        package_names = list(dict.fromkeys(package_names))
+
+        with self._batch_edits(service, package_names, "fetch releases") as (edit_ids, failed):
+            results, list_failed = self._execute_batch(
+                {
+                    package_name: self._edits(service, "tracks").list(
+                        packageName=package_name, editId=edit_id
                     )
-                )
+                    for package_name, edit_id in edit_ids.items()
+                }
+            )
+            failed.update(list_failed)
 
-            return tracks
-        except HttpError as e:
-            self._logger.exception("Failed to fetch releases", error=str(e))
-            raise PlayStoreClientError(f"Failed to fetch releases: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
+        if failed:
+            details = "; ".join(
+                f"{name}: {getattr(error, 'reason', error)}" for name, error in failed.items()
+            )
+            self._logger.error("Failed to fetch releases", failed=sorted(failed))
+            raise PlayStoreClientError(f"Failed to fetch releases: {details}")
+
+        return {
+            package_name: [
+                _parse_track(package_name, track_data)
+                for track_data in results[package_name].get("tracks", ())
+            ]
+            for package_name in package_names
+        }
 
     def deploy_app(
         self,
@@ -598,8 +1569,8 @@ class PlayStoreClient:
             rollout_percentage=rollout_percentage,
         )
 
-        file_path_obj = Path(file_path)
-        if not file_path_obj.exists():
+        file_size = _file_size(file_path)
+        if file_size is None:
             return DeploymentResult(
                 success=False,
                 package_name=package_name,
@@ -609,104 +1580,45 @@ class PlayStoreClient:
             )
 
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
-
-        try:
-            # Determine content type and upload method
-            is_bundle = file_path.lower().endswith(".aab")
-            content_type = (
-                "application/octet-stream"
-                if is_bundle
-                else "application/vnd.android.package-archive"
-            )
-
-            media = MediaFileUpload(file_path, mimetype=content_type, resumable=True)
-
-            if is_bundle:
-                upload_response = self._execute(
-                    service.edits()
-                    .bundles()
-                    .upload(packageName=package_name, editId=edit_id, media_body=media)
+        with self._edit_txn(package_name) as txn:
+            try:
+                uploaded_version_code = self._upload_artifact(
+                    service, package_name, txn.edit_id, file_path, file_size
                 )
-            else:
-                upload_response = self._execute(
-                    service.edits()
-                    .apks()
-                    .upload(packageName=package_name, editId=edit_id, media_body=media)
+                release_body = _release_body(
+                    uploaded_version_code,
+                    rollout_percentage,
+                    release_notes,
+                    release_notes_language,
                 )
 
-            uploaded_version_code = int(upload_response.get("versionCode", 0))
-            self._logger.info("Upload complete", version_code=uploaded_version_code)
+                # Update track
+                track_body = {"releases": [release_body]}
+                self._execute(
+                    self._edits(service, "tracks").update(
+                        packageName=package_name,
+                        editId=txn.edit_id,
+                        track=track,
+                        body=track_body,
+                    )
+                )
 
-            # Build release
-            release_body: dict[str, Any] = {
-                "versionCodes": [str(uploaded_version_code)],
-            }
+                # Commit
+                self._commit_edit(package_name, txn.edit_id)
+                txn.committed = True
 
-            if rollout_percentage < 100:
-                release_body["status"] = "inProgress"
-                release_body["userFraction"] = rollout_percentage / 100.0
-            else:
-                release_body["status"] = "completed"
-
-            # Handle release notes - support both string and dict formats
-            if release_notes:
-                if isinstance(release_notes, dict):
-                    # Multi-language release notes
-                    release_body["releaseNotes"] = [
-                        {"language": lang, "text": text} for lang, text in release_notes.items()
-                    ]
-                else:
-                    # Single language release notes
-                    release_body["releaseNotes"] = [
-                        {"language": release_notes_language, "text": release_notes}
-                    ]
-
-            # Update track
-            track_body = {"releases": [release_body]}
-            self._execute(
-                service.edits()
-                .tracks()
-                .update(
-                    packageName=package_name,
-                    editId=edit_id,
+                return DeploymentResult(
+                    success=True,
+                    edit_id=txn.edit_id,
+                    package_name=package_name,
                     track=track,
-                    body=track_body,
+                    version_code=uploaded_version_code,
+                    message=f"Successfully deployed version {uploaded_version_code} to {track}",
                 )
-            )
-
-            # Commit
-            self._commit_edit(package_name, edit_id)
-
-            return DeploymentResult(
-                success=True,
-                edit_id=edit_id,
-                package_name=package_name,
-                track=track,
-                version_code=uploaded_version_code,
-                message=f"Successfully deployed version {uploaded_version_code} to {track}",
-            )
 
-        except HttpError as e:
-            self._logger.exception("Deployment failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                message=f"Deployment failed: {e.reason}",
-                error=str(e),
-            )
-        except Exception as e:
-            self._logger.exception("Deployment failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                message=f"Deployment failed: {e}",
-                error=str(e),
-            )
+            except Exception as e:
+                self._logger.exception("Deployment failed", error=str(e))
+                return self._release_failure("Deployment", package_name, track, e)
 
     def promote_release(
         self,
@@ -737,92 +1649,58 @@ class PlayStoreClient:
         )
 
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
+        with self._edit_txn(package_name) as txn:
+            try:
+                # Get source track info
+                source_track = self._execute(
+                    self._edits(service, "tracks").get(
+                        packageName=package_name, editId=txn.edit_id, track=from_track
+                    )
+                )
 
-        try:
-            # Get source track info
-            source_track = self._execute(
-                service.edits()
-                .tracks()
-                .get(packageName=package_name, editId=edit_id, track=from_track)
-            )
-
-            # Find the release with matching version code
-            source_release = None
-            for release in source_track.get("releases", []):
-                version_codes = [int(vc) for vc in release.get("versionCodes", [])]
-                if version_code in version_codes:
-                    source_release = release
-                    break
+                source_release = _find_release(source_track, version_code)
+                if source_release is None:
+                    return DeploymentResult(
+                        success=False,
+                        package_name=package_name,
+                        track=to_track,
+                        version_code=version_code,
+                        message=f"Version {version_code} not found in {from_track}",
+                        error="VersionNotFound",
+                    )
 
-            if not source_release:
-                self._delete_edit(package_name, edit_id)
-                return DeploymentResult(
-                    success=False,
-                    package_name=package_name,
-                    track=to_track,
-                    version_code=version_code,
-                    message=f"Version {version_code} not found in {from_track}",
-                    error="VersionNotFound",
+                # Create new release for target track
+                new_release: dict[str, Any] = {
+                    "versionCodes": [str(version_code)],
+                    "releaseNotes": source_release.get("releaseNotes", []),
+                }
+                _apply_rollout(new_release, rollout_percentage)
+
+                # Update target track
+                self._execute(
+                    self._edits(service, "tracks").update(
+                        packageName=package_name,
+                        editId=txn.edit_id,
+                        track=to_track,
+                        body={"releases": [new_release]},
+                    )
                 )
 
-            # Create new release for target track
-            new_release: dict[str, Any] = {
-                "versionCodes": [str(version_code)],
-                "releaseNotes": source_release.get("releaseNotes", []),
-            }
+                self._commit_edit(package_name, txn.edit_id)
+                txn.committed = True
 
-            if rollout_percentage < 100:
-                new_release["status"] = "inProgress"
-                new_release["userFraction"] = rollout_percentage / 100.0
-            else:
-                new_release["status"] = "completed"
-
-            # Update target track
-            self._execute(
-                service.edits()
-                .tracks()
-                .update(
-                    packageName=package_name,
-                    editId=edit_id,
+                return DeploymentResult(
+                    success=True,
+                    edit_id=txn.edit_id,
+                    package_name=package_name,
                     track=to_track,
-                    body={"releases": [new_release]},
+                    version_code=version_code,
+                    message=f"Successfully promoted version {version_code} from {from_track} to {to_track}",
                 )
-            )
-
-            self._commit_edit(package_name, edit_id)
 
-            return DeploymentResult(
-                success=True,
-                edit_id=edit_id,
-                package_name=package_name,
-                track=to_track,
-                version_code=version_code,
-                message=f"Successfully promoted version {version_code} from {from_track} to {to_track}",
-            )
-
-        except HttpError as e:
-            self._logger.exception("Promotion failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=to_track,
-                version_code=version_code,
-                message=f"Promotion failed: {e.reason}",
-                error=str(e),
-            )
-        except Exception as e:
-            self._logger.exception("Promotion failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=to_track,
-                version_code=version_code,
-                message=f"Promotion failed: {e}",
-                error=str(e),
-            )
+            except Exception as e:
+                self._logger.exception("Promotion failed", error=str(e))
+                return self._release_failure("Promotion", package_name, to_track, e, version_code)
 
     def halt_release(self, package_name: str, track: str, version_code: int) -> DeploymentResult:
         """Halt a staged rollout.
@@ -843,80 +1721,53 @@ class PlayStoreClient:
         )
 
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
+        with self._edit_txn(package_name) as txn:
+            try:
+                # Get current track info
+                current_track = self._execute(
+                    self._edits(service, "tracks").get(
+                        packageName=package_name, editId=txn.edit_id, track=track
+                    )
+                )
 
-        try:
-            # Get current track info
-            current_track = self._execute(
-                service.edits().tracks().get(packageName=package_name, editId=edit_id, track=track)
-            )
-
-            # Find and update the release
-            releases = current_track.get("releases", [])
-            updated = False
-            for release in releases:
-                version_codes = [int(vc) for vc in release.get("versionCodes", [])]
-                if version_code in version_codes:
-                    release["status"] = "halted"
-                    updated = True
-                    break
+                release = _find_release(current_track, version_code)
+                if release is None:
+                    return DeploymentResult(
+                        success=False,
+                        package_name=package_name,
+                        track=track,
+                        version_code=version_code,
+                        message=f"Version {version_code} not found in {track}",
+                        error="VersionNotFound",
+                    )
+
+                release["status"] = "halted"
+
+                # Update track
+                self._execute(
+                    self._edits(service, "tracks").update(
+                        packageName=package_name,
+                        editId=txn.edit_id,
+                        track=track,
+                        body={"releases": current_track["releases"]},
+                    )
+                )
+
+                self._commit_edit(package_name, txn.edit_id)
+                txn.committed = True
 
-            if not updated:
-                self._delete_edit(package_name, edit_id)
                 return DeploymentResult(
-                    success=False,
+                    success=True,
+                    edit_id=txn.edit_id,
                     package_name=package_name,
                     track=track,
                     version_code=version_code,
-                    message=f"Version {version_code} not found in {track}",
-                    error="VersionNotFound",
+                    message=f"Successfully halted version {version_code} on {track}",
                 )
 
-            # Update track
-            self._execute(
-                service.edits()
-                .tracks()
-                .update(
-                    packageName=package_name,
-                    editId=edit_id,
-                    track=track,
-                    body={"releases": releases},
-                )
-            )
-
-            self._commit_edit(package_name, edit_id)
-
-            return DeploymentResult(
-                success=True,
-                edit_id=edit_id,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Successfully halted version {version_code} on {track}",
-            )
-
-        except HttpError as e:
-            self._logger.exception("Halt failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Halt failed: {e.reason}",
-                error=str(e),
-            )
-        except Exception as e:
-            self._logger.exception("Halt failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Halt failed: {e}",
-                error=str(e),
-            )
+            except Exception as e:
+                self._logger.exception("Halt failed", error=str(e))
+                return self._release_failure("Halt", package_name, track, e, version_code)
 
     def update_rollout(
         self,
@@ -945,86 +1796,55 @@ class PlayStoreClient:
         )
 
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
+        with self._edit_txn(package_name) as txn:
+            try:
+                # Get current track info
+                current_track = self._execute(
+                    self._edits(service, "tracks").get(
+                        packageName=package_name, editId=txn.edit_id, track=track
+                    )
+                )
 
-        try:
-            # Get current track info
-            current_track = self._execute(
-                service.edits().tracks().get(packageName=package_name, editId=edit_id, track=track)
-            )
-
-            # Find and update the release
-            releases = current_track.get("releases", [])
-            updated = False
-            for release in releases:
-                version_codes = [int(vc) for vc in release.get("versionCodes", [])]
-                if version_code in version_codes:
-                    if rollout_percentage >= 100:
-                        release["status"] = "completed"
-                        release.pop("userFraction", None)
-                    else:
-                        release["status"] = "inProgress"
-                        release["userFraction"] = rollout_percentage / 100.0
-                    updated = True
-                    break
+                release = _find_release(current_track, version_code)
+                if release is None:
+                    return DeploymentResult(
+                        success=False,
+                        package_name=package_name,
+                        track=track,
+                        version_code=version_code,
+                        message=f"Version {version_code} not found in {track}",
+                        error="VersionNotFound",
+                    )
+
+                _apply_rollout(release, rollout_percentage)
+
+                # Update track
+                self._execute(
+                    self._edits(service, "tracks").update(
+                        packageName=package_name,
+                        editId=txn.edit_id,
+                        track=track,
+                        body={"releases": current_track["releases"]},
+                    )
+                )
+
+                self._commit_edit(package_name, txn.edit_id)
+                txn.committed = True
 
-            if not updated:
-                self._delete_edit(package_name, edit_id)
                 return DeploymentResult(
-                    success=False,
+                    success=True,
+                    edit_id=txn.edit_id,
                     package_name=package_name,
                     track=track,
                     version_code=version_code,
-                    message=f"Version {version_code} not found in {track}",
-                    error="VersionNotFound",
-                )
-
-            # Update track
-            self._execute(
-                service.edits()
-                .tracks()
-                .update(
-                    packageName=package_name,
-                    editId=edit_id,
-                    track=track,
-                    body={"releases": releases},
+                    message=f"Successfully updated rollout to {rollout_percentage}% for version {version_code}",
                 )
-            )
-
-            self._commit_edit(package_name, edit_id)
 
-            return DeploymentResult(
-                success=True,
-                edit_id=edit_id,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Successfully updated rollout to {rollout_percentage}% for version {version_code}",
-            )
-
-        except HttpError as e:
-            self._logger.exception("Rollout update failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Rollout update failed: {e.reason}",
-                error=str(e),
-            )
-        except Exception as e:
-            self._logger.exception("Rollout update failed", error=str(e))
-            self._delete_edit(package_name, edit_id)
-            return DeploymentResult(
-                success=False,
-                package_name=package_name,
-                track=track,
-                version_code=version_code,
-                message=f"Rollout update failed: {e}",
-                error=str(e),
-            )
+            except Exception as e:
+                self._logger.exception("Rollout update failed", error=str(e))
+                return self._release_failure("Rollout update", package_name, track, e, version_code)
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def get_app_details(self, package_name: str, language: str = "en-US") -> AppDetails:
         """Get app details.
 
@@ -1037,39 +1857,86 @@ class PlayStoreClient:
         """
         self._logger.info("Fetching app details", package_name=package_name, language=language)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
-        try:
-            # Get app details
-            details = self._execute(
-                service.edits().details().get(packageName=package_name, editId=edit_id)
+        def read(edit_id: str) -> tuple[dict[str, Any], dict[str, Any]]:
+            # Details and listing are independent reads: one batch round trip.
+            responses, errors = self._execute_batch(
+                {
+                    "details": self._edits(service, "details").get(
+                        packageName=package_name, editId=edit_id
+                    ),
+                    "listing": self._edits(service, "listings").get(
+                        packageName=package_name, editId=edit_id, language=language
+                    ),
+                }
             )
+            if "details" in errors:
+                raise errors["details"]
+            # No listing in this language is not an error for app details.
+            return responses["details"], responses.get("listing") or {}
 
-            # Get listings for the specified language
-            try:
-                listing = self._execute(
-                    service.edits()
-                    .listings()
-                    .get(packageName=package_name, editId=edit_id, language=language)
-                )
-            except HttpError:
-                listing = {}
-
-            return AppDetails(
-                package_name=package_name,
-                title=listing.get("title"),
-                short_description=listing.get("shortDescription"),
-                full_description=listing.get("fullDescription"),
-                default_language=details.get("defaultLanguage"),
-                developer_name=None,  # edits.details API has no developer name field
-                developer_email=details.get("contactEmail"),
-                developer_website=details.get("contactWebsite"),
-            )
+        try:
+            details, listing = self._read_with_edit(package_name, read)
+            return _parse_app_details(package_name, details, listing)
         except HttpError as e:
             self._logger.exception("Failed to fetch app details", error=str(e))
             raise PlayStoreClientError(f"Failed to fetch app details: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
+
+    def get_app_details_many(
+        self, package_names: list[str], language: str = "en-US"
+    ) -> dict[str, AppDetails]:
+        """Get app details for several apps in batched round trips.
+
+        Like ``get_releases_many``: one edit per app, then every app's details
+        and listing, then the edit deletes, each step sent as one batch HTTP
+        request rather than one request per app.
+
+        Args:
+            package_names: App package names.
+            language: Language code for localized content.
+
+        Returns:
+            Mapping of package name to its app details.
+
+        Raises:
+            PlayStoreClientError: if any app's edit or details fetch fails.
+        """
+        self._logger.info("Fetching app details", package_names=package_names, language=language)
+        service = self._get_service()
+        package_names = list(dict.fromkeys(package_names))
+
+        with self._batch_edits(service, package_names, "fetch app details") as (edit_ids, failed):
+            requests: dict[str, Any] = {}
+            for package_name, edit_id in edit_ids.items():
+                requests[f"{package_name}/details"] = self._edits(service, "details").get(
+                    packageName=package_name, editId=edit_id
+                )
+                requests[f"{package_name}/listing"] = self._edits(service, "listings").get(
+                    packageName=package_name, editId=edit_id, language=language
+                )
+            responses, errors = self._execute_batch(requests)
+
+        # A missing listing is not an error for app details, as in get_app_details.
+        for package_name in edit_ids:
+            error = errors.get(f"{package_name}/details")
+            if error is not None:
+                failed[package_name] = error
+
+        if failed:
+            details = "; ".join(
+                f"{name}: {getattr(error, 'reason', error)}" for name, error in failed.items()
+            )
+            self._logger.error("Failed to fetch app details", failed=sorted(failed))
+            raise PlayStoreClientError(f"Failed to fetch app details: {details}")
+
+        return {
+            package_name: _parse_app_details(
+                package_name,
+                responses[f"{package_name}/details"],
+                responses.get(f"{package_name}/listing") or {},
+            )
+            for package_name in package_names
+        }
 
     # =========================================================================
     # Reviews API
@@ -1091,35 +1958,54 @@ class PlayStoreClient:
         Returns:
             List of reviews.
         """
-        self._logger.info(
-            "Fetching reviews",
-            package_name=package_name,
-            max_results=max_results,
+        if max_results <= 0:
+            return []
+        reviews = self.iter_reviews(
+            package_name,
+            page_size=min(max_results, 100),
+            translation_language=translation_language,
         )
+        return list(itertools.islice(reviews, max_results))
+
+    def iter_reviews(
+        self,
+        package_name: str,
+        page_size: int = 100,
+        translation_language: str | None = None,
+    ) -> Iterator[Review]:
+        """Yield app reviews page by page as they arrive.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early skips the remaining round trips.
+
+        Args:
+            package_name: App package name.
+            page_size: Reviews requested per page (the API caps pages at ~100).
+            translation_language: Language to translate reviews to.
+
+        Yields:
+            Reviews, newest first.
+        """
+        self._logger.info("Fetching reviews", package_name=package_name, page_size=page_size)
         service = self._get_service()
 
+        kwargs: dict[str, Any] = {"packageName": package_name, "maxResults": page_size}
+        if translation_language:
+            kwargs["translationLanguage"] = translation_language
         try:
-            reviews: list[Review] = []
-            # reviews.list paginates via tokenPagination.nextPageToken and caps
-            # each page at ~100; loop until max_results collected (or exhausted).
-            per_page = min(max_results, 100)
-            token: str | None = None
-            while len(reviews) < max_results:
-                kwargs: dict[str, Any] = {"packageName": package_name, "maxResults": per_page}
-                if translation_language:
-                    kwargs["translationLanguage"] = translation_language
-                if token:
-                    kwargs["token"] = token
-                result = self._execute(service.reviews().list(**kwargs))
+            reviews = self._resource(service, "reviews")
+            # reviews.list paginates via tokenPagination.nextPageToken rather
+            # than the top-level nextPageToken that list_next() expects.
+            while True:
+                result = self._execute(reviews.list(**kwargs))
                 for review_data in result.get("reviews", []):
                     review = _parse_review(review_data)
                     if review is not None:
-                        reviews.append(review)
+                        yield review
                 token = result.get("tokenPagination", {}).get("nextPageToken")
                 if not token:
-                    break
-
-            return reviews[:max_results]
+                    return
+                kwargs["token"] = token
 
         except HttpError as e:
             self._logger.exception("Failed to fetch reviews", error=str(e))
@@ -1148,7 +2034,7 @@ class PlayStoreClient:
             kwargs: dict[str, Any] = {"packageName": package_name, "reviewId": review_id}
             if translation_language:
                 kwargs["translationLanguage"] = translation_language
-            result = self._execute(service.reviews().get(**kwargs))
+            result = self._execute(self._resource(service, "reviews").get(**kwargs))
 
             review = _parse_review(result)
             if review is None:
@@ -1184,7 +2070,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.reviews().reply(
+                self._resource(service, "reviews").reply(
                     packageName=package_name,
                     reviewId=review_id,
                     body={"replyText": reply_text},
@@ -1210,6 +2096,7 @@ class PlayStoreClient:
     # Subscriptions API
     # =========================================================================
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def list_subscriptions(self, package_name: str) -> list[SubscriptionProduct]:
         """List subscription products for an app.
 
@@ -1223,31 +2110,37 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            subscriptions: list[SubscriptionProduct] = []
-            page_token: str | None = None
-            while True:
-                kwargs: dict[str, Any] = {"packageName": package_name}
-                if page_token:
-                    kwargs["pageToken"] = page_token
-                result = self._execute(service.monetization().subscriptions().list(**kwargs))
-                subscriptions.extend(
-                    SubscriptionProduct(
-                        product_id=sub_data.get("productId", ""),
-                        package_name=package_name,
-                        base_plans=sub_data.get("basePlans", []),
-                    )
-                    for sub_data in result.get("subscriptions", [])
+            first = self._execute(
+                self._resource(service, "monetization", "subscriptions").list(
+                    packageName=package_name, fields=_SUBSCRIPTION_LIST_FIELDS
                 )
-                page_token = result.get("nextPageToken")
-                if not page_token:
-                    break
-
-            return subscriptions
+            )
+            return self._subscription_pages(package_name, first)
 
         except HttpError as e:
             self._logger.exception("Failed to list subscriptions", error=str(e))
             raise PlayStoreClientError(f"Failed to list subscriptions: {e.reason}") from e
 
+    def _subscription_pages(
+        self, package_name: str, result: dict[str, Any]
+    ) -> list[SubscriptionProduct]:
+        """Parse a monetization.subscriptions.list page and fetch any pages after it."""
+        service = self._get_service()
+        subscriptions: list[SubscriptionProduct] = []
+        while True:
+            subscriptions.extend(
+                self._parse_subscription(package_name, sub_data)
+                for sub_data in result.get("subscriptions", [])
+            )
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return subscriptions
+            result = self._execute(
+                self._resource(service, "monetization", "subscriptions").list(
+                    packageName=package_name, pageToken=page_token, fields=_SUBSCRIPTION_LIST_FIELDS
+                )
+            )
+
     def get_subscription_purchase(
         self,
         package_name: str,
@@ -1274,7 +2167,9 @@ class PlayStoreClient:
         try:
             # Use v2 API for subscriptions
             result = self._execute(
-                service.purchases().subscriptionsv2().get(packageName=package_name, token=token)
+                self._resource(service, "purchases", "subscriptionsv2").get(
+                    packageName=package_name, token=token
+                )
             )
 
             line_items = result.get("lineItems", [])
@@ -1325,44 +2220,60 @@ class PlayStoreClient:
         Returns:
             List of voided purchases.
         """
+        if max_results <= 0:
+            return []
+        voided = self.iter_voided_purchases(package_name, page_size=max_results)
+        return list(itertools.islice(voided, max_results))
+
+    def iter_voided_purchases(
+        self, package_name: str, page_size: int = 100
+    ) -> Iterator[VoidedPurchase]:
+        """Yield voided purchases page by page as they arrive.
+
+        The next page is only requested once the caller has consumed the
+        current one, so stopping early skips the remaining round trips and
+        only one page is held in memory at a time.
+
+        Args:
+            package_name: App package name.
+            page_size: Voided purchases requested per page.
+
+        Yields:
+            Voided purchases.
+        """
         self._logger.info("Listing voided purchases", package_name=package_name)
         service = self._get_service()
 
         try:
-            voided: list[VoidedPurchase] = []
-            # voidedpurchases.list paginates via tokenPagination.nextPageToken;
-            # loop until max_results collected (or the results are exhausted).
-            token: str | None = None
-            while len(voided) < max_results:
-                kwargs: dict[str, Any] = {"packageName": package_name, "maxResults": max_results}
-                if token:
-                    kwargs["token"] = token
-                result = self._execute(service.purchases().voidedpurchases().list(**kwargs))
-                voided.extend(
-                    VoidedPurchase(
-                        package_name=package_name,
-                        purchase_token=purchase.get("purchaseToken", ""),
-                        order_id=purchase.get("orderId"),
-                        voided_reason=purchase.get("voidedReason"),
-                        voided_source=purchase.get("voidedSource"),
-                        voided_time=datetime.fromtimestamp(
-                            int(purchase.get("voidedTimeMillis")) / 1000, tz=UTC
-                        )
-                        if purchase.get("voidedTimeMillis")
-                        else None,
-                    )
-                    for purchase in result.get("voidedPurchases", [])
+            first = self._execute(
+                self._resource(service, "purchases", "voidedpurchases").list(
+                    packageName=package_name, maxResults=page_size
                 )
-                token = result.get("tokenPagination", {}).get("nextPageToken")
-                if not token:
-                    break
-
-            return voided[:max_results]
+            )
+            yield from self._voided_purchase_pages(package_name, first, page_size)
 
         except HttpError as e:
             self._logger.exception("Failed to list voided purchases", error=str(e))
             raise PlayStoreClientError(f"Failed to list voided purchases: {e.reason}") from e
 
+    def _voided_purchase_pages(
+        self, package_name: str, result: dict[str, Any], page_size: int
+    ) -> Iterator[VoidedPurchase]:
+        """Yield a purchases.voidedpurchases.list page, then fetch and yield later pages."""
+        service = self._get_service()
+        # voidedpurchases.list paginates via tokenPagination.nextPageToken.
+        while True:
+            for purchase in result.get("voidedPurchases", []):
+                yield _parse_voided_purchase(package_name, purchase)
+            token = result.get("tokenPagination", {}).get("nextPageToken")
+            if not token:
+                return
+            result = self._execute(
+                self._resource(service, "purchases", "voidedpurchases").list(
+                    packageName=package_name, maxResults=page_size, token=token
+                )
+            )
+
     def get_product_purchase(
         self,
         package_name: str,
@@ -1386,9 +2297,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.purchases()
-                .products()
-                .get(packageName=package_name, productId=product_id, token=token)
+                self._resource(service, "purchases", "products").get(
+                    packageName=package_name, productId=product_id, token=token
+                )
             )
 
             purchase_time = (
@@ -1442,9 +2353,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.purchases()
-                .products()
-                .acknowledge(
+                self._resource(service, "purchases", "products").acknowledge(
                     packageName=package_name,
                     productId=product_id,
                     token=token,
@@ -1488,9 +2397,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.purchases()
-                .products()
-                .consume(
+                self._resource(service, "purchases", "products").consume(
                     packageName=package_name,
                     productId=product_id,
                     token=token,
@@ -1531,7 +2438,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.orders().refund(packageName=package_name, orderId=order_id, revoke=revoke)
+                self._resource(service, "orders").refund(
+                    packageName=package_name, orderId=order_id, revoke=revoke
+                )
             )
 
             message = "Order refunded successfully"
@@ -1571,9 +2480,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.purchases()
-                .subscriptionsv2()
-                .cancel(
+                self._resource(service, "purchases", "subscriptionsv2").cancel(
                     packageName=package_name,
                     token=token,
                     body={"cancellationContext": {"cancellationType": cancellation_type}},
@@ -1615,9 +2522,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.purchases()
-                .subscriptionsv2()
-                .defer(
+                self._resource(service, "purchases", "subscriptionsv2").defer(
                     packageName=package_name,
                     token=token,
                     body={"deferralContext": {"deferDuration": defer_duration, "etag": etag}},
@@ -1665,9 +2570,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.purchases()
-                .subscriptionsv2()
-                .revoke(
+                self._resource(service, "purchases", "subscriptionsv2").revoke(
                     packageName=package_name,
                     token=token,
                     body={"revocationContext": _REVOCATION_CONTEXTS[refund_type]},
@@ -1705,9 +2608,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.purchases()
-                .productsv2()
-                .getproductpurchasev2(packageName=package_name, token=token)
+                self._resource(service, "purchases", "productsv2").getproductpurchasev2(
+                    packageName=package_name, token=token
+                )
             )
 
             return ProductPurchaseV2(
@@ -1757,28 +2660,11 @@ class PlayStoreClient:
             tracks=tracks,
         )
 
-        results: list[DeploymentResult] = []
-        successful = 0
-        failed = 0
-
-        for track in tracks:
-            rollout = 100.0
-            if rollout_percentages and track in rollout_percentages:
-                rollout = rollout_percentages[track]
-
-            result = self.deploy_app(
-                package_name=package_name,
-                track=track,
-                file_path=file_path,
-                release_notes=release_notes,
-                rollout_percentage=rollout,
-            )
-
-            results.append(result)
-            if result.success:
-                successful += 1
-            else:
-                failed += 1
+        results = self._deploy_to_tracks(
+            package_name, file_path, tracks, release_notes, rollout_percentages or {}
+        )
+        successful = sum(1 for result in results if result.success)
+        failed = len(results) - successful
 
         all_success = failed == 0
         message = f"Deployed to {successful}/{len(tracks)} tracks successfully"
@@ -1793,10 +2679,99 @@ class PlayStoreClient:
             message=message,
         )
 
+    def _deploy_to_tracks(
+        self,
+        package_name: str,
+        file_path: str,
+        tracks: list[str],
+        release_notes: str | dict[str, str] | None,
+        rollout_percentages: dict[str, float],
+    ) -> list[DeploymentResult]:
+        """Upload the artifact once and release it to every track in one edit.
+
+        A version code can only be uploaded once, so the tracks share one edit
+        holding one upload and are committed together. The track updates go
+        out as one batch request; a track whose update fails is reported as
+        failed without blocking the others.
+        """
+        if not tracks:
+            return []
+
+        file_size = _file_size(file_path)
+        if file_size is None:
+            return [
+                DeploymentResult(
+                    success=False,
+                    package_name=package_name,
+                    track=track,
+                    message=f"File not found: {file_path}",
+                    error="FileNotFoundError",
+                )
+                for track in tracks
+            ]
+
+        service = self._get_service()
+        with self._edit_txn(package_name) as txn:
+            try:
+                version_code = self._upload_artifact(
+                    service, package_name, txn.edit_id, file_path, file_size
+                )
+
+                # The track updates are independent of each other, so they
+                # share one batch round trip; the commit follows on its own.
+                tracks_resource = self._edits(service, "tracks")
+                _, errors = self._execute_batch(
+                    {
+                        track: tracks_resource.update(
+                            packageName=package_name,
+                            editId=txn.edit_id,
+                            track=track,
+                            body={
+                                "releases": [
+                                    _release_body(
+                                        version_code,
+                                        rollout_percentages.get(track, 100.0),
+                                        release_notes,
+                                        "en-US",
+                                    )
+                                ]
+                            },
+                        )
+                        for track in tracks
+                    }
+                )
+                if errors:
+                    self._logger.error("Track update failed", failed=sorted(errors))
+
+                if len(errors) < len(tracks):
+                    self._commit_edit(package_name, txn.edit_id)
+                    txn.committed = True
+
+            except Exception as e:
+                self._logger.exception("Deployment failed", error=str(e))
+                return [
+                    self._release_failure("Deployment", package_name, track, e) for track in tracks
+                ]
+
+        return [
+            self._release_failure("Deployment", package_name, track, errors[track])
+            if track in errors
+            else DeploymentResult(
+                success=True,
+                edit_id=txn.edit_id,
+                package_name=package_name,
+                track=track,
+                version_code=version_code,
+                message=f"Successfully deployed version {version_code} to {track}",
+            )
+            for track in tracks
+        ]
+
     # =========================================================================
     # In-App Products API
     # =========================================================================
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def list_in_app_products(self, package_name: str) -> list[InAppProduct]:
         """List in-app products for an app.
 
@@ -1810,29 +2785,168 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            products: list[InAppProduct] = []
-            # inappproducts.list paginates via tokenPagination.nextPageToken
-            # (the older shape), not a top-level nextPageToken.
-            token: str | None = None
-            while True:
-                kwargs: dict[str, Any] = {"packageName": package_name}
-                if token:
-                    kwargs["token"] = token
-                result = self._execute(service.inappproducts().list(**kwargs))
-                products.extend(
-                    self._parse_in_app_product(package_name, product_data)
-                    for product_data in result.get("inappproduct", [])
+            first = self._execute(
+                self._resource(service, "inappproducts").list(
+                    packageName=package_name, fields=_IN_APP_PRODUCT_LIST_FIELDS
                 )
-                token = result.get("tokenPagination", {}).get("nextPageToken")
-                if not token:
-                    break
-
-            return products
+            )
+            return self._in_app_product_pages(package_name, first)
 
         except HttpError as e:
             self._logger.exception("Failed to list in-app products", error=str(e))
             raise PlayStoreClientError(f"Failed to list in-app products: {e.reason}") from e
 
+    def _in_app_product_pages(
+        self, package_name: str, result: dict[str, Any]
+    ) -> list[InAppProduct]:
+        """Parse an inappproducts.list page and fetch any pages after it."""
+        service = self._get_service()
+        products: list[InAppProduct] = []
+        # inappproducts.list paginates via tokenPagination.nextPageToken
+        # (the older shape), not a top-level nextPageToken.
+        while True:
+            products.extend(
+                self._parse_in_app_product(package_name, product_data)
+                for product_data in result.get("inappproduct", [])
+            )
+            token = result.get("tokenPagination", {}).get("nextPageToken")
+            if not token:
+                return products
+            result = self._execute(
+                self._resource(service, "inappproducts").list(
+                    packageName=package_name, token=token, fields=_IN_APP_PRODUCT_LIST_FIELDS
+                )
+            )
+
+    def get_catalog(self, package_name: str, max_voided_purchases: int = 100) -> ProductCatalog:
+        """Get an app's subscriptions, in-app products and voided purchases together.
+
+        The first page of each list is fetched in one batch HTTP request
+        instead of three round trips; any further pages are fetched as in
+        ``list_subscriptions``, ``list_in_app_products`` and
+        ``list_voided_purchases``.
+
+        Args:
+            package_name: App package name.
+            max_voided_purchases: Maximum voided purchases to return; 0 (or
+                less) skips the voided purchases request.
+
+        Returns:
+            The app's product catalog.
+
+        Raises:
+            PlayStoreClientError: if any of the three lists fails.
+        """
+        self._logger.info("Fetching product catalog", package_name=package_name)
+        service = self._get_service()
+
+        requests: dict[str, Any] = {
+            "subscriptions": self._resource(service, "monetization", "subscriptions").list(
+                packageName=package_name, fields=_SUBSCRIPTION_LIST_FIELDS
+            ),
+            "in_app_products": self._resource(service, "inappproducts").list(
+                packageName=package_name, fields=_IN_APP_PRODUCT_LIST_FIELDS
+            ),
+        }
+        if max_voided_purchases > 0:
+            requests["voided_purchases"] = self._resource(
+                service, "purchases", "voidedpurchases"
+            ).list(packageName=package_name, maxResults=max_voided_purchases)
+
+        try:
+            responses, errors = self._execute_batch(requests)
+            if errors:
+                details = "; ".join(
+                    f"{name}: {getattr(error, 'reason', error)}" for name, error in errors.items()
+                )
+                self._logger.error("Failed to fetch product catalog", failed=sorted(errors))
+                raise PlayStoreClientError(f"Failed to fetch product catalog: {details}")
+
+            return ProductCatalog(
+                package_name=package_name,
+                subscriptions=self._subscription_pages(package_name, responses["subscriptions"]),
+                in_app_products=self._in_app_product_pages(
+                    package_name, responses["in_app_products"]
+                ),
+                voided_purchases=list(
+                    itertools.islice(
+                        self._voided_purchase_pages(
+                            package_name, responses["voided_purchases"], max_voided_purchases
+                        ),
+                        max_voided_purchases,
+                    )
+                )
+                if max_voided_purchases > 0
+                else [],
+            )
+
+        except HttpError as e:
+            self._logger.exception("Failed to fetch product catalog", error=str(e))
+            raise PlayStoreClientError(f"Failed to fetch product catalog: {e.reason}") from e
+
+    def batch_get(self, items: list[dict[str, str]]) -> list[BatchGetResult]:
+        """Fetch several resources, of any supported kind and app, in batched round trips.
+
+        Args:
+            items: Lookups, each ``{"kind", "package_name", "id"}``, where kind
+                is one of ``_BATCH_GET_KINDS``.
+
+        Returns:
+            One result per item, in order; a failed lookup carries its error
+            instead of failing the whole call.
+
+        Raises:
+            PlayStoreClientError: if an item is malformed or the batch itself fails.
+        """
+        self._logger.info("Batch getting resources", count=len(items))
+        parsers: dict[str, Callable[[str, dict[str, Any]], Any]] = {
+            "in_app_product": self._parse_in_app_product,
+            "subscription": self._parse_subscription,
+            "one_time_product": self._parse_one_time_product,
+            "order": self._parse_order,
+        }
+        for item in items:
+            if item.get("kind") not in _BATCH_GET_KINDS or not (
+                item.get("package_name") and item.get("id")
+            ):
+                raise PlayStoreClientError(
+                    f"Invalid batch_get item {item!r}: expected kind (one of "
+                    f"{', '.join(_BATCH_GET_KINDS)}), package_name and id"
+                )
+        service = self._get_service()
+
+        requests: dict[str, Any] = {}
+        for index, item in enumerate(items):
+            path, id_param = _BATCH_GET_KINDS[item["kind"]]
+            requests[str(index)] = self._resource(service, *path).get(
+                packageName=item["package_name"], **{id_param: item["id"]}
+            )
+        try:
+            responses, errors = self._execute_batch(requests)
+        except HttpError as e:
+            self._logger.exception("Failed to batch get resources", error=str(e))
+            raise PlayStoreClientError(f"Failed to batch get resources: {e.reason}") from e
+
+        results: list[BatchGetResult] = []
+        for index, item in enumerate(items):
+            kind, package_name = item["kind"], item["package_name"]
+            error = errors.get(str(index))
+            results.append(
+                BatchGetResult(
+                    kind=kind,
+                    package_name=package_name,
+                    resource_id=item["id"],
+                    result=None
+                    if error is not None
+                    else parsers[kind](package_name, responses[str(index)]),
+                    error=None if error is None else str(getattr(error, "reason", error)),
+                )
+            )
+        if errors:
+            self._logger.error("Batch get lookups failed", failed=len(errors))
+        return results
+
+    @_cached_response(_CACHE_TTL_CATALOG)
     def get_in_app_product(self, package_name: str, sku: str) -> InAppProduct:
         """Get details of a specific in-app product.
 
@@ -1848,7 +2962,7 @@ class PlayStoreClient:
 
         try:
             product_data = self._execute(
-                service.inappproducts().get(packageName=package_name, sku=sku)
+                self._resource(service, "inappproducts").get(packageName=package_name, sku=sku)
             )
             return self._parse_in_app_product(package_name, product_data)
 
@@ -1859,24 +2973,19 @@ class PlayStoreClient:
     @staticmethod
     def _parse_in_app_product(package_name: str, product_data: dict[str, Any]) -> InAppProduct:
         """Parse an InappProduct API resource into an InAppProduct model."""
-        # Get default price if available
-        default_price = None
-        if "defaultPrice" in product_data:
-            default_price = product_data["defaultPrice"]
-
-        # Get localized listings
-        listings = product_data.get("listings", {})
-        default_listing = listings.get(product_data.get("defaultLanguage", "en-US"), {})
+        default_language = product_data.get("defaultLanguage")
+        listing_language = "en-US" if default_language is None else default_language
+        default_listing = product_data.get("listings", {}).get(listing_language, {})
 
         return InAppProduct(
             sku=product_data.get("sku", ""),
             package_name=package_name,
             product_type=product_data.get("purchaseType", "managedProduct"),
             status=product_data.get("status"),
-            default_language=product_data.get("defaultLanguage"),
+            default_language=default_language,
             title=default_listing.get("title"),
             description=default_listing.get("description"),
-            default_price=default_price,
+            default_price=product_data.get("defaultPrice"),
         )
 
     def create_in_app_product(self, package_name: str, product: dict[str, Any]) -> InAppProduct:
@@ -1894,7 +3003,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.inappproducts().insert(packageName=package_name, body=product)
+                self._resource(service, "inappproducts").insert(
+                    packageName=package_name, body=product
+                )
             )
             return self._parse_in_app_product(package_name, result)
 
@@ -1926,7 +3037,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.inappproducts().update(
+                self._resource(service, "inappproducts").update(
                     packageName=package_name,
                     sku=sku,
                     autoConvertMissingPrices=auto_convert_missing_prices,
@@ -1957,7 +3068,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.inappproducts().patch(packageName=package_name, sku=sku, body=product)
+                self._resource(service, "inappproducts").patch(
+                    packageName=package_name, sku=sku, body=product
+                )
             )
             return self._parse_in_app_product(package_name, result)
 
@@ -1979,7 +3092,9 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            self._execute(service.inappproducts().delete(packageName=package_name, sku=sku))
+            self._execute(
+                self._resource(service, "inappproducts").delete(packageName=package_name, sku=sku)
+            )
 
             return InAppProductActionResult(
                 success=True,
@@ -2009,7 +3124,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.inappproducts().batchGet(packageName=package_name, sku=skus)
+                self._resource(service, "inappproducts").batchGet(
+                    packageName=package_name, sku=skus
+                )
             )
 
             return [
@@ -2040,7 +3157,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.inappproducts().batchDelete(
+                self._resource(service, "inappproducts").batchDelete(
                     packageName=package_name,
                     body={"requests": [{"packageName": package_name, "sku": s} for s in skus]},
                 )
@@ -2090,9 +3207,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .get(packageName=package_name, productId=product_id)
+                self._resource(service, "monetization", "onetimeproducts").get(
+                    packageName=package_name, productId=product_id
+                )
             )
             return self._parse_one_time_product(package_name, data)
 
@@ -2119,7 +3236,9 @@ class PlayStoreClient:
                 kwargs: dict[str, Any] = {"packageName": package_name}
                 if page_token:
                     kwargs["pageToken"] = page_token
-                result = self._execute(service.monetization().onetimeproducts().list(**kwargs))
+                result = self._execute(
+                    self._resource(service, "monetization", "onetimeproducts").list(**kwargs)
+                )
                 products.extend(
                     self._parse_one_time_product(package_name, data)
                     for data in result.get("oneTimeProducts", [])
@@ -2153,9 +3272,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .batchGet(packageName=package_name, productIds=product_ids)
+                self._resource(service, "monetization", "onetimeproducts").batchGet(
+                    packageName=package_name, productIds=product_ids
+                )
             )
 
             return [
@@ -2194,9 +3313,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .patch(
+                self._resource(service, "monetization", "onetimeproducts").patch(
                     packageName=package_name,
                     productId=product_id,
                     updateMask=update_mask,
@@ -2229,9 +3346,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .delete(packageName=package_name, productId=product_id)
+                self._resource(service, "monetization", "onetimeproducts").delete(
+                    packageName=package_name, productId=product_id
+                )
             )
 
             return OneTimeProductActionResult(
@@ -2264,9 +3381,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .batchUpdate(packageName=package_name, body={"requests": requests})
+                self._resource(service, "monetization", "onetimeproducts").batchUpdate(
+                    packageName=package_name, body={"requests": requests}
+                )
             )
 
             return [
@@ -2299,9 +3416,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .batchDelete(packageName=package_name, body={"requests": requests})
+                self._resource(service, "monetization", "onetimeproducts").batchDelete(
+                    packageName=package_name, body={"requests": requests}
+                )
             )
 
             return OneTimeProductActionResult(
@@ -2344,10 +3461,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .batchDelete(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions"
+                ).batchDelete(
                     packageName=package_name,
                     productId=product_id,
                     body={"requests": requests},
@@ -2391,10 +3507,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .batchUpdateStates(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions"
+                ).batchUpdateStates(
                     packageName=package_name,
                     productId=product_id,
                     body={"requests": requests},
@@ -2464,11 +3579,9 @@ class PlayStoreClient:
                 if page_token:
                     kwargs["pageToken"] = page_token
                 result = self._execute(
-                    service.monetization()
-                    .onetimeproducts()
-                    .purchaseOptions()
-                    .offers()
-                    .list(**kwargs)
+                    self._resource(
+                        service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                    ).list(**kwargs)
                 )
                 offers.extend(
                     self._parse_one_time_product_offer(offer)
@@ -2513,11 +3626,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .batchGet(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).batchGet(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2560,11 +3671,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .activate(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).activate(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2610,11 +3719,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .deactivate(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).deactivate(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2660,11 +3767,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .cancel(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).cancel(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2712,11 +3817,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .batchUpdate(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).batchUpdate(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2764,11 +3867,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .batchUpdateStates(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).batchUpdateStates(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2817,11 +3918,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .onetimeproducts()
-                .purchaseOptions()
-                .offers()
-                .batchDelete(
+                self._resource(
+                    service, "monetization", "onetimeproducts", "purchaseOptions", "offers"
+                ).batchDelete(
                     packageName=package_name,
                     productId=product_id,
                     purchaseOptionId=purchase_option_id,
@@ -2871,9 +3970,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.monetization()
-                .subscriptions()
-                .get(packageName=package_name, productId=product_id)
+                self._resource(service, "monetization", "subscriptions").get(
+                    packageName=package_name, productId=product_id
+                )
             )
             return self._parse_subscription(package_name, data)
 
@@ -2904,9 +4003,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .create(
+                self._resource(service, "monetization", "subscriptions").create(
                     packageName=package_name,
                     productId=product_id,
                     regionsVersion_version=regions_version,
@@ -2944,9 +4041,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .patch(
+                self._resource(service, "monetization", "subscriptions").patch(
                     packageName=package_name,
                     productId=product_id,
                     updateMask=update_mask,
@@ -2975,9 +4070,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .subscriptions()
-                .delete(packageName=package_name, productId=product_id)
+                self._resource(service, "monetization", "subscriptions").delete(
+                    packageName=package_name, productId=product_id
+                )
             )
 
             return SubscriptionCatalogResult(
@@ -3010,9 +4105,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .batchGet(packageName=package_name, productIds=product_ids)
+                self._resource(service, "monetization", "subscriptions").batchGet(
+                    packageName=package_name, productIds=product_ids
+                )
             )
 
             return [
@@ -3043,9 +4138,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .batchUpdate(packageName=package_name, body={"requests": requests})
+                self._resource(service, "monetization", "subscriptions").batchUpdate(
+                    packageName=package_name, body={"requests": requests}
+                )
             )
 
             return [
@@ -3084,10 +4179,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .activate(
+                self._resource(service, "monetization", "subscriptions", "basePlans").activate(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3127,10 +4219,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .deactivate(
+                self._resource(service, "monetization", "subscriptions", "basePlans").deactivate(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3170,10 +4259,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .delete(
+                self._resource(service, "monetization", "subscriptions", "basePlans").delete(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3219,10 +4305,7 @@ class PlayStoreClient:
 
         try:
             result: dict[str, Any] = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .migratePrices(
+                self._resource(service, "monetization", "subscriptions", "basePlans").migratePrices(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3261,10 +4344,9 @@ class PlayStoreClient:
 
         try:
             result: dict[str, Any] = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .batchMigratePrices(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans"
+                ).batchMigratePrices(
                     packageName=package_name,
                     productId=product_id,
                     body={"requests": requests},
@@ -3305,10 +4387,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .batchUpdateStates(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans"
+                ).batchUpdateStates(
                     packageName=package_name,
                     productId=product_id,
                     body={"requests": requests},
@@ -3370,11 +4451,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .get(
+                self._resource(service, "monetization", "subscriptions", "basePlans", "offers").get(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3420,7 +4497,9 @@ class PlayStoreClient:
                 if page_token:
                     kwargs["pageToken"] = page_token
                 result = self._execute(
-                    service.monetization().subscriptions().basePlans().offers().list(**kwargs)
+                    self._resource(
+                        service, "monetization", "subscriptions", "basePlans", "offers"
+                    ).list(**kwargs)
                 )
                 offers.extend(
                     self._parse_subscription_offer(offer)
@@ -3469,11 +4548,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .create(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).create(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3523,11 +4600,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .patch(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).patch(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3568,11 +4643,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .activate(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).activate(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3616,11 +4689,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .deactivate(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).deactivate(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3666,11 +4737,9 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .delete(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).delete(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3718,11 +4787,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .batchGet(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).batchGet(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3769,11 +4836,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .batchUpdate(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).batchUpdate(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3822,11 +4887,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.monetization()
-                .subscriptions()
-                .basePlans()
-                .offers()
-                .batchUpdateStates(
+                self._resource(
+                    service, "monetization", "subscriptions", "basePlans", "offers"
+                ).batchUpdateStates(
                     packageName=package_name,
                     productId=product_id,
                     basePlanId=base_plan_id,
@@ -3848,6 +4911,7 @@ class PlayStoreClient:
     # Store Listings API
     # =========================================================================
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def get_listing(self, package_name: str, language: str = "en-US") -> Listing:
         """Get store listing for a specific language.
 
@@ -3860,13 +4924,15 @@ class PlayStoreClient:
         """
         self._logger.info("Getting store listing", package_name=package_name, language=language)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            listing_data = self._execute(
-                service.edits()
-                .listings()
-                .get(packageName=package_name, editId=edit_id, language=language)
+            listing_data = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "listings").get(
+                        packageName=package_name, editId=edit_id, language=language
+                    )
+                ),
             )
 
             return Listing(
@@ -3879,8 +4945,6 @@ class PlayStoreClient:
         except HttpError as e:
             self._logger.exception("Failed to get store listing", error=str(e))
             raise PlayStoreClientError(f"Failed to get store listing: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     def update_listing(
         self,
@@ -3912,9 +4976,9 @@ class PlayStoreClient:
             # Get current listing
             try:
                 current_listing = self._execute(
-                    service.edits()
-                    .listings()
-                    .get(packageName=package_name, editId=edit_id, language=language)
+                    self._edits(service, "listings").get(
+                        packageName=package_name, editId=edit_id, language=language
+                    )
                 )
             except HttpError:
                 current_listing = {}
@@ -3939,11 +5003,21 @@ class PlayStoreClient:
             if video is not None:
                 update_body["video"] = video
 
+            # Nothing to change: skip the update and commit round trips.
+            if current_listing and all(
+                current_listing.get(field, "") == value for field, value in update_body.items()
+            ):
+                self._delete_edit(package_name, edit_id)
+                return ListingUpdateResult(
+                    success=True,
+                    package_name=package_name,
+                    language=language,
+                    message=f"Listing for {language} is already up to date",
+                )
+
             # Update listing
             self._execute(
-                service.edits()
-                .listings()
-                .update(
+                self._edits(service, "listings").update(
                     packageName=package_name,
                     editId=edit_id,
                     language=language,
@@ -3981,6 +5055,7 @@ class PlayStoreClient:
                 error=str(e),
             )
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def list_all_listings(self, package_name: str) -> list[Listing]:
         """List all store listings for all languages.
 
@@ -3992,11 +5067,13 @@ class PlayStoreClient:
         """
         self._logger.info("Listing all store listings", package_name=package_name)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            result = self._execute(
-                service.edits().listings().list(packageName=package_name, editId=edit_id)
+            result = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "listings").list(packageName=package_name, editId=edit_id)
+                ),
             )
 
             listings: list[Listing] = [
@@ -4014,13 +5091,26 @@ class PlayStoreClient:
         except HttpError as e:
             self._logger.exception("Failed to list store listings", error=str(e))
             raise PlayStoreClientError(f"Failed to list store listings: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
+
+    def list_all_listings_by_language(self, package_name: str) -> dict[str, Listing]:
+        """Map each language code to its store listing.
+
+        Built from ``list_all_listings`` (and its cache) for callers that look
+        listings up by language instead of scanning the list.
+
+        Args:
+            package_name: App package name.
+
+        Returns:
+            Store listings keyed by language code.
+        """
+        return {listing.language: listing for listing in self.list_all_listings(package_name)}
 
     # =========================================================================
     # Testers API
     # =========================================================================
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def get_testers(self, package_name: str, track: str) -> TesterInfo:
         """Get testers for a specific track.
 
@@ -4033,11 +5123,15 @@ class PlayStoreClient:
         """
         self._logger.info("Getting testers", package_name=package_name, track=track)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            testers_data = self._execute(
-                service.edits().testers().get(packageName=package_name, editId=edit_id, track=track)
+            testers_data = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "testers").get(
+                        packageName=package_name, editId=edit_id, track=track
+                    )
+                ),
             )
 
             return TesterInfo(
@@ -4050,8 +5144,6 @@ class PlayStoreClient:
                 # No testers configured
                 return TesterInfo(track=track, google_groups=[])
             raise PlayStoreClientError(f"Failed to get testers: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     def update_testers(
         self,
@@ -4080,9 +5172,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.edits()
-                .testers()
-                .update(
+                self._edits(service, "testers").update(
                     packageName=package_name,
                     editId=edit_id,
                     track=track,
@@ -4132,6 +5222,7 @@ class PlayStoreClient:
             create_time=_parse_rfc3339(order_data.get("createTime")),
         )
 
+    @_cached_response(_CACHE_TTL_ORDERS)
     def get_order(self, package_name: str, order_id: str) -> Order:
         """Get order details.
 
@@ -4147,7 +5238,7 @@ class PlayStoreClient:
 
         try:
             order_data = self._execute(
-                service.orders().get(packageName=package_name, orderId=order_id)
+                self._resource(service, "orders").get(packageName=package_name, orderId=order_id)
             )
 
             order = self._parse_order(package_name, order_data)
@@ -4176,7 +5267,9 @@ class PlayStoreClient:
         try:
             # NOTE: googleapiclient method is lowercase "batchget" (per the discovery doc).
             result = self._execute(
-                service.orders().batchget(packageName=package_name, orderIds=order_ids)
+                self._resource(service, "orders").batchget(
+                    packageName=package_name, orderIds=order_ids
+                )
             )
 
             return [
@@ -4192,6 +5285,7 @@ class PlayStoreClient:
     # Expansion Files API
     # =========================================================================
 
+    @_cached_response(_CACHE_TTL_CATALOG)
     def get_expansion_file(
         self,
         package_name: str,
@@ -4215,18 +5309,18 @@ class PlayStoreClient:
             type=expansion_file_type,
         )
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            expansion_data = self._execute(
-                service.edits()
-                .expansionfiles()
-                .get(
-                    packageName=package_name,
-                    editId=edit_id,
-                    apkVersionCode=version_code,
-                    expansionFileType=expansion_file_type,
-                )
+            expansion_data = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "expansionfiles").get(
+                        packageName=package_name,
+                        editId=edit_id,
+                        apkVersionCode=version_code,
+                        expansionFileType=expansion_file_type,
+                    )
+                ),
             )
 
             return ExpansionFile(
@@ -4245,8 +5339,6 @@ class PlayStoreClient:
                 )
             self._logger.exception("Failed to get expansion file", error=str(e))
             raise PlayStoreClientError(f"Failed to get expansion file: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     # =========================================================================
     # Edit Uploads API (apks, bundles, deobfuscation files, expansion files)
@@ -4263,11 +5355,13 @@ class PlayStoreClient:
         """
         self._logger.info("Listing APKs", package_name=package_name)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            result = self._execute(
-                service.edits().apks().list(packageName=package_name, editId=edit_id)
+            result = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "apks").list(packageName=package_name, editId=edit_id)
+                ),
             )
             apks: list[Apk] = []
             for apk_data in result.get("apks", []):
@@ -4284,8 +5378,6 @@ class PlayStoreClient:
         except HttpError as e:
             self._logger.exception("Failed to list APKs", error=str(e))
             raise PlayStoreClientError(f"Failed to list APKs: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     def list_bundles(self, package_name: str) -> list[Bundle]:
         """List the app bundles currently attached to a new edit.
@@ -4298,11 +5390,13 @@ class PlayStoreClient:
         """
         self._logger.info("Listing bundles", package_name=package_name)
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            result = self._execute(
-                service.edits().bundles().list(packageName=package_name, editId=edit_id)
+            result = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "bundles").list(packageName=package_name, editId=edit_id)
+                ),
             )
             return [
                 Bundle(
@@ -4316,8 +5410,6 @@ class PlayStoreClient:
         except HttpError as e:
             self._logger.exception("Failed to list bundles", error=str(e))
             raise PlayStoreClientError(f"Failed to list bundles: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     def upload_apk(self, package_name: str, apk_path: str) -> Apk:
         """Upload an APK to a new edit and commit it.
@@ -4334,15 +5426,15 @@ class PlayStoreClient:
         edit_id = self._create_edit(package_name)
 
         try:
-            media = MediaFileUpload(
+            media = _lazy("MediaFileUpload")(
                 apk_path,
                 mimetype="application/vnd.android.package-archive",
                 resumable=True,
             )
             data = self._execute(
-                service.edits()
-                .apks()
-                .upload(packageName=package_name, editId=edit_id, media_body=media)
+                self._edits(service, "apks").upload(
+                    packageName=package_name, editId=edit_id, media_body=media
+                )
             )
             self._commit_edit(package_name, edit_id)
             binary = data.get("binary") or {}
@@ -4376,15 +5468,15 @@ class PlayStoreClient:
         edit_id = self._create_edit(package_name)
 
         try:
-            media = MediaFileUpload(
+            media = _lazy("MediaFileUpload")(
                 bundle_path,
                 mimetype="application/octet-stream",
                 resumable=True,
             )
             data = self._execute(
-                service.edits()
-                .bundles()
-                .upload(packageName=package_name, editId=edit_id, media_body=media)
+                self._edits(service, "bundles").upload(
+                    packageName=package_name, editId=edit_id, media_body=media
+                )
             )
             self._commit_edit(package_name, edit_id)
             return Bundle(
@@ -4430,11 +5522,11 @@ class PlayStoreClient:
         edit_id = self._create_edit(package_name)
 
         try:
-            media = MediaFileUpload(file_path, mimetype="application/octet-stream", resumable=True)
+            media = _lazy("MediaFileUpload")(
+                file_path, mimetype="application/octet-stream", resumable=True
+            )
             data = self._execute(
-                service.edits()
-                .deobfuscationfiles()
-                .upload(
+                self._edits(service, "deobfuscationfiles").upload(
                     packageName=package_name,
                     editId=edit_id,
                     apkVersionCode=version_code,
@@ -4486,11 +5578,11 @@ class PlayStoreClient:
         edit_id = self._create_edit(package_name)
 
         try:
-            media = MediaFileUpload(file_path, mimetype="application/octet-stream", resumable=True)
+            media = _lazy("MediaFileUpload")(
+                file_path, mimetype="application/octet-stream", resumable=True
+            )
             data = self._execute(
-                service.edits()
-                .expansionfiles()
-                .upload(
+                self._edits(service, "expansionfiles").upload(
                     packageName=package_name,
                     editId=edit_id,
                     apkVersionCode=version_code,
@@ -4560,18 +5652,18 @@ class PlayStoreClient:
             image_type=image_type,
         )
         service = self._get_service()
-        edit_id = self._create_edit(package_name)
 
         try:
-            result = self._execute(
-                service.edits()
-                .images()
-                .list(
-                    packageName=package_name,
-                    editId=edit_id,
-                    language=language,
-                    imageType=image_type,
-                )
+            result = self._read_with_edit(
+                package_name,
+                lambda edit_id: self._execute(
+                    self._edits(service, "images").list(
+                        packageName=package_name,
+                        editId=edit_id,
+                        language=language,
+                        imageType=image_type,
+                    )
+                ),
             )
             return [
                 self._parse_app_image(package_name, language, image_type, image_data)
@@ -4580,8 +5672,6 @@ class PlayStoreClient:
         except HttpError as e:
             self._logger.exception("Failed to list images", error=str(e))
             raise PlayStoreClientError(f"Failed to list images: {e.reason}") from e
-        finally:
-            self._delete_edit(package_name, edit_id)
 
     def upload_image(
         self,
@@ -4613,11 +5703,9 @@ class PlayStoreClient:
 
         try:
             mimetype = "image/png" if image_path.lower().endswith(".png") else "image/jpeg"
-            media = MediaFileUpload(image_path, mimetype=mimetype, resumable=True)
+            media = _lazy("MediaFileUpload")(image_path, mimetype=mimetype, resumable=True)
             data = self._execute(
-                service.edits()
-                .images()
-                .upload(
+                self._edits(service, "images").upload(
                     packageName=package_name,
                     editId=edit_id,
                     language=language,
@@ -4667,9 +5755,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.edits()
-                .images()
-                .delete(
+                self._edits(service, "images").delete(
                     packageName=package_name,
                     editId=edit_id,
                     language=language,
@@ -4722,9 +5808,7 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.edits()
-                .images()
-                .deleteall(
+                self._edits(service, "images").deleteall(
                     packageName=package_name,
                     editId=edit_id,
                     language=language,
@@ -4798,7 +5882,9 @@ class PlayStoreClient:
         name = f"applications/{package_name}/externalTransactions/{external_transaction_id}"
 
         try:
-            data = self._execute(service.externaltransactions().getexternaltransaction(name=name))
+            data = self._execute(
+                self._resource(service, "externaltransactions").getexternaltransaction(name=name)
+            )
             return self._parse_external_transaction(package_name, external_transaction_id, data)
 
         except HttpError as e:
@@ -4831,7 +5917,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.externaltransactions().createexternaltransaction(
+                self._resource(service, "externaltransactions").createexternaltransaction(
                     parent=parent,
                     externalTransactionId=external_transaction_id,
                     body=transaction,
@@ -4870,7 +5956,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.externaltransactions().refundexternaltransaction(name=name, body=refund)
+                self._resource(service, "externaltransactions").refundexternaltransaction(
+                    name=name, body=refund
+                )
             )
             return self._parse_external_transaction(package_name, external_transaction_id, data)
 
@@ -4916,9 +6004,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.applications()
-                .deviceTierConfigs()
-                .get(packageName=package_name, deviceTierConfigId=device_tier_config_id)
+                self._resource(service, "applications", "deviceTierConfigs").get(
+                    packageName=package_name, deviceTierConfigId=device_tier_config_id
+                )
             )
             return self._parse_device_tier_config(package_name, data)
 
@@ -4945,7 +6033,9 @@ class PlayStoreClient:
                 kwargs: dict[str, Any] = {"packageName": package_name}
                 if page_token:
                     kwargs["pageToken"] = page_token
-                result = self._execute(service.applications().deviceTierConfigs().list(**kwargs))
+                result = self._execute(
+                    self._resource(service, "applications", "deviceTierConfigs").list(**kwargs)
+                )
                 configs.extend(
                     self._parse_device_tier_config(package_name, config_data)
                     for config_data in result.get("deviceTierConfigs", [])
@@ -4983,9 +6073,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.applications()
-                .deviceTierConfigs()
-                .create(
+                self._resource(service, "applications", "deviceTierConfigs").create(
                     packageName=package_name,
                     allowUnknownDevices=allow_unknown_devices,
                     body=config,
@@ -5057,7 +6145,7 @@ class PlayStoreClient:
                 kwargs: dict[str, Any] = {"parent": parent}
                 if page_token:
                     kwargs["pageToken"] = page_token
-                result = self._execute(service.users().list(**kwargs))
+                result = self._execute(self._resource(service, "users").list(**kwargs))
                 users.extend(
                     self._parse_user(developer_id, user_data)
                     for user_data in result.get("users", [])
@@ -5088,7 +6176,7 @@ class PlayStoreClient:
         parent = f"developers/{developer_id}"
 
         try:
-            data = self._execute(service.users().create(parent=parent, body=user))
+            data = self._execute(self._resource(service, "users").create(parent=parent, body=user))
             return self._parse_user(developer_id, data)
 
         except HttpError as e:
@@ -5120,7 +6208,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.users().patch(name=name, updateMask=update_mask, body=user)
+                self._resource(service, "users").patch(name=name, updateMask=update_mask, body=user)
             )
             return self._parse_user(developer_id, data)
 
@@ -5143,7 +6231,7 @@ class PlayStoreClient:
         name = f"developers/{developer_id}/users/{email}"
 
         try:
-            self._execute(service.users().delete(name=name))
+            self._execute(self._resource(service, "users").delete(name=name))
 
             return AccessResult(
                 success=True,
@@ -5170,7 +6258,9 @@ class PlayStoreClient:
         parent = f"developers/{developer_id}/users/{email}"
 
         try:
-            data = self._execute(service.grants().create(parent=parent, body=grant))
+            data = self._execute(
+                self._resource(service, "grants").create(parent=parent, body=grant)
+            )
             return self._parse_grant(developer_id, email, data)
 
         except HttpError as e:
@@ -5209,7 +6299,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.grants().patch(name=name, updateMask=update_mask, body=grant)
+                self._resource(service, "grants").patch(
+                    name=name, updateMask=update_mask, body=grant
+                )
             )
             return self._parse_grant(developer_id, email, data)
 
@@ -5238,7 +6330,7 @@ class PlayStoreClient:
         name = f"developers/{developer_id}/users/{email}/grants/{package_name}"
 
         try:
-            self._execute(service.grants().delete(name=name))
+            self._execute(self._resource(service, "grants").delete(name=name))
 
             return AccessResult(
                 success=True,
@@ -5273,7 +6365,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.applications().dataSafety(
+                self._resource(service, "applications").dataSafety(
                     packageName=package_name,
                     body=safety_labels,
                 )
@@ -5321,7 +6413,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.apprecovery().list(packageName=package_name, versionCode=version_code)
+                self._resource(service, "apprecovery").list(
+                    packageName=package_name, versionCode=version_code
+                )
             )
 
             return [
@@ -5353,7 +6447,9 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.apprecovery().create(packageName=package_name, body=recovery)
+                self._resource(service, "apprecovery").create(
+                    packageName=package_name, body=recovery
+                )
             )
             return self._parse_app_recovery(package_name, data)
 
@@ -5384,7 +6480,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.apprecovery().deploy(
+                self._resource(service, "apprecovery").deploy(
                     packageName=package_name,
                     appRecoveryId=app_recovery_id,
                     body={},
@@ -5424,7 +6520,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.apprecovery().cancel(
+                self._resource(service, "apprecovery").cancel(
                     packageName=package_name,
                     appRecoveryId=app_recovery_id,
                     body={},
@@ -5467,7 +6563,7 @@ class PlayStoreClient:
 
         try:
             self._execute(
-                service.apprecovery().addTargeting(
+                self._resource(service, "apprecovery").addTargeting(
                     packageName=package_name,
                     appRecoveryId=app_recovery_id,
                     body=targeting,
@@ -5515,7 +6611,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.generatedapks().list(packageName=package_name, versionCode=version_code)
+                self._resource(service, "generatedapks").list(
+                    packageName=package_name, versionCode=version_code
+                )
             )
 
             downloads: list[GeneratedApksDownload] = []
@@ -5619,9 +6717,10 @@ class PlayStoreClient:
         succeeded = False
         try:
             with os.fdopen(tmp_fd, "wb") as fh:
-                downloader = MediaIoBaseDownload(fh, request)
+                downloader = _lazy("MediaIoBaseDownload")(fh, request)
                 done = False
                 while not done:
+                    self._request_rate.acquire()
                     with self._http_lock:
                         _status, done = downloader.next_chunk()
             Path(tmp_name).replace(safe_path)
@@ -5660,7 +6759,7 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            request = service.generatedapks().download(
+            request = self._resource(service, "generatedapks").download(
                 packageName=package_name,
                 versionCode=version_code,
                 downloadId=download_id,
@@ -5729,9 +6828,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.systemapks()
-                .variants()
-                .get(
+                self._resource(service, "systemapks", "variants").get(
                     packageName=package_name,
                     versionCode=version_code,
                     variantId=variant_id,
@@ -5766,9 +6863,9 @@ class PlayStoreClient:
 
         try:
             result = self._execute(
-                service.systemapks()
-                .variants()
-                .list(packageName=package_name, versionCode=version_code)
+                self._resource(service, "systemapks", "variants").list(
+                    packageName=package_name, versionCode=version_code
+                )
             )
 
             return [
@@ -5805,9 +6902,7 @@ class PlayStoreClient:
 
         try:
             data = self._execute(
-                service.systemapks()
-                .variants()
-                .create(
+                self._resource(service, "systemapks", "variants").create(
                     packageName=package_name,
                     versionCode=version_code,
                     body=variant,
@@ -5848,15 +6943,11 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            request = (
-                service.systemapks()
-                .variants()
-                .download(
-                    packageName=package_name,
-                    versionCode=version_code,
-                    variantId=variant_id,
-                    alt="media",
-                )
+            request = self._resource(service, "systemapks", "variants").download(
+                packageName=package_name,
+                versionCode=version_code,
+                variantId=variant_id,
+                alt="media",
             )
 
             self._download_to_file(request, destination_path)
@@ -5915,13 +7006,13 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            media = MediaFileUpload(
+            media = _lazy("MediaFileUpload")(
                 apk_path,
                 mimetype="application/vnd.android.package-archive",
                 resumable=True,
             )
             data = self._execute(
-                service.internalappsharingartifacts().uploadapk(
+                self._resource(service, "internalappsharingartifacts").uploadapk(
                     packageName=package_name, media_body=media
                 )
             )
@@ -5955,13 +7046,13 @@ class PlayStoreClient:
         service = self._get_service()
 
         try:
-            media = MediaFileUpload(
+            media = _lazy("MediaFileUpload")(
                 bundle_path,
                 mimetype="application/octet-stream",
                 resumable=True,
             )
             data = self._execute(
-                service.internalappsharingartifacts().uploadbundle(
+                self._resource(service, "internalappsharingartifacts").uploadbundle(
                     packageName=package_name, media_body=media
                 )
             )
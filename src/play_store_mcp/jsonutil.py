@@ -0,0 +1,23 @@
+"""JSON decoding shared by the client and the server."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:  # Optional: orjson parses JSON several times faster than the stdlib.
+    import orjson
+except ImportError:  # pragma: no cover - falls back to json
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["json_loads"]
+
+# Parse JSON text or bytes with orjson when installed, else the stdlib.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the
+# stdlib exception either way.
+json_loads: Callable[[str | bytes | bytearray | memoryview], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime  # noqa: TC003 - Pydantic needs this at runtime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Release(BaseModel):
@@ -141,6 +141,19 @@ class InAppProductActionResult(BaseModel):
     error: str | None = Field(None, description="Error details if failed")
 
 
+class ProductCatalog(BaseModel):
+    """An app's subscriptions, in-app products and voided purchases."""
+
+    package_name: str = Field(..., description="App package name")
+    subscriptions: list[SubscriptionProduct] = Field(
+        default_factory=list, description="Subscription products"
+    )
+    in_app_products: list[InAppProduct] = Field(default_factory=list, description="In-app products")
+    voided_purchases: list[VoidedPurchase] = Field(
+        default_factory=list, description="Voided purchases"
+    )
+
+
 class Listing(BaseModel):
     """Store listing for a specific language."""
 
@@ -316,6 +329,9 @@ class ProductPurchaseActionResult(BaseModel):
 class ValidationResult(BaseModel):
     """Validation result details."""
 
+    # Frozen because the client memoizes and shares validation results.
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="Field that failed validation")
     message: str = Field(..., description="Error message")
     value: Any | None = Field(None, description="Invalid value")
@@ -392,6 +408,18 @@ class OneTimeProduct(BaseModel):
     )
 
 
+class BatchGetResult(BaseModel):
+    """One resource fetched by a mixed batch lookup."""
+
+    kind: str = Field(..., description="Resource kind (in_app_product, subscription, ...)")
+    package_name: str = Field(..., description="App package name")
+    resource_id: str = Field(..., description="SKU, product ID or order ID requested")
+    result: InAppProduct | SubscriptionProduct | OneTimeProduct | Order | None = Field(
+        None, description="The fetched resource, if the lookup succeeded"
+    )
+    error: str | None = Field(None, description="Error details if the lookup failed")
+
+
 class OneTimeProductActionResult(BaseModel):
     """Result of a delete/batch-delete action on a one-time product catalog resource."""
 
@@ -6,12 +6,15 @@ import argparse
 import asyncio
 import base64
 import binascii
+import hashlib
 import ipaddress
 import json
 import logging
 import os
 import secrets
 import sys
+import threading
+import zlib
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
@@ -26,6 +29,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from play_store_mcp.client import PlayStoreClient, PlayStoreClientError
+from play_store_mcp.jsonutil import json_loads
 
 # Configure structured logging to stderr (stdout is reserved for MCP JSON-RPC)
 log_level = os.environ.get("PLAY_STORE_MCP_LOG_LEVEL", "INFO")
@@ -38,6 +42,9 @@ structlog.configure(
     ],
     wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
     logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+    # Module-level loggers are lazy proxies; cache the bound logger they build
+    # on first use instead of rebuilding it from this config on every call.
+    cache_logger_on_first_use=True,
 )
 logger = structlog.get_logger(__name__)
 
@@ -46,30 +53,19 @@ def get_client_from_context() -> PlayStoreClient:
     """Resolve a PlayStoreClient for the current request.
 
     Per-request credentials in the X-Google-Credentials /
-    X-Google-Credentials-Base64 headers take precedence; otherwise the shared
-    client from the lifespan is used.
+    X-Google-Credentials-Base64 headers take precedence, and the client built
+    for them is reused by later requests carrying the same header; otherwise
+    the shared client from the lifespan is used.
 
     Raises:
         PlayStoreClientError: if credentials are invalid or unavailable.
     """
     headers = get_http_headers() or {}
 
-    if "x-google-credentials" in headers:
-        try:
-            creds_json = json.loads(headers["x-google-credentials"])
-        except json.JSONDecodeError as e:
-            raise PlayStoreClientError(f"Invalid JSON in X-Google-Credentials header: {e}") from e
-        return PlayStoreClient(credentials_json=creds_json)
-
-    if "x-google-credentials-base64" in headers:
-        try:
-            creds_bytes = base64.b64decode(headers["x-google-credentials-base64"])
-            creds_json = json.loads(creds_bytes.decode("utf-8"))
-        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
-            raise PlayStoreClientError(
-                f"Invalid base64 or JSON in X-Google-Credentials-Base64 header: {e}"
-            ) from e
-        return PlayStoreClient(credentials_json=creds_json)
+    for header in ("x-google-credentials", "x-google-credentials-base64"):
+        value = headers.get(header)
+        if value is not None:
+            return _client_for_header(header, value)
 
     client: PlayStoreClient | None = _shared_state.get("client")
     if client is not None:
@@ -81,6 +77,57 @@ def get_client_from_context() -> PlayStoreClient:
     )
 
 
+# Clients built from per-request credential headers, keyed by a digest of the
+# header, so a session's repeat calls skip decoding the credentials and
+# rebuilding the API service. The oldest entry is evicted once
+# _HEADER_CLIENT_CACHE_SIZE distinct credentials are held.
+_HEADER_CLIENT_CACHE_SIZE = 64
+_header_clients: dict[str, PlayStoreClient] = {}
+_header_clients_lock = threading.Lock()
+
+
+def _parse_credentials_header(header: str, value: str) -> dict[str, Any]:
+    """Decode the service-account JSON carried in a credentials header."""
+    if header == "x-google-credentials":
+        try:
+            return json_loads(value)  # type: ignore[no-any-return]
+        except json.JSONDecodeError as e:
+            raise PlayStoreClientError(f"Invalid JSON in X-Google-Credentials header: {e}") from e
+    try:
+        # Both parsers take the decoded bytes as-is; invalid UTF-8 is a decode error.
+        return json_loads(base64.b64decode(value))  # type: ignore[no-any-return]
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise PlayStoreClientError(
+            f"Invalid base64 or JSON in X-Google-Credentials-Base64 header: {e}"
+        ) from e
+
+
+def _client_for_header(header: str, value: str) -> PlayStoreClient:
+    """Return the cached client for a credentials header, building it on first use.
+
+    A new client is only cached once its credentials have loaded, so a bad
+    header is rejected on every request rather than occupying a cache slot.
+    """
+    key = hashlib.sha256(f"{header}:{value}".encode()).hexdigest()
+    with _header_clients_lock:
+        client = _header_clients.get(key)
+    if client is not None:
+        return client
+
+    client = PlayStoreClient(credentials_json=_parse_credentials_header(header, value))
+    client._get_service()
+    evicted = None
+    with _header_clients_lock:
+        if key not in _header_clients and len(_header_clients) >= _HEADER_CLIENT_CACHE_SIZE:
+            evicted = _header_clients.pop(next(iter(_header_clients)))
+        # A concurrent call may have cached a client for the same header first.
+        client = _header_clients.setdefault(key, client)
+    if evicted is not None:
+        # close() may make API calls; keep them out of the lock.
+        evicted.close()
+    return client
+
+
 # Shared fallback client, used when a request carries no per-request
 # credential header. Populated by the lifespan on startup and swapped by the
 # /credentials route. Module-level so custom routes and get_client_from_context
@@ -93,7 +140,9 @@ async def lifespan(_server: FastMCP):  # type: ignore[no-untyped-def]
     """Initialize the shared PlayStoreClient on startup."""
     logger.info("Initializing Play Store MCP Server")
     try:
-        client = PlayStoreClient()
+        # The shared client lives for the whole process, so let read-only tools
+        # reuse edits; per-request header clients keep one edit per call.
+        client = PlayStoreClient(reuse_read_edits=True)
         # Validate credentials off the event loop — _get_service() does blocking
         # discovery/auth, matching the offload used by the /credentials route.
         _ = await asyncio.to_thread(client._get_service)
@@ -106,6 +155,9 @@ async def lifespan(_server: FastMCP):  # type: ignore[no-untyped-def]
     yield _shared_state
 
     logger.info("Shutting down Play Store MCP Server")
+    shared = _shared_state.get("client")
+    if shared is not None:
+        await asyncio.to_thread(shared.close)
 
 
 def _validate_deploy_file(file_path: str) -> str | None:
@@ -170,7 +222,7 @@ def _build_transforms() -> list[Any]:
     When CODE_MODE is enabled, wrap the tool surface in the experimental CodeMode
     transform (search/get_schema/execute meta-tools + sandboxed execution), which
     cuts per-request tool-list overhead. Default: no transforms — the classic
-    117-tool surface, unchanged.
+    119-tool surface, unchanged.
     """
     if not _code_mode_enabled():
         return []
@@ -590,6 +642,30 @@ def list_voided_purchases(
     return [v.model_dump() for v in voided]
 
 
+@mcp.tool()
+def get_full_catalog(
+    package_name: str,
+    max_voided_purchases: int = 100,
+) -> dict[str, Any]:
+    """Get an app's subscriptions, in-app products and voided purchases in one call.
+
+    Args:
+        package_name: App package name
+        max_voided_purchases: Maximum number of voided purchases (default: 100; 0 skips them)
+
+    Returns:
+        Subscription products, in-app products and voided purchases for the app
+    """
+    client = get_client_from_context()
+
+    catalog = client.get_catalog(
+        package_name=package_name,
+        max_voided_purchases=max_voided_purchases,
+    )
+
+    return catalog.model_dump()
+
+
 @mcp.tool()
 def get_product_purchase(
     package_name: str,
@@ -3482,6 +3558,24 @@ def batch_deploy(
     return result.model_dump()
 
 
+@mcp.tool()
+def batch_get(items: list[dict[str, str]]) -> list[dict[str, Any]]:
+    """Fetch several resources, across kinds and apps, in one batch request.
+
+    Args:
+        items: Resources to fetch, each {"kind": ..., "package_name": ..., "id": ...};
+            kind is in_app_product (id = SKU), subscription or one_time_product
+            (id = product ID), or order (id = order ID)
+
+    Returns:
+        One entry per item, in order, with the resource or the lookup's error
+    """
+    client = get_client_from_context()
+
+    results = client.batch_get(items)
+    return [result.model_dump() for result in results]
+
+
 # =============================================================================
 # Internal App Sharing Tools
 # =============================================================================
@@ -3604,6 +3698,29 @@ def _authorize_credentials_request(request: Request) -> JSONResponse | None:
     return None
 
 
+# Decompressed size cap for gzip-encoded /credentials bodies. A service account
+# key is a few KB; the cap stops a small compressed body inflating without bound.
+_MAX_CREDENTIALS_BODY_BYTES = 1024 * 1024
+
+
+def _gunzip_body(raw: bytes) -> bytes:
+    """Decompress a gzip request body, enforcing ``_MAX_CREDENTIALS_BODY_BYTES``.
+
+    Raises:
+        ValueError: if the body is not valid gzip or inflates past the cap.
+    """
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    try:
+        data = decompressor.decompress(raw, _MAX_CREDENTIALS_BODY_BYTES)
+    except zlib.error as e:
+        raise ValueError(f"Invalid gzip request body: {e}") from e
+    if not decompressor.eof:
+        if decompressor.unconsumed_tail or len(data) >= _MAX_CREDENTIALS_BODY_BYTES:
+            raise ValueError("Decompressed request body is too large")
+        raise ValueError("Invalid gzip request body: truncated stream")
+    return data
+
+
 @mcp.custom_route("/credentials", methods=["POST"])
 async def update_credentials(request: Request) -> JSONResponse:
     """Update Google Play Store credentials via HTTP POST.
@@ -3611,7 +3728,8 @@ async def update_credentials(request: Request) -> JSONResponse:
     Management endpoint - restricted to localhost only.
 
     This endpoint allows local clients to provide credentials when using
-    streamable-http transport. Accepts JSON credentials in the request body.
+    streamable-http transport. Accepts JSON credentials in the request body,
+    optionally sent with ``Content-Encoding: gzip``.
 
     Request body should be one of:
     - {"credentials": {...}} - Service account JSON object
@@ -3628,7 +3746,14 @@ async def update_credentials(request: Request) -> JSONResponse:
 
     new_client: PlayStoreClient | None = None
     try:
-        body = await request.json()
+        if request.headers.get("content-encoding", "").strip().lower() == "gzip":
+            try:
+                raw = _gunzip_body(await request.body())
+            except ValueError as e:
+                return JSONResponse({"success": False, "error": str(e)}, status_code=400)
+            body = json.loads(raw)
+        else:
+            body = await request.json()
 
         credentials = body.get("credentials")
         credentials_base64 = body.get("credentials_base64")
@@ -3648,7 +3773,9 @@ async def update_credentials(request: Request) -> JSONResponse:
             try:
                 decoded = base64.b64decode(credentials_base64).decode("utf-8")
                 credentials_dict = json.loads(decoded)
-                new_client = PlayStoreClient(credentials_json=credentials_dict)
+                new_client = PlayStoreClient(
+                    credentials_json=credentials_dict, reuse_read_edits=True
+                )
             except (binascii.Error, UnicodeDecodeError) as e:
                 return JSONResponse(
                     {"success": False, "error": f"Invalid base64 encoding: {e}"},
@@ -3669,9 +3796,9 @@ async def update_credentials(request: Request) -> JSONResponse:
                         {"success": False, "error": "Invalid JSON in credentials string"},
                         status_code=400,
                     )
-                new_client = PlayStoreClient(credentials_json=credentials)
+                new_client = PlayStoreClient(credentials_json=credentials, reuse_read_edits=True)
             elif isinstance(credentials, dict):
-                new_client = PlayStoreClient(credentials_json=credentials)
+                new_client = PlayStoreClient(credentials_json=credentials, reuse_read_edits=True)
             else:
                 return JSONResponse(
                     {"success": False, "error": "credentials must be a string or object"},
@@ -3698,8 +3825,11 @@ async def update_credentials(request: Request) -> JSONResponse:
             )
 
         # Update the client in the shared state
+        old_client = _shared_state.get("client")
         _shared_state["client"] = new_client
         _shared_state["credentials_updated"] = True
+        if old_client is not None:
+            await asyncio.to_thread(old_client.close)
 
         logger.info("Credentials updated successfully via HTTP endpoint")
 
@@ -34,15 +34,34 @@ def _no_backoff_sleep() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def _reset_retry_budget() -> None:
+    """Start each test with a full process-wide retry budget."""
+    from play_store_mcp.client import _RETRY_BUDGET
+
+    _RETRY_BUDGET.reset()
+
+
+@pytest.fixture(autouse=True)
+def _clear_credentials_cache() -> Generator[None, None, None]:
+    """Keep shared service-account credentials from leaking between tests."""
+    from play_store_mcp.client import _CREDENTIALS_CACHE
+
+    _CREDENTIALS_CACHE.clear()
+    yield
+    _CREDENTIALS_CACHE.clear()
+
+
 @pytest.fixture(autouse=True)
 def _reset_shared_state() -> Generator[None, None, None]:
-    """Restore the module-level shared state after each test to avoid order dependence."""
+    """Restore the module-level shared state (and header clients) after each test."""
     from play_store_mcp import server
 
     saved = dict(server._shared_state)
     yield
     server._shared_state.clear()
     server._shared_state.update(saved)
+    server._header_clients.clear()
 
 
 @pytest.fixture
@@ -55,11 +74,35 @@ def _mock_credentials() -> Generator[MagicMock, None, None]:
         yield mock
 
 
+class _SerialBatch:
+    """Stand-in for BatchHttpRequest that executes each added request in turn."""
+
+    def __init__(self, callback: Any) -> None:
+        self._callback = callback
+        self._requests: list[tuple[Any, str]] = []
+
+    def add(self, request: Any, request_id: str) -> None:
+        self._requests.append((request, request_id))
+
+    def execute(self, http: Any = None) -> None:  # noqa: ARG002 - matches BatchHttpRequest
+        from googleapiclient.errors import HttpError
+
+        for request, request_id in self._requests:
+            try:
+                response = request.execute()
+            except HttpError as e:
+                self._callback(request_id, None, e)
+            else:
+                self._callback(request_id, response, None)
+
+
 @pytest.fixture
 def _mock_service() -> Generator[MagicMock, None, None]:
     """Mock the Google API service."""
     with patch("play_store_mcp.client.build") as mock_build:
         mock_service = MagicMock()
+        # Batched sub-requests run through the same per-request execute mocks.
+        mock_service.new_batch_http_request.side_effect = lambda callback: _SerialBatch(callback)
         mock_build.return_value = mock_service
         yield mock_service
 
@@ -8,6 +8,7 @@ below). These bring branch coverage of the newly hardened code paths back to
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -125,26 +126,61 @@ class TestExecuteRetryThroughOperation:
 
 
 class TestExecuteThreadSafety:
-    """The client serializes its (non-thread-safe httplib2) transport via a per-client lock."""
+    """The client never shares one (non-thread-safe) httplib2 transport between threads."""
 
-    def test_execute_holds_lock_around_request(
+    def test_execute_uses_per_thread_transport(
         self,
         client: PlayStoreClient,
         _mock_service: MagicMock,
     ) -> None:
-        """_http_lock is held while request.execute() runs, and released afterwards."""
+        """Requests run on the calling thread's own transport, without _http_lock."""
         get_req = _mock_service.orders.return_value.get.return_value
         get_req.method = "GET"
-        observed: dict[str, bool] = {}
+        observed: dict[str, Any] = {}
 
-        def fake_execute() -> dict[str, Any]:
+        def fake_execute(http: Any = None) -> dict[str, Any]:
             observed["locked_during_call"] = client._http_lock.locked()
+            observed["http"] = http
             return {"orderId": "o1", "state": "PROCESSED", "lineItems": []}
 
         get_req.execute.side_effect = fake_execute
 
         client.get_order("com.example.app", "o1")
 
+        assert observed["locked_during_call"] is False
+        assert observed["http"] is client._thread_transport()
+        assert observed["http"] is not client._http
+        assert observed["http"].credentials is client._http.credentials
+
+    def test_threads_get_their_own_transport(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Each thread keeps one transport; different threads never share one."""
+        client._get_service()
+        main = client._thread_transport()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker = pool.submit(client._thread_transport).result()
+
+        assert client._thread_transport() is main
+        assert worker is not main
+
+    def test_execute_holds_lock_without_transport(self) -> None:
+        """An injected service without a transport is serialized by _http_lock."""
+        client = PlayStoreClient(credentials_json={"type": "service_account"})
+        client._service = MagicMock()
+        request = MagicMock(method="GET")
+        observed: dict[str, bool] = {}
+
+        def fake_execute() -> dict[str, Any]:
+            observed["locked_during_call"] = client._http_lock.locked()
+            return {}
+
+        request.execute.side_effect = fake_execute
+
+        client._execute(request)
+
         assert observed["locked_during_call"] is True
         assert client._http_lock.locked() is False
 
@@ -0,0 +1,350 @@
+"""Tests for batched (multipart batch HTTP) client operations."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from play_store_mcp.client import PlayStoreClient, PlayStoreClientError
+
+
+def _make_http_error(status: int = 404, reason: str = "boom") -> HttpError:
+    resp = MagicMock()
+    resp.status = status
+    resp.reason = reason
+    err = HttpError(resp, b"{}")
+    err.reason = reason
+    return err
+
+
+def _request(response: Any = None, error: Exception | None = None) -> MagicMock:
+    request = MagicMock()
+    request.method = "GET"
+    if error is not None:
+        request.execute.side_effect = error
+    else:
+        request.execute.return_value = response
+    return request
+
+
+@pytest.fixture
+def service(_mock_service: MagicMock) -> MagicMock:
+    """The mocked API service behind the ``client`` fixture; batches run serially."""
+    return _mock_service
+
+
+def test_execute_batch_splits_responses_and_errors(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    error = _make_http_error()
+
+    responses, errors = client._execute_batch(
+        {"a": _request({"id": 1}), "b": _request(error=error)}
+    )
+
+    assert responses == {"a": {"id": 1}}
+    assert errors == {"b": error}
+    service.new_batch_http_request.assert_called_once()
+
+
+def test_execute_batch_chunks_large_batches(client: PlayStoreClient, service: MagicMock) -> None:
+    from play_store_mcp.client import _BATCH_MAX_REQUESTS
+
+    responses, _ = client._execute_batch(
+        {str(i): _request(i) for i in range(_BATCH_MAX_REQUESTS + 1)}
+    )
+
+    assert len(responses) == _BATCH_MAX_REQUESTS + 1
+    assert service.new_batch_http_request.call_count == 2
+
+
+def _setup_releases(service: MagicMock, tracks: dict[str, Any]) -> MagicMock:
+    def _list(**kwargs: Any) -> MagicMock:
+        outcome = tracks[kwargs["packageName"]]
+        if isinstance(outcome, Exception):
+            return _request(error=outcome)
+        return _request(outcome)
+
+    edits = service.edits.return_value
+    edits.insert.side_effect = lambda **kwargs: _request({"id": f"edit-{kwargs['packageName']}"})
+    edits.tracks.return_value.list.side_effect = _list
+    edits.delete.side_effect = lambda **_kwargs: _request(None)
+    return edits
+
+
+def test_get_releases_many(
+    client: PlayStoreClient, service: MagicMock, sample_track_response: dict[str, Any]
+) -> None:
+    edits = _setup_releases(
+        service, {"com.example.a": sample_track_response, "com.example.b": {"tracks": []}}
+    )
+
+    result = client.get_releases_many(["com.example.a", "com.example.b"])
+
+    assert [t.track for t in result["com.example.a"]] == ["production", "beta"]
+    assert result["com.example.a"][1].releases[0].rollout_percentage == 50.0
+    assert result["com.example.b"] == []
+    # insert, list, delete: three batches regardless of the number of apps.
+    assert service.new_batch_http_request.call_count == 3
+    assert edits.delete.call_count == 2
+
+
+def test_get_releases_many_reports_failures_and_cleans_up(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    edits = _setup_releases(
+        service,
+        {"com.example.a": {"tracks": []}, "com.example.b": _make_http_error(reason="nope")},
+    )
+
+    with pytest.raises(PlayStoreClientError, match=r"com\.example\.b: nope"):
+        client.get_releases_many(["com.example.a", "com.example.b"])
+
+    assert edits.delete.call_count == 2
+
+
+def test_get_releases_many_deletes_created_edits_when_an_insert_batch_fails(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    from play_store_mcp.client import _BATCH_MAX_REQUESTS
+
+    edits = _setup_releases(service, {})
+    batches: list[Any] = []
+    serial_batch = service.new_batch_http_request.side_effect
+
+    def _new_batch(callback: Any) -> Any:
+        batch: Any = serial_batch(callback)
+        if len(batches) == 1:  # the second chunk of edit inserts fails as a whole
+            batch = MagicMock()
+            batch.execute.side_effect = _make_http_error(403, "forbidden")
+        batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = _new_batch
+    package_names = [f"com.example.app{i}" for i in range(_BATCH_MAX_REQUESTS + 1)]
+
+    with pytest.raises(PlayStoreClientError, match="Failed to fetch releases: forbidden"):
+        client.get_releases_many(package_names)
+
+    edits.tracks.return_value.list.assert_not_called()
+    assert edits.delete.call_count == _BATCH_MAX_REQUESTS
+
+
+def _setup_app_details(service: MagicMock, details: dict[str, Any]) -> MagicMock:
+    def _details(**kwargs: Any) -> MagicMock:
+        outcome = details[kwargs["packageName"]]
+        if isinstance(outcome, Exception):
+            return _request(error=outcome)
+        return _request(outcome)
+
+    def _listing(**kwargs: Any) -> MagicMock:
+        if kwargs["packageName"] == "com.example.b":
+            return _request(error=_make_http_error(reason="no listing"))
+        return _request({"title": f"Title {kwargs['packageName']}"})
+
+    edits = service.edits.return_value
+    edits.insert.side_effect = lambda **kwargs: _request({"id": f"edit-{kwargs['packageName']}"})
+    edits.details.return_value.get.side_effect = _details
+    edits.listings.return_value.get.side_effect = _listing
+    edits.delete.side_effect = lambda **_kwargs: _request(None)
+    return edits
+
+
+def test_get_app_details_many(client: PlayStoreClient, service: MagicMock) -> None:
+    edits = _setup_app_details(
+        service,
+        {
+            "com.example.a": {"defaultLanguage": "en-US"},
+            "com.example.b": {"contactEmail": "dev@example.com"},
+        },
+    )
+
+    result = client.get_app_details_many(["com.example.a", "com.example.b", "com.example.a"])
+
+    assert list(result) == ["com.example.a", "com.example.b"]
+    assert result["com.example.a"].title == "Title com.example.a"
+    assert result["com.example.a"].default_language == "en-US"
+    # A missing listing leaves the localized fields empty, as in get_app_details.
+    assert result["com.example.b"].title is None
+    assert result["com.example.b"].developer_email == "dev@example.com"
+    # insert, details + listings, delete: three batches regardless of the number of apps.
+    assert service.new_batch_http_request.call_count == 3
+    assert edits.delete.call_count == 2
+
+
+def test_get_app_details_many_reports_failures_and_cleans_up(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    edits = _setup_app_details(
+        service,
+        {"com.example.a": {}, "com.example.c": _make_http_error(reason="forbidden")},
+    )
+
+    with pytest.raises(PlayStoreClientError, match=r"com\.example\.c: forbidden"):
+        client.get_app_details_many(["com.example.a", "com.example.c"])
+
+    assert edits.delete.call_count == 2
+
+
+def test_get_app_details_many_deletes_edits_when_the_read_batch_fails(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    edits = _setup_app_details(service, {"com.example.a": {}, "com.example.c": {}})
+    batches: list[Any] = []
+    serial_batch = service.new_batch_http_request.side_effect
+
+    def _new_batch(callback: Any) -> Any:
+        batch: Any = serial_batch(callback)
+        if len(batches) == 1:  # the details + listings batch fails as a whole
+            batch = MagicMock()
+            batch.execute.side_effect = _make_http_error(403, "forbidden")
+        batches.append(batch)
+        return batch
+
+    service.new_batch_http_request.side_effect = _new_batch
+
+    with pytest.raises(PlayStoreClientError, match="Failed to fetch app details: forbidden"):
+        client.get_app_details_many(["com.example.a", "com.example.c"])
+
+    assert edits.delete.call_count == 2
+
+
+def _setup_catalog(service: MagicMock, voided: Any) -> None:
+    service.monetization.return_value.subscriptions.return_value.list.return_value = _request(
+        {"subscriptions": [{"productId": "premium"}]}
+    )
+    inappproducts = service.inappproducts.return_value
+    inappproducts.list.side_effect = lambda **kwargs: (
+        _request({"inappproduct": [{"sku": "coins_2"}]})
+        if kwargs.get("token")
+        else _request(
+            {"inappproduct": [{"sku": "coins_1"}], "tokenPagination": {"nextPageToken": "p2"}}
+        )
+    )
+    voidedpurchases = service.purchases.return_value.voidedpurchases.return_value
+    if isinstance(voided, Exception):
+        voidedpurchases.list.return_value = _request(error=voided)
+    else:
+        voidedpurchases.list.return_value = _request({"voidedPurchases": voided})
+
+
+def test_get_catalog_batches_first_pages(client: PlayStoreClient, service: MagicMock) -> None:
+    _setup_catalog(service, [{"purchaseToken": "tok1", "voidedTimeMillis": "1700000000000"}])
+
+    catalog = client.get_catalog("com.example.app")
+
+    assert [s.product_id for s in catalog.subscriptions] == ["premium"]
+    # Later pages are still followed after the batched first page.
+    assert [p.sku for p in catalog.in_app_products] == ["coins_1", "coins_2"]
+    assert catalog.voided_purchases[0].purchase_token == "tok1"
+    assert catalog.voided_purchases[0].voided_time is not None
+    assert service.new_batch_http_request.call_count == 1
+
+
+def test_get_catalog_reports_failed_list(client: PlayStoreClient, service: MagicMock) -> None:
+    _setup_catalog(service, _make_http_error(403, "forbidden"))
+
+    with pytest.raises(PlayStoreClientError, match="voided_purchases: forbidden"):
+        client.get_catalog("com.example.app")
+
+
+def test_get_catalog_without_voided_purchases_skips_the_request(
+    client: PlayStoreClient, service: MagicMock
+) -> None:
+    _setup_catalog(service, [{"purchaseToken": "tok1"}])
+
+    catalog = client.get_catalog("com.example.app", max_voided_purchases=0)
+
+    assert catalog.voided_purchases == []
+    assert [s.product_id for s in catalog.subscriptions] == ["premium"]
+    service.purchases.return_value.voidedpurchases.return_value.list.assert_not_called()
+
+
+def test_batch_get_mixes_kinds_and_apps(client: PlayStoreClient, service: MagicMock) -> None:
+    service.inappproducts.return_value.get.return_value = _request({"sku": "coins"})
+    service.monetization.return_value.subscriptions.return_value.get.return_value = _request(
+        {"productId": "premium"}
+    )
+    service.orders.return_value.get.return_value = _request(error=_make_http_error(reason="gone"))
+
+    results = client.batch_get(
+        [
+            {"kind": "in_app_product", "package_name": "com.example.a", "id": "coins"},
+            {"kind": "subscription", "package_name": "com.example.b", "id": "premium"},
+            {"kind": "order", "package_name": "com.example.a", "id": "GPA.1"},
+        ]
+    )
+
+    assert results[0].result == client._parse_in_app_product("com.example.a", {"sku": "coins"})
+    assert results[1].result == client._parse_subscription(
+        "com.example.b", {"productId": "premium"}
+    )
+    assert results[1].package_name == "com.example.b"
+    assert results[2].result is None
+    assert results[2].error == "gone"
+    assert service.new_batch_http_request.call_count == 1
+    service.orders.return_value.get.assert_called_once_with(
+        packageName="com.example.a", orderId="GPA.1"
+    )
+
+
+def test_batch_get_rejects_unknown_kind(client: PlayStoreClient, service: MagicMock) -> None:
+    with pytest.raises(PlayStoreClientError, match="Invalid batch_get item"):
+        client.batch_get([{"kind": "review", "package_name": "com.example.a", "id": "r1"}])
+
+    service.new_batch_http_request.assert_not_called()
+
+
+_BATCH_RESPONSE = b"""--batch_boundary
+Content-Type: application/http
+Content-Transfer-Encoding: binary
+Content-ID: <response-base + ok>
+
+HTTP/1.1 200 OK
+Content-Type: application/json
+
+{"sku": "coins", "status": "active"}
+--batch_boundary
+Content-Type: application/http
+Content-Transfer-Encoding: binary
+Content-ID: <response-base + missing>
+
+HTTP/1.1 404 Not Found
+Content-Type: application/json
+
+{"error": {"code": 404, "message": "Product not found"}}
+--batch_boundary--
+""".replace(b"\n", b"\r\n")  # HTTP framing inside the parts needs CRLF line ends
+
+
+def test_execute_batch_with_real_batch_http_request() -> None:
+    """Sub-responses of a real multipart batch reach the right request ids."""
+    from googleapiclient.discovery import build
+    from googleapiclient.http import HttpMockSequence
+
+    http = HttpMockSequence(
+        [
+            (
+                {"status": "200", "content-type": 'multipart/mixed; boundary="batch_boundary"'},
+                _BATCH_RESPONSE,
+            )
+        ]
+    )
+    api = build("androidpublisher", "v3", http=http, static_discovery=True)
+    client = PlayStoreClient(credentials_json={"type": "service_account"})
+    client._service = api
+
+    responses, errors = client._execute_batch(
+        {
+            "ok": api.inappproducts().get(packageName="com.example.app", sku="coins"),
+            "missing": api.inappproducts().get(packageName="com.example.app", sku="gone"),
+        }
+    )
+
+    assert responses == {"ok": {"sku": "coins", "status": "active"}}
+    assert isinstance(errors["missing"], HttpError)
+    assert errors["missing"].resp.status == 404
+    assert errors["missing"].reason == "Product not found"
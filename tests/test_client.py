@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from pydantic import ValidationError
 
 if TYPE_CHECKING:
     from unittest.mock import MagicMock
@@ -264,6 +265,57 @@ class TestReviews:
         assert reviews[0].comment == "Great app!"
         assert reviews[1].developer_reply == "Thanks for the feedback!"
 
+    def test_get_reviews_uses_latest_comments(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """When a review has several comments, the most recent of each kind is used."""
+        _mock_service.reviews.return_value.list.return_value.execute.return_value = {
+            "reviews": [
+                {
+                    "reviewId": "r1",
+                    "comments": [
+                        {"userComment": {"text": "old", "starRating": 1}},
+                        {"developerComment": {"text": "reply"}},
+                        {"userComment": {"text": "new", "starRating": 4}},
+                    ],
+                }
+            ]
+        }
+
+        [review] = client.get_reviews("com.example.app")
+
+        assert review.comment == "new"
+        assert review.star_rating == 4
+        assert review.developer_reply == "reply"
+
+    def test_iter_reviews_fetches_pages_on_demand(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """The next page is only requested once the current one is consumed."""
+        list_mock = _mock_service.reviews.return_value.list
+        list_mock.return_value.execute.side_effect = [
+            {
+                "reviews": [{"reviewId": "r1", "comments": [{"userComment": {"text": "a"}}]}],
+                "tokenPagination": {"nextPageToken": "tok"},
+            },
+            {"reviews": [{"reviewId": "r2", "comments": [{"userComment": {"text": "b"}}]}]},
+        ]
+
+        reviews = client.iter_reviews("com.example.app", page_size=1)
+
+        assert next(reviews).review_id == "r1"
+        assert list_mock.call_count == 1
+        assert [r.review_id for r in reviews] == ["r2"]
+        assert list_mock.call_args_list[1].kwargs == {
+            "packageName": "com.example.app",
+            "maxResults": 1,
+            "token": "tok",
+        }
+
     def test_reply_to_review_success(
         self,
         client: PlayStoreClient,
@@ -396,6 +448,28 @@ class TestInAppProducts:
         assert products[0].default_price is not None
         assert products[1].sku == "remove_ads"
 
+    def test_list_calls_request_partial_responses(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """List calls ask only for the fields the models read."""
+        inappproducts_list = _mock_service.inappproducts.return_value.list
+        inappproducts_list.return_value.execute.return_value = {}
+        subscriptions_list = _mock_service.monetization.return_value.subscriptions.return_value.list
+        subscriptions_list.return_value.execute.return_value = {}
+
+        client.list_in_app_products("com.example.app")
+        client.list_subscriptions("com.example.app")
+
+        assert inappproducts_list.call_args.kwargs["fields"] == (
+            "inappproduct(sku,purchaseType,status,defaultLanguage,listings,defaultPrice),"
+            "tokenPagination"
+        )
+        assert subscriptions_list.call_args.kwargs["fields"] == (
+            "subscriptions(productId,basePlans),nextPageToken"
+        )
+
     def test_get_in_app_product_success(
         self,
         client: PlayStoreClient,
@@ -478,6 +552,30 @@ class TestStoreListings:
         assert result.success is True
         assert result.language == "en-US"
 
+    def test_update_listing_without_changes_skips_commit(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """An update that matches the current listing neither updates nor commits."""
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.listings.return_value.get.return_value.execute.return_value = {
+            "title": "Title",
+            "fullDescription": "Description",
+            "shortDescription": "Short",
+        }
+
+        result = client.update_listing(
+            package_name="com.example.app", language="en-US", title="Title"
+        )
+
+        assert result.success is True
+        assert "already up to date" in result.message
+        mock_edits.listings.return_value.update.assert_not_called()
+        mock_edits.commit.assert_not_called()
+        mock_edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-123")
+
     def test_list_all_listings_success(
         self,
         client: PlayStoreClient,
@@ -510,6 +608,29 @@ class TestStoreListings:
         assert any(listing.language == "en-US" for listing in listings)
         assert any(listing.language == "es-ES" for listing in listings)
 
+    def test_list_all_listings_by_language(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Listings are keyed by language and share list_all_listings' cached fetch."""
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        list_request = mock_edits.listings.return_value.list.return_value
+        list_request.execute.return_value = {
+            "listings": [
+                {"language": "en-US", "title": "My App"},
+                {"language": "es-ES", "title": "Mi Aplicación"},
+            ]
+        }
+
+        client.list_all_listings("com.example.app")
+        by_language = client.list_all_listings_by_language("com.example.app")
+
+        assert set(by_language) == {"en-US", "es-ES"}
+        assert by_language["es-ES"].title == "Mi Aplicación"
+        assert list_request.execute.call_count == 1
+
 
 class TestTesters:
     """Test testers management methods."""
@@ -642,6 +763,33 @@ class TestValidation:
         errors = client.validate_package_name("Com.Example.MyApp")
         assert len(errors) > 0
 
+    def test_validate_package_name_error_classification(
+        self,
+        client: PlayStoreClient,
+    ) -> None:
+        """Test that a dotless name gets both messages and a dotted one only the format one."""
+        no_dot = client.validate_package_name("myapp")
+        bad_chars = client.validate_package_name("com.Example.app")
+
+        assert len(no_dot) == 2
+        assert "dot" in no_dot[0].message
+        assert "lowercase" in no_dot[1].message
+        assert len(bad_chars) == 1
+        assert "lowercase" in bad_chars[0].message
+
+    def test_validate_results_are_memoized_and_immutable(
+        self,
+        client: PlayStoreClient,
+    ) -> None:
+        """Test that repeat validations share frozen results but return fresh lists."""
+        first = client.validate_track("nightly")
+        second = client.validate_track("nightly")
+
+        assert first is not second
+        assert first[0] is second[0]
+        with pytest.raises(ValidationError):
+            first[0].message = "changed"
+
     def test_validate_track_valid(
         self,
         client: PlayStoreClient,
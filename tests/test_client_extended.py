@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httplib2
 import pytest
+from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaUpload
 
+from play_store_mcp import client as client_module
 from play_store_mcp.client import (
     MAX_RETRIES,
+    SCOPES,
     PlayStoreClient,
     PlayStoreClientError,
+    _run_with_backoff,
     retry_with_backoff,
 )
 
@@ -130,6 +139,117 @@ class TestRetryWithBackoff:
         # Should have slept MAX_RETRIES - 1 times then raised on the last attempt
         assert mock_sleep.call_count == MAX_RETRIES - 1
 
+    @patch("play_store_mcp.client.random.random", return_value=0.999)
+    @patch("play_store_mcp.client.time.sleep")
+    def test_full_jitter_stays_under_exponential_cap(
+        self, mock_sleep: MagicMock, _mock_random: MagicMock
+    ) -> None:
+        """Each sleep is a random fraction of INITIAL_BACKOFF * 2**attempt."""
+        from play_store_mcp.client import INITIAL_BACKOFF
+
+        @retry_with_backoff
+        def always_fails() -> str:
+            raise _make_http_error(503)
+
+        with pytest.raises(HttpError):
+            always_fails()
+
+        sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+        for attempt, sleep in enumerate(sleeps):
+            assert 0 <= sleep < INITIAL_BACKOFF * 2**attempt
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_retry_budget_exhausted_stops_retrying(self, mock_sleep: MagicMock) -> None:
+        """Once the shared retry budget is spent, transient errors raise immediately."""
+        from play_store_mcp.client import _RETRY_BUDGET
+
+        while _RETRY_BUDGET.try_acquire():
+            pass
+        call_count = 0
+
+        @retry_with_backoff
+        def throttled() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise _make_http_error(429)
+
+        with (
+            patch("play_store_mcp.client.time.monotonic", return_value=_RETRY_BUDGET._updated),
+            pytest.raises(HttpError),
+        ):
+            throttled()
+
+        assert call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_retry_window_elapsed_stops_retrying(self, mock_sleep: MagicMock) -> None:
+        """A call stops retrying once MAX_RETRY_WINDOW has elapsed."""
+        from play_store_mcp.client import MAX_RETRY_WINDOW
+
+        clock = iter([0.0, MAX_RETRY_WINDOW + 1])
+        call_count = 0
+
+        @retry_with_backoff
+        def unavailable() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise _make_http_error(503)
+
+        with (
+            patch("play_store_mcp.client.time.monotonic", side_effect=lambda: next(clock)),
+            patch("play_store_mcp.client._RETRY_BUDGET.try_acquire", return_value=True),
+            pytest.raises(HttpError),
+        ):
+            unavailable()
+
+        assert call_count == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("status", [502, 504])
+    @patch("play_store_mcp.client.time.sleep")
+    def test_retries_on_gateway_errors(self, _mock_sleep: MagicMock, status: int) -> None:
+        """Test that 502/504 gateway errors trigger retries for idempotent calls."""
+        call = MagicMock(side_effect=[_make_http_error(status), "ok"])
+
+        assert _run_with_backoff(call, retry_server_errors=True) == "ok"
+        assert call.call_count == 2
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_retry_after_header_is_a_lower_bound(self, mock_sleep: MagicMock) -> None:
+        """Test that a Retry-After header stretches the jittered sleep."""
+        resp = httplib2.Response({"status": 429, "retry-after": "7"})
+        call = MagicMock(side_effect=[HttpError(resp=resp, content=b""), "ok"])
+
+        with patch("play_store_mcp.client.random.random", return_value=0.1):
+            assert _run_with_backoff(call) == "ok"
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_retry_after_beyond_window_gives_up(self, mock_sleep: MagicMock) -> None:
+        """Test that a Retry-After longer than the retry window is not waited out."""
+        resp = httplib2.Response({"status": 429, "retry-after": "3600"})
+        call = MagicMock(side_effect=HttpError(resp=resp, content=b""))
+
+        with pytest.raises(HttpError):
+            _run_with_backoff(call)
+
+        assert call.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_connection_errors_retried_only_when_idempotent(self, _mock_sleep: MagicMock) -> None:
+        """Test that transport failures are retried for idempotent calls only."""
+        idempotent = MagicMock(side_effect=[ConnectionResetError(), TimeoutError(), "ok"])
+        assert _run_with_backoff(idempotent, retry_server_errors=True) == "ok"
+        assert idempotent.call_count == 3
+
+        non_idempotent = MagicMock(side_effect=ConnectionResetError())
+        with pytest.raises(ConnectionResetError):
+            _run_with_backoff(non_idempotent, retry_server_errors=False)
+        assert non_idempotent.call_count == 1
+
     def test_success_on_first_try(self) -> None:
         """Test that successful calls work without retries."""
 
@@ -140,6 +260,210 @@ class TestRetryWithBackoff:
         assert works() == "immediate"
 
 
+# =========================================================================
+# Request rate limiting
+# =========================================================================
+
+
+class TestRequestRate:
+    """Test the process-wide token bucket pacing outgoing requests."""
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_acquire_waits_once_burst_is_spent(self, mock_sleep: MagicMock) -> None:
+        """Requests within the burst go out at once; later ones wait for refill."""
+        with patch("play_store_mcp.client.time.monotonic", return_value=100.0):
+            bucket = client_module._TokenBucket(capacity=2, refill_per_sec=10)
+            bucket.acquire()
+            bucket.acquire()
+            mock_sleep.assert_not_called()
+
+            bucket.acquire()
+            bucket.acquire(2)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([0.1, 0.3])
+
+    def test_execute_and_batch_draw_from_request_rate(self) -> None:
+        """A single call takes one token; a batch takes one per sub-request."""
+        client = PlayStoreClient(credentials_json={"type": "service_account"})
+        client._service = MagicMock()
+        request = MagicMock(method="GET")
+
+        with patch.object(client._request_rate, "acquire") as acquire:
+            client._execute(request)
+            client._execute_batch({"a": request, "b": request, "c": request})
+
+        assert [c.args for c in acquire.call_args_list] == [(), (3,)]
+
+    @patch("play_store_mcp.client.time.sleep")
+    def test_clients_have_separate_request_rates(self, mock_sleep: MagicMock) -> None:
+        """One client spending its burst does not slow down another client."""
+        busy = PlayStoreClient(credentials_json={"type": "service_account"})
+        idle = PlayStoreClient(credentials_json={"type": "service_account"})
+        busy._service = MagicMock()
+        idle._service = MagicMock()
+        request = MagicMock(method="GET")
+
+        with patch("play_store_mcp.client.time.monotonic", return_value=100.0):
+            busy._request_rate.reset()
+            idle._request_rate.reset()
+            busy._execute_batch(
+                {str(i): request for i in range(int(client_module.REQUEST_RATE_BURST))}
+            )
+            idle._execute(request)
+            mock_sleep.assert_not_called()
+
+            busy._execute(request)
+
+        mock_sleep.assert_called_once()
+
+
+# =========================================================================
+# Cached edits resources
+# =========================================================================
+
+
+class TestEditsResourceCache:
+    """Test that API resources are built once per service instance."""
+
+    def test_resources_built_once(self) -> None:
+        """Repeated lookups reuse the same edits and sub-resource objects."""
+        client = PlayStoreClient(credentials_json={"type": "service_account"})
+        service = MagicMock()
+
+        tracks = client._edits(service, "tracks")
+        assert client._edits(service, "tracks") is tracks
+        assert client._edits(service) is service.edits.return_value
+        client._edits(service, "apks")
+
+        service.edits.assert_called_once_with()
+        service.edits.return_value.tracks.assert_called_once_with()
+
+    def test_replaced_service_rebuilds_resources(self) -> None:
+        """A new service instance gets its own edits resources."""
+        client = PlayStoreClient(credentials_json={"type": "service_account"})
+        old_service, new_service = MagicMock(), MagicMock()
+
+        client._edits(old_service, "tracks")
+        tracks = client._edits(new_service, "tracks")
+
+        assert tracks is new_service.edits.return_value.tracks.return_value
+        new_service.edits.assert_called_once_with()
+
+    def test_nested_resources_built_once(self) -> None:
+        """Non-edits resource chains share their cached parent resources."""
+        client = PlayStoreClient(credentials_json={"type": "service_account"})
+        service = MagicMock()
+
+        subscriptions = client._resource(service, "monetization", "subscriptions")
+        client._resource(service, "monetization", "onetimeproducts")
+
+        assert client._resource(service, "monetization", "subscriptions") is subscriptions
+        service.monetization.assert_called_once_with()
+        service.monetization.return_value.subscriptions.assert_called_once_with()
+
+
+# =========================================================================
+# Response decoding
+# =========================================================================
+
+
+class TestResponseModel:
+    """Test the JsonModel used to decode API responses."""
+
+    def test_decodes_bytes_and_str(self) -> None:
+        """JSON bodies decode the same as with the library's JsonModel."""
+        model = client_module._response_model()
+
+        assert model.deserialize(b'{"reviews": [{"reviewId": "r1"}]}') == {
+            "reviews": [{"reviewId": "r1"}]
+        }
+        assert model.deserialize('{"id": "edit-1"}') == {"id": "edit-1"}
+
+    def test_non_json_body_is_returned_as_is(self) -> None:
+        """Bodies that are not JSON fall back to JsonModel's handling."""
+        assert client_module._response_model().deserialize(b"not json") == "not json"
+
+    def test_client_builds_service_with_response_model(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """The client passes the model to build() when orjson is available."""
+        client._get_service()
+
+        expected = client_module._response_model() if client_module.orjson else None
+        assert client_module.build.call_args.kwargs["model"] is expected
+
+    def test_real_service_decodes_with_response_model(self) -> None:
+        """Requests built by the real discovery document decode through it."""
+        service = build(
+            "androidpublisher",
+            "v3",
+            http=httplib2.Http(),
+            model=client_module._response_model(),
+            static_discovery=True,
+        )
+
+        request = service.reviews().list(packageName="com.example.app")
+
+        assert request.postproc.__self__ is client_module._response_model()
+
+
+class TestTransportUserAgent:
+    """Test that API transports identify the application."""
+
+    @pytest.mark.parametrize("shared", [True, False])
+    def test_user_agent_includes_application_name(
+        self, _mock_service: MagicMock, _mock_credentials: MagicMock, tmp_path: Any, shared: bool
+    ) -> None:
+        """Both the shared and the per-thread transports send the application name."""
+        creds_file = tmp_path / "service-account.json"
+        creds_file.write_text('{"type": "service_account"}')
+        client = PlayStoreClient(credentials_path=str(creds_file), application_name="My Tool")
+        client._get_service()
+        http = client._http if shared else client._thread_transport()
+        assert http is not None
+        http.http.request = MagicMock(return_value=(httplib2.Response({"status": "200"}), b"{}"))
+
+        http.request("https://example.test/", "GET", headers={"user-agent": "(gzip)"})
+
+        sent = http.http.request.call_args.kwargs["headers"]
+        assert sent["user-agent"].startswith("My Tool ")
+
+
+# =========================================================================
+# Deferred Google client imports
+# =========================================================================
+
+
+class TestLazyImports:
+    """Test that heavy Google client modules load on first use."""
+
+    def test_importing_client_skips_discovery_and_auth(self) -> None:
+        """Test that importing the client module does not import discovery or auth."""
+        code = (
+            "import sys, play_store_mcp.client as c\n"
+            "c.PlayStoreClient().validate_package_name('com.example.app')\n"
+            "heavy = ('googleapiclient.discovery', 'googleapiclient.http',"
+            " 'google.oauth2.service_account', 'google_auth_httplib2')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run(  # noqa: S603 - fixed interpreter and inline script
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    def test_deferred_attribute_resolves_to_library_object(self) -> None:
+        """Test that deferred names resolve to the real library objects."""
+        assert client_module.build is build
+        assert client_module._lazy("MediaUpload") is MediaUpload
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = client_module.no_such_name
+
+
 # =========================================================================
 # _get_service error path
 # =========================================================================
@@ -174,6 +498,19 @@ class TestGetServiceErrors:
         svc2 = client._get_service()
         assert svc1 is svc2
 
+    def test_cached_service_skips_init(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Test that a cached service never re-enters the retrying init path."""
+        service = client._get_service()
+
+        with patch.object(client, "_init_service") as mock_init:
+            assert client._get_service() is service
+
+        mock_init.assert_not_called()
+
 
 # =========================================================================
 # deploy_app error paths
@@ -236,6 +573,72 @@ class TestDeployAppErrors:
         assert "disk full" in result.message
 
 
+class TestDeployAppUploads:
+    """Test how deploy_app chooses between simple and chunked uploads."""
+
+    def _setup_edits(self, service: MagicMock) -> MagicMock:
+        mock_edits = service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.tracks.return_value.update.return_value.execute.return_value = {}
+        mock_edits.commit.return_value.execute.return_value = {}
+        return mock_edits
+
+    def test_small_file_uses_simple_upload(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+        tmp_path: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that files under the threshold are sent in one request."""
+        apk_file = tmp_path / "app.apk"
+        apk_file.write_bytes(b"content")
+        mock_media = MagicMock()
+        monkeypatch.setattr(client_module, "MediaFileUpload", mock_media)
+        mock_edits = self._setup_edits(_mock_service)
+        mock_edits.apks.return_value.upload.return_value.execute.return_value = {"versionCode": 7}
+
+        result = client.deploy_app("com.example.app", "internal", str(apk_file))
+
+        assert result.success is True
+        assert result.version_code == 7
+        assert mock_media.call_args.kwargs["resumable"] is False
+        mock_edits.apks.return_value.upload.return_value.next_chunk.assert_not_called()
+
+    def test_large_file_uses_chunked_upload(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+        tmp_path: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that files over the threshold are uploaded chunk by chunk."""
+        aab_file = tmp_path / "app.aab"
+        aab_file.write_bytes(b"content")
+        mock_media = MagicMock()
+        monkeypatch.setattr(client_module, "MediaFileUpload", mock_media)
+        monkeypatch.setattr(client_module, "_RESUMABLE_UPLOAD_THRESHOLD", 1)
+        mock_edits = self._setup_edits(_mock_service)
+        upload_request = mock_edits.bundles.return_value.upload.return_value
+        upload_request.resumable = MagicMock(spec=MediaUpload)
+        upload_request.next_chunk.side_effect = [
+            (MagicMock(), None),
+            (MagicMock(), None),
+            (None, {"versionCode": 9}),
+        ]
+
+        result = client.deploy_app("com.example.app", "internal", str(aab_file))
+
+        assert result.success is True
+        assert result.version_code == 9
+        assert upload_request.next_chunk.call_count == 3
+        assert upload_request.next_chunk.call_args.kwargs["http"] is client._thread_transport()
+        upload_request.execute.assert_not_called()
+        kwargs = mock_media.call_args.kwargs
+        assert kwargs["resumable"] is True
+        assert kwargs["chunksize"] == client_module._UPLOAD_CHUNK_SIZE
+
+
 # =========================================================================
 # promote_release error paths
 # =========================================================================
@@ -528,6 +931,24 @@ class TestGetAppDetails:
         assert details.title is None  # No listing found
         assert details.default_language == "en-US"
 
+    def test_get_app_details_batches_details_and_listing(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Details and listing are fetched in one batch request."""
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.details.return_value.get.return_value.execute.return_value = {
+            "defaultLanguage": "en-US"
+        }
+        mock_edits.listings.return_value.get.return_value.execute.return_value = {"title": "App"}
+
+        details = client.get_app_details("com.example.app")
+
+        assert details.title == "App"
+        _mock_service.new_batch_http_request.assert_called_once()
+
 
 # =========================================================================
 # Reviews error paths
@@ -761,6 +1182,49 @@ class TestVoidedPurchases:
         with pytest.raises(PlayStoreClientError, match="Failed to list voided purchases"):
             client.list_voided_purchases("com.example.app")
 
+    def test_iter_voided_purchases_fetches_pages_on_demand(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """The next page is only requested once the current one is consumed."""
+        list_mock = _mock_service.purchases.return_value.voidedpurchases.return_value.list
+        list_mock.return_value.execute.side_effect = [
+            {
+                "voidedPurchases": [{"purchaseToken": "tok1"}],
+                "tokenPagination": {"nextPageToken": "page2"},
+            },
+            {"voidedPurchases": [{"purchaseToken": "tok2"}]},
+        ]
+
+        voided = client.iter_voided_purchases("com.example.app", page_size=1)
+
+        assert next(voided).purchase_token == "tok1"
+        assert list_mock.call_count == 1
+        assert [v.purchase_token for v in voided] == ["tok2"]
+        assert list_mock.call_args_list[1].kwargs == {
+            "packageName": "com.example.app",
+            "maxResults": 1,
+            "token": "page2",
+        }
+
+    def test_list_voided_purchases_stops_at_max_results(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """A full first page does not trigger a request for the next one."""
+        list_mock = _mock_service.purchases.return_value.voidedpurchases.return_value.list
+        list_mock.return_value.execute.return_value = {
+            "voidedPurchases": [{"purchaseToken": "tok1"}, {"purchaseToken": "tok2"}],
+            "tokenPagination": {"nextPageToken": "page2"},
+        }
+
+        voided = client.list_voided_purchases("com.example.app", max_results=2)
+
+        assert [v.purchase_token for v in voided] == ["tok1", "tok2"]
+        assert list_mock.call_count == 1
+
 
 # =========================================================================
 # Listing update error paths
@@ -838,7 +1302,7 @@ class TestUpdateListingErrors:
         # Need to reset side_effect after first call
         call_count = 0
 
-        def get_side_effect() -> dict[str, Any]:
+        def get_side_effect(**_kwargs: Any) -> dict[str, Any]:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -1056,29 +1520,24 @@ class TestBatchDeployExtended:
         _mock_service: MagicMock,
         tmp_path: Any,
     ) -> None:
-        """Test batch deploy where one track fails."""
+        """Test batch deploy where one track update fails and the rest still commit."""
         apk_file = tmp_path / "app.apk"
         apk_file.write_bytes(b"content")
 
         mock_edits = _mock_service.edits.return_value
         mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.apks.return_value.upload.return_value.execute.return_value = {"versionCode": 100}
 
-        call_count = 0
-
-        def upload_side_effect(**_kwargs: Any) -> MagicMock:
-            nonlocal call_count
-            call_count += 1
+        def update_side_effect(**kwargs: Any) -> MagicMock:
             mock = MagicMock()
-            if call_count > 1:
+            if kwargs["track"] == "beta":
                 mock.execute.side_effect = _make_http_error(403)
             else:
-                mock.execute.return_value = {"versionCode": 100}
+                mock.execute.return_value = {}
             return mock
 
-        mock_edits.apks.return_value.upload.side_effect = upload_side_effect
-        mock_edits.tracks.return_value.update.return_value.execute.return_value = {}
+        mock_edits.tracks.return_value.update.side_effect = update_side_effect
         mock_edits.commit.return_value.execute.return_value = {}
-        mock_edits.delete.return_value.execute.return_value = None
 
         result = client.batch_deploy(
             package_name="com.example.app",
@@ -1090,6 +1549,75 @@ class TestBatchDeployExtended:
         assert result.successful_count == 1
         assert result.failed_count == 1
         assert "failed" in result.message.lower()
+        assert [r.track for r in result.results] == ["internal", "beta"]
+        assert result.results[1].success is False
+        mock_edits.commit.assert_called_once()
+
+    def test_batch_deploy_uploads_once_in_one_edit(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+        tmp_path: Any,
+    ) -> None:
+        """Test that the artifact is uploaded and committed once for all tracks."""
+        aab_file = tmp_path / "app.aab"
+        aab_file.write_bytes(b"content")
+
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.bundles.return_value.upload.return_value.execute.return_value = {
+            "versionCode": 7
+        }
+        mock_edits.tracks.return_value.update.return_value.execute.return_value = {}
+        mock_edits.commit.return_value.execute.return_value = {}
+
+        result = client.batch_deploy(
+            package_name="com.example.app",
+            file_path=str(aab_file),
+            tracks=["internal", "alpha", "beta"],
+            rollout_percentages={"beta": 20.0},
+        )
+
+        assert result.success is True
+        assert all(r.version_code == 7 for r in result.results)
+        mock_edits.insert.assert_called_once()
+        mock_edits.bundles.return_value.upload.assert_called_once()
+        mock_edits.commit.assert_called_once()
+        mock_edits.delete.assert_not_called()
+        updates = mock_edits.tracks.return_value.update.call_args_list
+        assert [c.kwargs["track"] for c in updates] == ["internal", "alpha", "beta"]
+        beta_release = updates[2].kwargs["body"]["releases"][0]
+        assert beta_release["status"] == "inProgress"
+        assert beta_release["userFraction"] == 0.2
+        # All three track updates went out in a single batch request.
+        _mock_service.new_batch_http_request.assert_called_once()
+
+    def test_batch_deploy_all_updates_fail_discards_edit(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+        tmp_path: Any,
+    ) -> None:
+        """Test that the edit is deleted, not committed, when every track fails."""
+        apk_file = tmp_path / "app.apk"
+        apk_file.write_bytes(b"content")
+
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-123"}
+        mock_edits.apks.return_value.upload.return_value.execute.return_value = {"versionCode": 100}
+        mock_edits.tracks.return_value.update.return_value.execute.side_effect = _make_http_error(
+            403
+        )
+
+        result = client.batch_deploy(
+            package_name="com.example.app",
+            file_path=str(apk_file),
+            tracks=["internal", "beta"],
+        )
+
+        assert result.failed_count == 2
+        mock_edits.commit.assert_not_called()
+        mock_edits.delete.assert_called_once()
 
 
 # =========================================================================
@@ -1273,6 +1801,35 @@ class TestEditFailures:
         with pytest.raises(PlayStoreClientError, match="Failed to create edit"):
             client._create_edit("com.example.app")
 
+    def test_edit_txn_deletes_uncommitted_edit(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Test _edit_txn deletes the edit when the block exits without committing."""
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-1"}
+
+        with client._edit_txn("com.example.app") as txn:
+            assert txn.edit_id == "edit-1"
+
+        mock_edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-1")
+
+    def test_edit_txn_keeps_committed_edit(
+        self,
+        client: PlayStoreClient,
+        _mock_service: MagicMock,
+    ) -> None:
+        """Test _edit_txn leaves a committed edit alone, even if the block then raises."""
+        mock_edits = _mock_service.edits.return_value
+        mock_edits.insert.return_value.execute.return_value = {"id": "edit-1"}
+
+        with pytest.raises(RuntimeError), client._edit_txn("com.example.app") as txn:
+            txn.committed = True
+            raise RuntimeError("after commit")
+
+        mock_edits.delete.assert_not_called()
+
     def test_commit_edit_failure(
         self,
         client: PlayStoreClient,
@@ -1352,6 +1909,80 @@ class TestCredentialsJson:
 
         mock_info.assert_called_once()
 
+    def test_credentials_json_string_with_leading_whitespace(
+        self, _mock_service: MagicMock
+    ) -> None:
+        """Leading whitespace before '{' is still treated as inline JSON."""
+        client = PlayStoreClient(credentials_json='\n  {"type": "service_account"}')
+
+        with patch(
+            "play_store_mcp.client.service_account.Credentials.from_service_account_info"
+        ) as mock_info:
+            mock_info.return_value = MagicMock()
+            client._get_service()
+
+        mock_info.assert_called_once_with({"type": "service_account"}, scopes=SCOPES)
+
+    def test_credentials_json_string_parsed_once(self, _mock_service: MagicMock) -> None:
+        """Re-initializing the service reuses the parsed credentials dict."""
+        client = PlayStoreClient(credentials_json='{"type": "service_account"}')
+
+        with (
+            patch(
+                "play_store_mcp.client.service_account.Credentials.from_service_account_info"
+            ) as mock_info,
+            patch("play_store_mcp.client.json_loads", wraps=client_module.json_loads) as loads,
+        ):
+            mock_info.return_value = MagicMock()
+            client._get_service()
+            client._service = None
+            client._get_service()
+
+        loads.assert_called_once()
+        # The credentials themselves are shared too, so they are built once.
+        mock_info.assert_called_once()
+        assert client._parsed_creds_info == {"type": "service_account"}
+
+    def test_clients_share_credentials_for_same_key(self, _mock_service: MagicMock) -> None:
+        """Clients built from equal key material reuse one Credentials object."""
+        first = PlayStoreClient(credentials_json={"type": "service_account", "a": 1})
+        second = PlayStoreClient(credentials_json='{"a": 1, "type": "service_account"}')
+        other = PlayStoreClient(credentials_json={"type": "service_account", "a": 2})
+
+        with patch(
+            "play_store_mcp.client.service_account.Credentials.from_service_account_info",
+            side_effect=lambda *_args, **_kwargs: MagicMock(),
+        ) as mock_info:
+            first._get_service()
+            second._get_service()
+            other._get_service()
+
+        assert mock_info.call_count == 2
+        assert first._http is not None
+        assert second._http is not None
+        assert other._http is not None
+        assert first._http.credentials is second._http.credentials
+        assert first._http.credentials is not other._http.credentials
+
+    def test_rewritten_key_file_is_reloaded(self, _mock_service: MagicMock, tmp_path: Any) -> None:
+        """A key file with a new mtime produces fresh credentials."""
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text('{"type": "service_account"}')
+
+        with patch(
+            "play_store_mcp.client.service_account.Credentials.from_service_account_file"
+        ) as mock_file:
+            mock_file.return_value = MagicMock()
+            PlayStoreClient(credentials_path=str(creds_file))._get_service()
+            PlayStoreClient(credentials_path=str(creds_file))._get_service()
+            assert mock_file.call_count == 1
+
+            stat = creds_file.stat()
+            os.utime(creds_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            PlayStoreClient(credentials_path=str(creds_file))._get_service()
+
+        assert mock_file.call_count == 2
+
     def test_credentials_json_path(self, _mock_service: MagicMock, tmp_path: Any) -> None:
         """A filesystem path string uses from_service_account_file."""
         creds_file = tmp_path / "creds.json"
@@ -1373,6 +2004,21 @@ class TestCredentialsJson:
         with pytest.raises(PlayStoreClientError, match="No valid credentials found"):
             client._get_service()
 
+    def test_credentials_json_overlong_string_not_statted(
+        self, _mock_service: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A string too long to be a path is rejected without touching the filesystem."""
+        monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+        client = PlayStoreClient(credentials_json="x" * 5000)
+
+        with (
+            patch("play_store_mcp.client.Path.exists") as mock_exists,
+            pytest.raises(PlayStoreClientError, match="No valid credentials found"),
+        ):
+            client._get_service()
+
+        mock_exists.assert_not_called()
+
     def test_credentials_json_dict(self, _mock_service: MagicMock) -> None:
         """A dict uses from_service_account_info."""
         client = PlayStoreClient(credentials_json={"type": "service_account"})
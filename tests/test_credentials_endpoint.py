@@ -270,3 +270,60 @@ async def test_update_credentials_invalid_base64():
     data = json.loads(response.body)
     assert data["success"] is False
     assert "base64" in data["error"].lower()
+
+
+def _gzip_request(raw: bytes):
+    """Build a mock loopback request carrying a gzip-encoded body."""
+    from starlette.requests import Request
+
+    mock_request = MagicMock(spec=Request)
+    mock_request.client.host = "127.0.0.1"
+    mock_request.headers = {"content-encoding": "gzip"}
+    mock_request.body = AsyncMock(return_value=raw)
+    return mock_request
+
+
+@pytest.mark.asyncio
+async def test_update_credentials_gzip_body(mock_credentials):
+    """A gzip-encoded JSON body is decompressed before parsing."""
+    import gzip
+
+    from play_store_mcp import server
+    from play_store_mcp.server import update_credentials
+
+    with patch("play_store_mcp.client.PlayStoreClient._get_service") as mock_service:
+        mock_service.return_value = MagicMock()
+        raw = gzip.compress(json.dumps({"credentials": mock_credentials}).encode())
+
+        server._shared_state = {"client": None, "credentials_updated": False}
+
+        response = await update_credentials(_gzip_request(raw))
+
+        assert response.status_code == 200
+        assert json.loads(response.body)["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_update_credentials_gzip_invalid():
+    """A body that is not valid gzip is rejected with 400."""
+    from play_store_mcp.server import update_credentials
+
+    response = await update_credentials(_gzip_request(b"not gzip"))
+
+    assert response.status_code == 400
+    assert "gzip" in json.loads(response.body)["error"]
+
+
+@pytest.mark.asyncio
+async def test_update_credentials_gzip_too_large():
+    """A gzip body that inflates past the size cap is rejected with 400."""
+    import gzip
+
+    from play_store_mcp.server import _MAX_CREDENTIALS_BODY_BYTES, update_credentials
+
+    raw = gzip.compress(b" " * (_MAX_CREDENTIALS_BODY_BYTES + 1))
+
+    response = await update_credentials(_gzip_request(raw))
+
+    assert response.status_code == 400
+    assert "too large" in json.loads(response.body)["error"]
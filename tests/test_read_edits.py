@@ -0,0 +1,153 @@
+"""Tests for sharing one edit across read-only client calls."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from play_store_mcp import client as client_module
+from play_store_mcp.client import PlayStoreClient, PlayStoreClientError
+
+
+def _make_http_error(
+    status: int, reason: str = "boom", error_reason: str | None = None
+) -> HttpError:
+    resp = MagicMock()
+    resp.status = status
+    resp.reason = reason
+    content = b"{}"
+    if error_reason is not None:
+        error = {"code": status, "message": reason, "errors": [{"reason": error_reason}]}
+        content = json.dumps({"error": error}).encode()
+    err = HttpError(resp, content)
+    err.reason = reason
+    return err
+
+
+def _client(*, reuse: bool = True) -> tuple[PlayStoreClient, MagicMock]:
+    service = MagicMock()
+    client = PlayStoreClient(credentials_json={"type": "service_account"}, reuse_read_edits=reuse)
+    client._service = service
+    edits = service.edits.return_value
+    edits.insert.return_value.execute.side_effect = [{"id": f"edit-{i}"} for i in range(10)]
+    edits.listings.return_value.get.return_value.execute.return_value = {"title": "App"}
+    return client, edits
+
+
+def _listing_edit_ids(edits: MagicMock) -> list[str]:
+    return [c.kwargs["editId"] for c in edits.listings.return_value.get.call_args_list]
+
+
+def test_reads_share_one_edit() -> None:
+    client, edits = _client()
+
+    client.get_listing("com.example.app", "en-US")
+    client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 1
+    edits.delete.assert_not_called()
+    assert _listing_edit_ids(edits) == ["edit-0", "edit-0"]
+
+
+def test_reads_open_a_fresh_edit_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, edits = _client()
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    client.get_listing("com.example.app", "en-US")
+    now[0] += client_module._READ_EDIT_TTL
+    client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 2
+    edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-0")
+
+
+def test_release_and_artifact_reads_share_the_edit() -> None:
+    client, edits = _client()
+    edits.tracks.return_value.list.return_value.execute.return_value = {"tracks": []}
+    edits.apks.return_value.list.return_value.execute.return_value = {"apks": []}
+    edits.bundles.return_value.list.return_value.execute.return_value = {"bundles": []}
+
+    client.get_releases("com.example.app")
+    client.list_apks("com.example.app")
+    client.list_bundles("com.example.app")
+    client.get_listing("com.example.app", "en-US")
+
+    assert edits.insert.call_count == 1
+    edits.delete.assert_not_called()
+
+
+def test_failed_reused_edit_is_retried_on_a_fresh_one() -> None:
+    client, edits = _client()
+    get = edits.listings.return_value.get.return_value
+    client.get_listing("com.example.app", "en-US")
+    get.execute.side_effect = [
+        _make_http_error(400, "edit expired", "editExpired"),
+        {"title": "App"},
+    ]
+
+    listing = client.get_listing("com.example.app", "de-DE")
+
+    assert listing.title == "App"
+    assert _listing_edit_ids(edits) == ["edit-0", "edit-0", "edit-1"]
+    edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-0")
+
+
+def test_not_found_on_reused_edit_keeps_the_edit() -> None:
+    client, edits = _client()
+    get = edits.listings.return_value.get.return_value
+    client.get_listing("com.example.app", "en-US")
+    get.execute.side_effect = _make_http_error(404, "listing not found", "notFound")
+
+    with pytest.raises(PlayStoreClientError):
+        client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 1
+    edits.delete.assert_not_called()
+    assert client._read_edits["com.example.app"][0] == "edit-0"
+
+
+def test_error_without_reason_on_reused_edit_keeps_the_edit() -> None:
+    client, edits = _client()
+    get = edits.listings.return_value.get.return_value
+    client.get_listing("com.example.app", "en-US")
+    get.execute.side_effect = _make_http_error(404)
+
+    with pytest.raises(PlayStoreClientError):
+        client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 1
+    edits.delete.assert_not_called()
+
+
+def test_commit_discards_the_shared_edit() -> None:
+    client, edits = _client()
+
+    client.get_listing("com.example.app", "en-US")
+    client._commit_edit("com.example.app", "write-edit")
+    client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 2
+    edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-0")
+
+
+def test_close_deletes_shared_edits() -> None:
+    client, edits = _client()
+
+    client.get_listing("com.example.app", "en-US")
+    client.close()
+
+    edits.delete.assert_called_once_with(packageName="com.example.app", editId="edit-0")
+
+
+def test_default_client_opens_and_deletes_an_edit_per_read() -> None:
+    client, edits = _client(reuse=False)
+
+    client.get_listing("com.example.app", "en-US")
+    client.get_listing("com.example.app", "de-DE")
+
+    assert edits.insert.call_count == 2
+    assert edits.delete.call_count == 2
@@ -0,0 +1,230 @@
+"""Tests for the client's TTL cache of read-only getter results."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from play_store_mcp import client as client_module
+from play_store_mcp.client import PlayStoreClient, PlayStoreClientError
+
+
+def _make_http_error(status: int, reason: str = "boom") -> HttpError:
+    resp = MagicMock()
+    resp.status = status
+    resp.reason = reason
+    err = HttpError(resp, b"{}")
+    err.reason = reason
+    return err
+
+
+def _client() -> tuple[PlayStoreClient, MagicMock]:
+    service = MagicMock()
+    client = PlayStoreClient(credentials_json={"type": "service_account"})
+    client._service = service
+    get = service.inappproducts.return_value.get.return_value
+    get.method = "GET"
+    get.execute.return_value = {"sku": "sku1", "status": "active"}
+    return client, get
+
+
+def test_repeat_get_is_served_from_cache() -> None:
+    client, get = _client()
+
+    first = client.get_in_app_product("com.example.app", "sku1")
+    second = client.get_in_app_product("com.example.app", "sku1")
+
+    assert first is second
+    assert get.execute.call_count == 1
+
+
+def test_different_arguments_are_cached_separately() -> None:
+    client, get = _client()
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client.get_in_app_product("com.example.app", "sku2")
+
+    assert get.execute.call_count == 2
+
+
+def test_entry_expires_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, get = _client()
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    client.get_in_app_product("com.example.app", "sku1")
+    now[0] += client_module._CACHE_TTL_CATALOG
+    client.get_in_app_product("com.example.app", "sku1")
+
+    assert get.execute.call_count == 2
+
+
+def test_cached_list_is_copied() -> None:
+    client, _ = _client()
+    listing = client._service.inappproducts.return_value.list.return_value
+    listing.method = "GET"
+    listing.execute.return_value = {"inappproduct": [{"sku": "a"}, {"sku": "b"}]}
+
+    first = client.list_in_app_products("com.example.app")
+    first.clear()
+
+    assert len(client.list_in_app_products("com.example.app")) == 2
+    assert listing.execute.call_count == 1
+
+
+def test_write_outside_edit_clears_cache() -> None:
+    client, get = _client()
+    write = MagicMock(method="POST", uri="https://example.test/applications/com.example.app/x")
+    write.execute.return_value = {}
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client._execute(write)
+    client.get_in_app_product("com.example.app", "sku1")
+
+    assert get.execute.call_count == 2
+
+
+def test_write_clears_only_the_written_package() -> None:
+    client, get = _client()
+    write = MagicMock(method="POST", uri="https://example.test/applications/com.example.app/x")
+    write.execute.return_value = {}
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client.get_in_app_product("com.other.app", "sku1")
+    client._execute(write)
+    client.get_in_app_product("com.example.app", "sku1")
+    client.get_in_app_product("com.other.app", "sku1")
+
+    assert get.execute.call_count == 3
+
+
+def test_failed_write_keeps_cache() -> None:
+    client, get = _client()
+    write = MagicMock(method="POST", uri="https://example.test/applications/com.example.app/x")
+    write.execute.side_effect = _make_http_error(400, "bad request")
+
+    client.get_in_app_product("com.example.app", "sku1")
+    with pytest.raises(HttpError):
+        client._execute(write)
+    client.get_in_app_product("com.example.app", "sku1")
+
+    assert get.execute.call_count == 1
+
+
+def test_write_without_package_clears_whole_cache() -> None:
+    client, get = _client()
+    write = MagicMock(method="POST", uri="https://example.test/developers/123/users")
+    write.execute.return_value = {}
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client._execute(write)
+    client.get_in_app_product("com.example.app", "sku1")
+
+    assert get.execute.call_count == 2
+
+
+def test_edit_scoped_write_keeps_cache_until_commit() -> None:
+    client, get = _client()
+    edit_write = MagicMock(
+        method="PUT", uri="https://example.test/applications/com.example.app/edits/1/tracks/beta"
+    )
+    edit_write.execute.return_value = {}
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client._execute(edit_write)
+    client.get_in_app_product("com.example.app", "sku1")
+    assert get.execute.call_count == 1
+
+    client._commit_edit("com.example.app", "1")
+    client.get_in_app_product("com.example.app", "sku1")
+    assert get.execute.call_count == 2
+
+
+def test_invalidate_cache_for_one_package() -> None:
+    client, get = _client()
+
+    client.get_in_app_product("com.example.app", "sku1")
+    client.get_in_app_product("com.other.app", "sku1")
+    client.invalidate_cache("com.example.app")
+    client.get_in_app_product("com.example.app", "sku1")
+    client.get_in_app_product("com.other.app", "sku1")
+
+    assert get.execute.call_count == 3
+
+
+def test_transient_error_serves_stale_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, get = _client()
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    cached = client.get_in_app_product("com.example.app", "sku1")
+    now[0] += client_module._CACHE_TTL_CATALOG + 1
+    get.execute.side_effect = _make_http_error(429, "rate limited")
+
+    assert client.get_in_app_product("com.example.app", "sku1") is cached
+
+
+def test_permanent_error_is_raised_despite_stale_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, get = _client()
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    client.get_in_app_product("com.example.app", "sku1")
+    now[0] += client_module._CACHE_TTL_CATALOG + 1
+    get.execute.side_effect = _make_http_error(404, "not found")
+
+    with pytest.raises(PlayStoreClientError, match="not found"):
+        client.get_in_app_product("com.example.app", "sku1")
+
+
+def test_transient_error_without_cached_value_raises() -> None:
+    client, get = _client()
+    get.execute.side_effect = _make_http_error(503, "unavailable")
+
+    with pytest.raises(PlayStoreClientError, match="unavailable"):
+        client.get_in_app_product("com.example.app", "sku1")
+
+
+def test_expansion_file_is_cached_until_commit() -> None:
+    client, _ = _client()
+    edits = client._service.edits.return_value
+    edits.insert.return_value.execute.return_value = {"id": "edit-1"}
+    get = edits.expansionfiles.return_value.get.return_value
+    get.execute.return_value = {"fileSize": "1024"}
+
+    client.get_expansion_file("com.example.app", 100)
+    client.get_expansion_file("com.example.app", 100)
+    assert get.execute.call_count == 1
+
+    client._commit_edit("com.example.app", "edit-2")
+    client.get_expansion_file("com.example.app", 100)
+    assert get.execute.call_count == 2
+
+
+def test_stale_value_older_than_max_stale_is_not_served(monkeypatch: pytest.MonkeyPatch) -> None:
+    client, get = _client()
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    client.get_in_app_product("com.example.app", "sku1")
+    now[0] += client_module._CACHE_TTL_CATALOG * client_module._CACHE_MAX_STALE_FACTOR
+    get.execute.side_effect = _make_http_error(503, "unavailable")
+
+    with pytest.raises(PlayStoreClientError, match="unavailable"):
+        client.get_in_app_product("com.example.app", "sku1")
+
+
+def test_default_and_keyword_arguments_share_an_entry() -> None:
+    client, _ = _client()
+    edits = client._service.edits.return_value
+    edits.insert.return_value.execute.return_value = {"id": "edit-1"}
+    get = edits.listings.return_value.get.return_value
+    get.execute.return_value = {"language": "en-US", "title": "App"}
+
+    client.get_listing("com.example.app")
+    client.get_listing("com.example.app", "en-US")
+    client.get_listing("com.example.app", language="en-US")
+
+    assert get.execute.call_count == 1
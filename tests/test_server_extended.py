@@ -14,12 +14,14 @@ from play_store_mcp.client import PlayStoreClient, PlayStoreClientError
 from play_store_mcp.models import (
     AppDetails,
     BatchDeploymentResult,
+    BatchGetResult,
     DeploymentResult,
     ExpansionFile,
     InAppProduct,
     Listing,
     ListingUpdateResult,
     Order,
+    ProductCatalog,
     Release,
     Review,
     ReviewReplyResult,
@@ -32,10 +34,12 @@ from play_store_mcp.models import (
 )
 from play_store_mcp.server import (
     batch_deploy,
+    batch_get,
     deploy_app,
     deploy_app_multilang,
     get_app_details,
     get_expansion_file,
+    get_full_catalog,
     get_in_app_product,
     get_listing,
     get_order,
@@ -60,7 +64,7 @@ from play_store_mcp.server import (
 
 
 def test_server_uses_fastmcp_and_registers_all_tools() -> None:
-    """The server is built on the standalone fastmcp package with all 117 tools."""
+    """The server is built on the standalone fastmcp package with all 119 tools."""
     import asyncio
 
     import fastmcp
@@ -69,7 +73,7 @@ def test_server_uses_fastmcp_and_registers_all_tools() -> None:
 
     assert isinstance(server.mcp, fastmcp.FastMCP)
     tools = asyncio.run(server.mcp.list_tools())  # Sequence[Tool]
-    assert len(tools) == 117
+    assert len(tools) == 119
 
 
 @pytest.fixture
@@ -456,6 +460,24 @@ class TestSubscriptionTools:
         )
         assert len(result) == 1
 
+    def test_get_full_catalog(self, mock_client: MagicMock) -> None:
+        """Test get_full_catalog tool."""
+        mock_client.get_catalog.return_value = ProductCatalog(
+            package_name="com.example.app",
+            voided_purchases=[
+                VoidedPurchase(package_name="com.example.app", purchase_token="tok1")
+            ],
+        )
+
+        result = get_full_catalog("com.example.app")
+
+        mock_client.get_catalog.assert_called_once_with(
+            package_name="com.example.app",
+            max_voided_purchases=100,
+        )
+        assert result["subscriptions"] == []
+        assert result["voided_purchases"][0]["purchase_token"] == "tok1"
+
 
 # =========================================================================
 # In-App Products tools
@@ -714,6 +736,28 @@ class TestBatchDeployTool:
         assert result["successful_count"] == 2
 
 
+class TestBatchGetTool:
+    """Test batch_get server tool."""
+
+    def test_batch_get(self, mock_client: MagicMock) -> None:
+        """Test batch_get tool."""
+        items = [{"kind": "order", "package_name": "com.example.app", "id": "GPA.1"}]
+        mock_client.batch_get.return_value = [
+            BatchGetResult(
+                kind="order",
+                package_name="com.example.app",
+                resource_id="GPA.1",
+                error="not found",
+            )
+        ]
+
+        result = batch_get(items)
+
+        mock_client.batch_get.assert_called_once_with(items)
+        assert result[0]["error"] == "not found"
+        assert result[0]["result"] is None
+
+
 # =========================================================================
 # Server main entry point
 # =========================================================================
@@ -903,13 +947,14 @@ class TestGetClientFromContext:
             lambda: {"x-google-credentials": '{"type": "service_account"}'},
         )
         created = {}
+        client = MagicMock()
 
         def fake_client(credentials_json=None):
             created["creds"] = credentials_json
-            return "CLIENT"
+            return client
 
         monkeypatch.setattr(server, "PlayStoreClient", fake_client)
-        assert server.get_client_from_context() == "CLIENT"
+        assert server.get_client_from_context() is client
         assert created["creds"] == {"type": "service_account"}
 
     def test_invalid_json_header_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -929,13 +974,14 @@ class TestGetClientFromContext:
             server, "get_http_headers", lambda: {"x-google-credentials-base64": b64}
         )
         created = {}
+        client = MagicMock()
 
         def fake_client(credentials_json=None):
             created["creds"] = credentials_json
-            return "CLIENT"
+            return client
 
         monkeypatch.setattr(server, "PlayStoreClient", fake_client)
-        assert server.get_client_from_context() == "CLIENT"
+        assert server.get_client_from_context() is client
         assert created["creds"] == {"type": "service_account"}
 
     def test_invalid_base64_header_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -949,6 +995,64 @@ class TestGetClientFromContext:
         with pytest.raises(server.PlayStoreClientError, match="Invalid base64 or JSON"):
             server.get_client_from_context()
 
+    def test_non_utf8_base64_header_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from play_store_mcp import server
+
+        b64 = base64.b64encode(b"\xff\xfe{}").decode()
+        monkeypatch.setattr(
+            server, "get_http_headers", lambda: {"x-google-credentials-base64": b64}
+        )
+        with pytest.raises(server.PlayStoreClientError, match="Invalid base64 or JSON"):
+            server.get_client_from_context()
+
+    def test_header_client_is_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from play_store_mcp import server
+
+        headers = {"x-google-credentials": '{"type": "service_account"}'}
+        monkeypatch.setattr(server, "get_http_headers", lambda: headers)
+        built = []
+
+        def fake_client(credentials_json=None):
+            built.append(credentials_json)
+            return MagicMock()
+
+        monkeypatch.setattr(server, "PlayStoreClient", fake_client)
+        first = server.get_client_from_context()
+        assert server.get_client_from_context() is first
+
+        headers["x-google-credentials"] = '{"type": "service_account", "client_email": "b"}'
+        assert server.get_client_from_context() is not first
+        assert len(built) == 2
+
+    def test_header_client_cache_evicts_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from play_store_mcp import server
+
+        monkeypatch.setattr(server, "_HEADER_CLIENT_CACHE_SIZE", 2)
+        monkeypatch.setattr(server, "PlayStoreClient", lambda **_kwargs: MagicMock())
+        clients = [
+            server._client_for_header("x-google-credentials", f'{{"n": {n}}}') for n in range(3)
+        ]
+
+        assert len(server._header_clients) == 2
+        clients[0].close.assert_called_once_with()
+        clients[1].close.assert_not_called()
+        assert server._client_for_header("x-google-credentials", '{"n": 2}') is clients[2]
+        assert server._client_for_header("x-google-credentials", '{"n": 0}') is not clients[0]
+
+    def test_header_client_with_bad_credentials_is_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from play_store_mcp import server
+
+        client = MagicMock()
+        client._get_service.side_effect = server.PlayStoreClientError("bad key")
+        monkeypatch.setattr(server, "PlayStoreClient", lambda **_kwargs: client)
+
+        with pytest.raises(server.PlayStoreClientError, match="bad key"):
+            server._client_for_header("x-google-credentials", '{"type": "service_account"}')
+
+        assert server._header_clients == {}
+
     def test_falls_back_to_shared_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
         from play_store_mcp import server
 